@@ -13,34 +13,123 @@ Usage:
 import boto3
 import os
 import sys
+from functools import lru_cache
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed, FIRST_COMPLETED, wait
+from botocore.config import Config
 
 
-def cleanup_s3_bucket(s3_client, bucket_name):
+# Number of concurrent DeleteObjects workers used to empty a bucket
+DELETE_WORKERS = 16
+
+# Keys per DeleteObjects request (S3 allows up to 1000; smaller batches
+# spread load and avoid SlowDown throttling on hot prefixes)
+DELETE_BATCH_SIZE = int(os.getenv('S3_DELETE_BATCH_SIZE', '250'))
+
+# How many times keys reported in a DeleteObjects 'Errors' list are retried
+DELETE_MAX_RETRIES = 3
+
+# LocalStack connection settings
+LOCALSTACK_ENDPOINT = os.getenv('LOCALSTACK_ENDPOINT', 'http://localhost:4566')
+AWS_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+# Shared client config: a connection pool large enough for the delete
+# workers, TCP keep-alive so connections are reused, and adaptive retries
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Wait for deletes to finish so a following create doesn't race with them;
+# LocalStack is fast, so poll tightly rather than using the default delays
+WAITER_CONFIG = {'Delay': 0.25, 'MaxAttempts': 40}
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Return the shared boto3 session, created on first use"""
+    return boto3.Session(
+        aws_access_key_id='test',
+        aws_secret_access_key='test',
+        region_name=AWS_REGION
+    )
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name):
+    """Return a cached LocalStack client for the given service"""
+    return get_session().client(service_name, endpoint_url=LOCALSTACK_ENDPOINT, config=CLIENT_CONFIG)
+
+
+def iter_object_keys(pages):
+    """Stream object keys across listing pages"""
+    for page in pages:
+        for obj in page.get('Contents', ()):
+            yield obj['Key']
+
+
+def delete_batch(s3_client, bucket_name, keys):
+    """Delete a batch of keys, retrying only the keys that failed"""
+    deleted = 0
+    for _ in range(DELETE_MAX_RETRIES + 1):
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Quiet': True, 'Objects': [{'Key': key} for key in keys]}
+        )
+        failed = [error['Key'] for error in response.get('Errors', [])]
+        deleted += len(keys) - len(failed)
+        if not failed:
+            break
+        keys = failed
+    else:
+        print(f"   Warning: failed to delete {len(keys)} object(s)")
+    return deleted
+
+
+def list_existing_buckets(s3_client):
+    """Return the names of all buckets as a set"""
+    return frozenset(bucket['Name'] for bucket in s3_client.list_buckets()['Buckets'])
+
+
+def list_existing_tables(dynamodb_client):
+    """Return the names of all DynamoDB tables as a set"""
+    paginator = dynamodb_client.get_paginator('list_tables')
+    return frozenset(name for page in paginator.paginate() for name in page['TableNames'])
+
+
+def cleanup_s3_bucket(s3_client, bucket_name, existing_buckets):
     """Delete all objects and then delete the bucket"""
     try:
         # Check if bucket exists
-        try:
-            s3_client.head_bucket(Bucket=bucket_name)
-        except:
+        if bucket_name not in existing_buckets:
             print(f"ℹ️  S3 bucket '{bucket_name}' does not exist")
             return True
         
         # Delete all objects in the bucket
         print(f"🗑️  Emptying S3 bucket '{bucket_name}'...")
         try:
-            # List and delete all objects
+            # List pages on this thread while a pool of workers deletes them
             paginator = s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(Bucket=bucket_name)
             
             deleted_count = 0
-            for page in pages:
-                if 'Contents' in page:
-                    objects = [{'Key': obj['Key']} for obj in page['Contents']]
-                    s3_client.delete_objects(
-                        Bucket=bucket_name,
-                        Delete={'Objects': objects}
-                    )
-                    deleted_count += len(objects)
+            in_flight = deque()
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                keys = iter_object_keys(pages)
+                while batch := list(islice(keys, DELETE_BATCH_SIZE)):
+                    in_flight.append(executor.submit(delete_batch, s3_client, bucket_name, batch))
+                    
+                    # Cap the number of outstanding requests
+                    if len(in_flight) >= DELETE_WORKERS:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            in_flight.remove(future)
+                            deleted_count += future.result()
+                
+                for future in as_completed(in_flight):
+                    deleted_count += future.result()
             
             if deleted_count > 0:
                 print(f"   Deleted {deleted_count} object(s)")
@@ -50,6 +139,7 @@ def cleanup_s3_bucket(s3_client, bucket_name):
         # Delete the bucket
         print(f"🗑️  Deleting S3 bucket '{bucket_name}'...")
         s3_client.delete_bucket(Bucket=bucket_name)
+        s3_client.get_waiter('bucket_not_exists').wait(Bucket=bucket_name, WaiterConfig=WAITER_CONFIG)
         print(f"✅ S3 bucket '{bucket_name}' deleted")
         return True
         
@@ -58,19 +148,18 @@ def cleanup_s3_bucket(s3_client, bucket_name):
         return False
 
 
-def cleanup_dynamodb_table(dynamodb_client, table_name):
+def cleanup_dynamodb_table(dynamodb_client, table_name, existing_tables):
     """Delete DynamoDB table"""
     try:
         # Check if table exists
-        try:
-            dynamodb_client.describe_table(TableName=table_name)
-        except dynamodb_client.exceptions.ResourceNotFoundException:
+        if table_name not in existing_tables:
             print(f"ℹ️  DynamoDB table '{table_name}' does not exist")
             return True
         
         # Delete the table
         print(f"🗑️  Deleting DynamoDB table '{table_name}'...")
         dynamodb_client.delete_table(TableName=table_name)
+        dynamodb_client.get_waiter('table_not_exists').wait(TableName=table_name, WaiterConfig=WAITER_CONFIG)
         print(f"✅ DynamoDB table '{table_name}' deleted")
         return True
         
@@ -87,11 +176,9 @@ def main():
     # Configuration
     bucket_name = os.getenv('S3_BUCKET_NAME', 'image-storage-bucket')
     table_name = os.getenv('DYNAMODB_TABLE_NAME', 'images')
-    localstack_endpoint = os.getenv('LOCALSTACK_ENDPOINT', 'http://localhost:4566')
-    aws_region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
     
-    print(f"📍 LocalStack endpoint: {localstack_endpoint}")
-    print(f"🌍 AWS region: {aws_region}")
+    print(f"📍 LocalStack endpoint: {LOCALSTACK_ENDPOINT}")
+    print(f"🌍 AWS region: {AWS_REGION}")
     print()
     
     # Confirm deletion
@@ -103,27 +190,17 @@ def main():
     print()
     
     try:
-        # Create clients
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=localstack_endpoint,
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name=aws_region
-        )
+        s3_client = get_client('s3')
+        dynamodb_client = get_client('dynamodb')
         
-        dynamodb_client = boto3.client(
-            'dynamodb',
-            endpoint_url=localstack_endpoint,
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name=aws_region
-        )
+        # List what exists once instead of probing each resource
+        existing_buckets = list_existing_buckets(s3_client)
+        existing_tables = list_existing_tables(dynamodb_client)
         
         # Cleanup resources
-        s3_ok = cleanup_s3_bucket(s3_client, bucket_name)
+        s3_ok = cleanup_s3_bucket(s3_client, bucket_name, existing_buckets)
         print()
-        dynamodb_ok = cleanup_dynamodb_table(dynamodb_client, table_name)
+        dynamodb_ok = cleanup_dynamodb_table(dynamodb_client, table_name, existing_tables)
         
         # Final result
         print()
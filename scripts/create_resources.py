@@ -13,7 +13,43 @@ Usage:
 import boto3
 import os
 import sys
+from functools import lru_cache
 from datetime import datetime
+from botocore.config import Config
+
+
+# LocalStack connection settings
+LOCALSTACK_ENDPOINT = os.getenv('LOCALSTACK_ENDPOINT', 'http://localhost:4566')
+AWS_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+# Shared client config: TCP keep-alive so connections are reused, a larger
+# connection pool and adaptive retries
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# LocalStack creates resources almost immediately, so poll fast instead of sleeping
+WAITER_CONFIG = {'Delay': 0.2, 'MaxAttempts': 20}
+
+EXPECTED_GSIS = frozenset({'UserIndex', 'StatusIndex'})
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Return the shared boto3 session, created on first use"""
+    return boto3.Session(
+        aws_access_key_id='test',
+        aws_secret_access_key='test',
+        region_name=AWS_REGION
+    )
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name):
+    """Return a cached LocalStack client for the given service"""
+    return get_session().client(service_name, endpoint_url=LOCALSTACK_ENDPOINT, config=CLIENT_CONFIG)
 
 
 def create_s3_bucket(s3_client, bucket_name):
@@ -117,37 +153,33 @@ def verify_resources(s3_client, dynamodb_client, bucket_name, table_name):
 
     # Verify S3 bucket
     try:
-        buckets = s3_client.list_buckets()
-        bucket_names = [b['Name'] for b in buckets['Buckets']]
-        if bucket_name in bucket_names:
-            print(f"✅ S3 bucket '{bucket_name}' verified")
-        else:
-            print(f"❌ S3 bucket '{bucket_name}' not found")
-            return False
+        s3_client.get_waiter('bucket_exists').wait(
+            Bucket=bucket_name,
+            WaiterConfig=WAITER_CONFIG
+        )
+        print(f"✅ S3 bucket '{bucket_name}' verified")
     except Exception as e:
-        print(f"❌ Failed to verify S3 bucket: {e}")
+        print(f"❌ S3 bucket '{bucket_name}' not found: {e}")
         return False
 
     # Verify DynamoDB table
     try:
+        dynamodb_client.get_waiter('table_exists').wait(
+            TableName=table_name,
+            WaiterConfig=WAITER_CONFIG
+        )
         response = dynamodb_client.describe_table(TableName=table_name)
-        if response['Table']['TableStatus'] == 'ACTIVE':
-            print(f"✅ DynamoDB table '{table_name}' verified (status: ACTIVE)")
-
-            # Check GSIs
-            gsis = response['Table'].get('GlobalSecondaryIndexes', [])
-            gsi_names = [gsi['IndexName'] for gsi in gsis]
-            expected_gsis = ['UserIndex', 'StatusIndex']
-
-            for gsi_name in expected_gsis:
-                if gsi_name in gsi_names:
-                    print(f"✅ GSI '{gsi_name}' verified")
-                else:
-                    print(f"❌ GSI '{gsi_name}' not found")
-                    return False
-        else:
-            print(f"❌ DynamoDB table '{table_name}' not active (status: {response['Table']['TableStatus']})")
+        print(f"✅ DynamoDB table '{table_name}' verified (status: ACTIVE)")
+
+        # Check GSIs
+        gsi_names = {gsi['IndexName'] for gsi in response['Table'].get('GlobalSecondaryIndexes', [])}
+        missing_gsis = EXPECTED_GSIS - gsi_names
+        if missing_gsis:
+            for gsi_name in sorted(missing_gsis):
+                print(f"❌ GSI '{gsi_name}' not found")
             return False
+        for gsi_name in sorted(EXPECTED_GSIS):
+            print(f"✅ GSI '{gsi_name}' verified")
     except Exception as e:
         print(f"❌ Failed to verify DynamoDB table: {e}")
         return False
@@ -163,30 +195,12 @@ def main():
     bucket_name = 'image-storage-bucket'
     table_name = 'images'
 
-    # LocalStack endpoints
-    localstack_endpoint = os.getenv('LOCALSTACK_ENDPOINT', 'http://localhost:4566')
-    aws_region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-
-    print(f"📍 LocalStack endpoint: {localstack_endpoint}")
-    print(f"🌍 AWS region: {aws_region}")
+    print(f"📍 LocalStack endpoint: {LOCALSTACK_ENDPOINT}")
+    print(f"🌍 AWS region: {AWS_REGION}")
 
     try:
-        # Create clients
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f"{localstack_endpoint}",
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name=aws_region
-        )
-
-        dynamodb_client = boto3.client(
-            'dynamodb',
-            endpoint_url=f"{localstack_endpoint}",
-            aws_access_key_id='test',
-            aws_secret_access_key='test',
-            region_name=aws_region
-        )
+        s3_client = get_client('s3')
+        dynamodb_client = get_client('dynamodb')
 
         # Create resources
         print("\n📦 Creating S3 bucket...")
@@ -196,10 +210,6 @@ def main():
         dynamodb_success = create_dynamodb_table(dynamodb_client, table_name)
 
         if s3_success and dynamodb_success:
-            # Wait a moment for resources to be ready
-            import time
-            time.sleep(2)
-
             # Verify resources
             if verify_resources(s3_client, dynamodb_client, bucket_name, table_name):
                 print("\n🎉 All resources created and verified successfully!")
@@ -6,14 +6,25 @@ Deploy Lambda functions and API Gateway to LocalStack using SAM template.
 import os
 import sys
 import json
+import asyncio
+import base64
+import hashlib
+import io
 import zipfile
-import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# aioboto3 is optional: when available the Lambda functions are deployed on an
+# event loop, otherwise a thread pool is used
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
 # Configuration
 LOCALSTACK_ENDPOINT = os.environ.get('LOCALSTACK_ENDPOINT', 'http://localhost:4566')
 AWS_REGION = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
@@ -21,6 +32,28 @@ STACK_NAME = 'image-api-stack'
 S3_BUCKET_NAME = 'image-storage-bucket'
 DYNAMODB_TABLE_NAME = 'images'
 
+# Deployment artifacts are kept out of the user-image bucket
+ARTIFACTS_BUCKET_NAME = os.environ.get('ARTIFACTS_BUCKET_NAME', 'image-api-artifacts')
+LAMBDA_PACKAGE_KEY = 'lambda/lambda_package.zip'
+
+# API Gateway integration URI is prefix + function ARN + suffix
+LAMBDA_INVOCATION_URI_PREFIX = f'arn:aws:apigateway:{AWS_REGION}:lambda:path/2015-03-31/functions/'
+LAMBDA_INVOCATION_URI_SUFFIX = '/invocations'
+
+# Environment shared by every Lambda function (a plain dict: botocore's
+# parameter validation rejects read-only mapping types)
+LAMBDA_ENVIRONMENT = {
+    'Variables': {
+        'LOCALSTACK_ENDPOINT': 'http://host.docker.internal:4566',  # LocalStack from inside container
+        'AWS_DEFAULT_REGION': AWS_REGION,
+        'S3_BUCKET_NAME': S3_BUCKET_NAME,
+        'DYNAMODB_TABLE_NAME': DYNAMODB_TABLE_NAME,
+        'USE_LOCALSTACK': 'true',
+        'LOG_LEVEL': 'INFO',
+        'MAX_IMAGE_SIZE': '10485760'
+    }
+}
+
 # Initialize AWS clients
 session = boto3.Session(
     aws_access_key_id='test',
@@ -28,41 +61,53 @@ session = boto3.Session(
     region_name=AWS_REGION
 )
 
-lambda_client = session.client('lambda', endpoint_url=LOCALSTACK_ENDPOINT)
-apigateway_client = session.client('apigateway', endpoint_url=LOCALSTACK_ENDPOINT)
-s3_client = session.client('s3', endpoint_url=LOCALSTACK_ENDPOINT)
-iam_client = session.client('iam', endpoint_url=LOCALSTACK_ENDPOINT)
+# Shared client config: TCP keep-alive so connections are reused, a larger
+# connection pool and adaptive retries
+client_config = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+lambda_client = session.client('lambda', endpoint_url=LOCALSTACK_ENDPOINT, config=client_config)
+apigateway_client = session.client('apigateway', endpoint_url=LOCALSTACK_ENDPOINT, config=client_config)
+s3_client = session.client('s3', endpoint_url=LOCALSTACK_ENDPOINT, config=client_config)
+iam_client = session.client('iam', endpoint_url=LOCALSTACK_ENDPOINT, config=client_config)
+
+
+def iter_python_files(directory):
+    """Recursively yield .py DirEntry objects under a directory, skipping __pycache__."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != '__pycache__':
+                    yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry
 
 
 def create_deployment_package():
-    """Create a ZIP file with all Lambda code."""
+    """Create an in-memory ZIP archive with all Lambda code."""
     print("\n📦 Creating Lambda deployment package...")
     
     # Get project root
     project_root = Path(__file__).parent.parent
     
-    # Create temporary directory
-    temp_dir = tempfile.mkdtemp()
-    zip_path = os.path.join(temp_dir, 'lambda_package.zip')
-    
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        buffer = io.BytesIO()
+        # Fastest deflate level: small source files, size barely changes
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
             # Add src directory
             src_dir = project_root / 'src'
-            for root, dirs, files in os.walk(src_dir):
-                # Skip __pycache__ and .pyc files
-                dirs[:] = [d for d in dirs if d != '__pycache__']
-                for file in files:
-                    if file.endswith('.py'):
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, project_root)
-                        zipf.write(file_path, arcname)
-                        
-        print(f"✅ Deployment package created: {zip_path}")
-        return zip_path
+            for entry in iter_python_files(src_dir):
+                arcname = os.path.relpath(entry.path, project_root)
+                zipf.write(entry.path, arcname)
+        
+        zip_bytes = buffer.getvalue()
+        print(f"✅ Deployment package created ({len(zip_bytes)} bytes)")
+        return zip_bytes
     except Exception as e:
         print(f"❌ Error creating deployment package: {str(e)}")
-        shutil.rmtree(temp_dir)
         raise
 
 
@@ -91,19 +136,23 @@ def create_lambda_role():
         role_arn = response['Role']['Arn']
         print(f"✅ Role created: {role_arn}")
         
-        # Attach policies
-        policies = [
-            'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole',
-            'arn:aws:iam::aws:policy/AmazonS3FullAccess',
-            'arn:aws:iam::aws:policy/AmazonDynamoDBFullAccess'
-        ]
+        # Grant logging, S3 and DynamoDB access with one inline policy
+        execution_policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": ["logs:*", "s3:*", "dynamodb:*"],
+                    "Resource": "*"
+                }
+            ]
+        }
+        iam_client.put_role_policy(
+            RoleName=role_name,
+            PolicyName='image-api-inline',
+            PolicyDocument=json.dumps(execution_policy)
+        )
         
-        for policy_arn in policies:
-            try:
-                iam_client.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
-            except:
-                pass  # Policies might not exist in LocalStack
-                
         return role_arn
     except ClientError as e:
         if e.response['Error']['Code'] == 'EntityAlreadyExists':
@@ -113,193 +162,270 @@ def create_lambda_role():
         raise
 
 
-def create_lambda_function(name, handler, description, zip_path, role_arn):
-    """Create a Lambda function."""
-    print(f"\n🚀 Creating Lambda function: {name}")
+def upload_deployment_package(zip_bytes):
+    """Upload the deployment package to S3 once so all functions can share it."""
+    print("\n☁️  Uploading deployment package to S3...")
     
-    function_name = f'image-api-{name}'
+    try:
+        s3_client.create_bucket(Bucket=ARTIFACTS_BUCKET_NAME)
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('BucketAlreadyOwnedByYou', 'BucketAlreadyExists'):
+            raise
     
-    with open(zip_path, 'rb') as f:
-        zip_content = f.read()
+    s3_client.put_object(Bucket=ARTIFACTS_BUCKET_NAME, Key=LAMBDA_PACKAGE_KEY, Body=zip_bytes)
     
-    environment_vars = {
-        'LOCALSTACK_ENDPOINT': 'http://host.docker.internal:4566',  # LocalStack from inside container
-        'AWS_DEFAULT_REGION': AWS_REGION,
-        'S3_BUCKET_NAME': S3_BUCKET_NAME,
-        'DYNAMODB_TABLE_NAME': DYNAMODB_TABLE_NAME,
-        'USE_LOCALSTACK': 'true',
-        'LOG_LEVEL': 'INFO',
-        'MAX_IMAGE_SIZE': '10485760'
+    print(f"✅ Package uploaded: s3://{ARTIFACTS_BUCKET_NAME}/{LAMBDA_PACKAGE_KEY}")
+    return ARTIFACTS_BUCKET_NAME, LAMBDA_PACKAGE_KEY
+
+
+def lambda_function_config(name, handler, description, role_arn):
+    """Build the configuration shared by create/update calls for a Lambda function."""
+    return {
+        'FunctionName': f'image-api-{name}',
+        'Runtime': 'python3.9',
+        'Role': role_arn,
+        'Handler': handler,
+        'Description': description,
+        'Timeout': 30,
+        'MemorySize': 512,
+        'Environment': LAMBDA_ENVIRONMENT
     }
+
+
+def package_code_sha256(zip_bytes):
+    """Compute the CodeSha256 Lambda reports for a deployment package."""
+    return base64.b64encode(hashlib.sha256(zip_bytes).digest()).decode('ascii')
+
+
+def is_function_current(current_config, function_config, code_sha256):
+    """Check whether a deployed function already has this code and environment."""
+    return (
+        current_config.get('CodeSha256') == code_sha256
+        and current_config.get('Environment', {}).get('Variables') == function_config['Environment']['Variables']
+    )
+
+
+def create_lambda_function(name, handler, description, s3_bucket, s3_key, role_arn, code_sha256):
+    """Create a Lambda function from the package stored in S3."""
+    print(f"\n🚀 Creating Lambda function: {name}")
+    
+    function_config = lambda_function_config(name, handler, description, role_arn)
     
     try:
         response = lambda_client.create_function(
-            FunctionName=function_name,
-            Runtime='python3.9',
-            Role=role_arn,
-            Handler=handler,
-            Code={'ZipFile': zip_content},
-            Description=description,
-            Timeout=30,
-            MemorySize=512,
-            Environment={'Variables': environment_vars}
+            Code={'S3Bucket': s3_bucket, 'S3Key': s3_key},
+            **function_config
         )
         print(f"✅ Lambda function created: {response['FunctionArn']}")
         return response['FunctionArn']
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceConflictException':
-            print(f"⚠️  Function already exists, updating code...")
+            current_config = lambda_client.get_function_configuration(
+                FunctionName=function_config['FunctionName']
+            )
+            if is_function_current(current_config, function_config, code_sha256):
+                print(f"✅ Lambda function unchanged: {current_config['FunctionArn']}")
+                return current_config['FunctionArn']
+            
+            print("⚠️  Function already exists, updating code...")
             response = lambda_client.update_function_code(
-                FunctionName=function_name,
-                ZipFile=zip_content
+                FunctionName=function_config['FunctionName'],
+                S3Bucket=s3_bucket,
+                S3Key=s3_key
             )
-            lambda_client.update_function_configuration(
-                FunctionName=function_name,
-                Runtime='python3.9',
-                Role=role_arn,
-                Handler=handler,
-                Description=description,
-                Timeout=30,
-                MemorySize=512,
-                Environment={'Variables': environment_vars}
+            lambda_client.update_function_configuration(**function_config)
+            print(f"✅ Lambda function updated: {response['FunctionArn']}")
+            return response['FunctionArn']
+        raise
+
+
+async def create_lambda_function_async(client, name, handler, description, s3_bucket, s3_key, role_arn, code_sha256):
+    """Async counterpart of create_lambda_function using a shared aioboto3 client."""
+    print(f"\n🚀 Creating Lambda function: {name}")
+    
+    function_config = lambda_function_config(name, handler, description, role_arn)
+    
+    try:
+        response = await client.create_function(
+            Code={'S3Bucket': s3_bucket, 'S3Key': s3_key},
+            **function_config
+        )
+        print(f"✅ Lambda function created: {response['FunctionArn']}")
+        return response['FunctionArn']
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceConflictException':
+            current_config = await client.get_function_configuration(
+                FunctionName=function_config['FunctionName']
             )
+            if is_function_current(current_config, function_config, code_sha256):
+                print(f"✅ Lambda function unchanged: {current_config['FunctionArn']}")
+                return current_config['FunctionArn']
+            
+            print("⚠️  Function already exists, updating code...")
+            response = await client.update_function_code(
+                FunctionName=function_config['FunctionName'],
+                S3Bucket=s3_bucket,
+                S3Key=s3_key
+            )
+            await client.update_function_configuration(**function_config)
             print(f"✅ Lambda function updated: {response['FunctionArn']}")
             return response['FunctionArn']
         raise
 
 
+async def deploy_lambda_functions_async(functions, s3_bucket, s3_key, role_arn, code_sha256):
+    """Create all Lambda functions concurrently on one aioboto3 client."""
+    async_session = aioboto3.Session(
+        aws_access_key_id='test',
+        aws_secret_access_key='test',
+        region_name=AWS_REGION
+    )
+    async with async_session.client('lambda', endpoint_url=LOCALSTACK_ENDPOINT, config=client_config) as client:
+        arns = await asyncio.gather(*[
+            create_lambda_function_async(
+                client, name, config['handler'], config['description'],
+                s3_bucket, s3_key, role_arn, code_sha256
+            )
+            for name, config in functions.items()
+        ])
+    return dict(zip(functions, arns))
+
+
+def deploy_lambda_functions(functions, s3_bucket, s3_key, role_arn, code_sha256):
+    """Create all Lambda functions concurrently."""
+    if aioboto3 is not None:
+        return asyncio.run(
+            deploy_lambda_functions_async(functions, s3_bucket, s3_key, role_arn, code_sha256)
+        )
+    
+    # Fall back to a thread pool (the boto3 client is thread-safe)
+    lambda_arns = {}
+    with ThreadPoolExecutor(max_workers=len(functions)) as executor:
+        futures = {
+            executor.submit(
+                create_lambda_function,
+                name, config['handler'], config['description'],
+                s3_bucket, s3_key, role_arn, code_sha256
+            ): name
+            for name, config in functions.items()
+        }
+        for future in as_completed(futures):
+            lambda_arns[futures[future]] = future.result()
+    return lambda_arns
+
+
+def build_openapi_spec(lambda_functions):
+    """Build an OpenAPI 3 definition of the API with Lambda proxy integrations and CORS."""
+    header_parameters = [
+        {'name': header, 'in': 'header', 'required': False, 'schema': {'type': 'string'}}
+        for header in ('user-id', 'User-Id')
+    ]
+    
+    def lambda_method(function_name):
+        uri = LAMBDA_INVOCATION_URI_PREFIX + lambda_functions[function_name] + LAMBDA_INVOCATION_URI_SUFFIX
+        return {
+            'parameters': header_parameters,
+            'responses': {},
+            'x-amazon-apigateway-integration': {
+                'type': 'aws_proxy',
+                'httpMethod': 'POST',
+                'uri': uri
+            }
+        }
+    
+    cors_method = {
+        'responses': {
+            '200': {
+                'description': 'CORS preflight',
+                'headers': {
+                    'Access-Control-Allow-Headers': {'schema': {'type': 'string'}},
+                    'Access-Control-Allow-Methods': {'schema': {'type': 'string'}},
+                    'Access-Control-Allow-Origin': {'schema': {'type': 'string'}}
+                }
+            }
+        },
+        'x-amazon-apigateway-integration': {
+            'type': 'mock',
+            'requestTemplates': {'application/json': '{"statusCode": 200}'},
+            'responses': {
+                'default': {
+                    'statusCode': '200',
+                    'responseParameters': {
+                        'method.response.header.Access-Control-Allow-Headers': "'Content-Type,Authorization,user-id,User-Id'",
+                        'method.response.header.Access-Control-Allow-Methods': "'GET,POST,DELETE,OPTIONS'",
+                        'method.response.header.Access-Control-Allow-Origin': "'*'"
+                    }
+                }
+            }
+        }
+    }
+    
+    return {
+        'openapi': '3.0.1',
+        'info': {
+            'title': 'image-api',
+            'description': 'Instagram-like Image Service API',
+            'version': '1.0'
+        },
+        'paths': {
+            '/images': {
+                'post': lambda_method('upload'),
+                'get': lambda_method('list'),
+                'options': cors_method
+            },
+            '/images/{image_id}': {
+                'get': lambda_method('get'),
+                'delete': lambda_method('delete'),
+                'patch': lambda_method('update_status'),
+                'options': cors_method
+            },
+            '/images/{image_id}/download': {
+                'get': lambda_method('download'),
+                'options': cors_method
+            }
+        }
+    }
+
+
 def create_api_gateway(lambda_functions):
     """Create API Gateway with Lambda integrations."""
     print("\n🌐 Creating API Gateway...")
     
     api_name = 'image-api'
     
-    # Check if API exists
+    # Reuse an existing API: the OpenAPI import below overwrites its definition
+    api_id = None
     try:
         apis = apigateway_client.get_rest_apis()
+        apis_by_name = {}
         for api in apis.get('items', []):
-            if api['name'] == api_name:
-                print(f"⚠️  API already exists, deleting old version...")
-                apigateway_client.delete_rest_api(restApiId=api['id'])
+            apis_by_name.setdefault(api['name'], []).append(api['id'])
+        existing_api_ids = apis_by_name.get(api_name, [])
+        if existing_api_ids:
+            api_id = existing_api_ids[0]
+            print("⚠️  API already exists, overwriting definition...")
     except:
         pass
     
-    # Create API
-    api_response = apigateway_client.create_rest_api(
-        name=api_name,
-        description='Instagram-like Image Service API',
-        endpointConfiguration={'types': ['REGIONAL']}
-    )
-    api_id = api_response['id']
-    print(f"✅ API Gateway created: {api_id}")
-    
-    # Get root resource
-    resources = apigateway_client.get_resources(restApiId=api_id)
-    root_id = resources['items'][0]['id']
-    
-    # Create /images resource
-    images_resource = apigateway_client.create_resource(
-        restApiId=api_id,
-        parentId=root_id,
-        pathPart='images'
-    )
-    images_resource_id = images_resource['id']
-    
-    # Create /{image_id} resource
-    image_id_resource = apigateway_client.create_resource(
-        restApiId=api_id,
-        parentId=images_resource_id,
-        pathPart='{image_id}'
-    )
-    image_id_resource_id = image_id_resource['id']
+    if api_id is None:
+        # Create API
+        api_response = apigateway_client.create_rest_api(
+            name=api_name,
+            description='Instagram-like Image Service API',
+            endpointConfiguration={'types': ['REGIONAL']}
+        )
+        api_id = api_response['id']
+        print(f"✅ API Gateway created: {api_id}")
     
-    # Create /{image_id}/download resource
-    download_resource = apigateway_client.create_resource(
+    # Define all resources, methods, integrations and CORS in a single import
+    spec = build_openapi_spec(lambda_functions)
+    apigateway_client.put_rest_api(
         restApiId=api_id,
-        parentId=image_id_resource_id,
-        pathPart='download'
+        mode='overwrite',
+        failOnWarnings=False,
+        body=json.dumps(spec).encode('utf-8')
     )
-    download_resource_id = download_resource['id']
-    
-    # Configure methods and integrations
-    endpoints = [
-        ('POST', images_resource_id, lambda_functions['upload'], '/images'),
-        ('GET', images_resource_id, lambda_functions['list'], '/images'),
-        ('GET', image_id_resource_id, lambda_functions['get'], '/images/{image_id}'),
-        ('GET', download_resource_id, lambda_functions['download'], '/images/{image_id}/download'),
-        ('DELETE', image_id_resource_id, lambda_functions['delete'], '/images/{image_id}'),
-        ('PATCH', image_id_resource_id, lambda_functions['update_status'], '/images/{image_id}'),
-    ]
-    
-    for method, resource_id, lambda_arn, path in endpoints:
-        # Create method
-        apigateway_client.put_method(
-            restApiId=api_id,
-            resourceId=resource_id,
-            httpMethod=method,
-            authorizationType='NONE',
-            requestParameters={
-                'method.request.header.user-id': False,
-                'method.request.header.User-Id': False
-            }
-        )
-        
-        # Create integration
-        uri = f'arn:aws:apigateway:{AWS_REGION}:lambda:path/2015-03-31/functions/{lambda_arn}/invocations'
-        apigateway_client.put_integration(
-            restApiId=api_id,
-            resourceId=resource_id,
-            httpMethod=method,
-            type='AWS_PROXY',
-            integrationHttpMethod='POST',
-            uri=uri
-        )
-        
-        print(f"✅ Configured {method} {path}")
-    
-    # Enable CORS for all resources
-    for resource_id in [images_resource_id, image_id_resource_id, download_resource_id]:
-        try:
-            apigateway_client.put_method(
-                restApiId=api_id,
-                resourceId=resource_id,
-                httpMethod='OPTIONS',
-                authorizationType='NONE'
-            )
-            
-            apigateway_client.put_method_response(
-                restApiId=api_id,
-                resourceId=resource_id,
-                httpMethod='OPTIONS',
-                statusCode='200',
-                responseParameters={
-                    'method.response.header.Access-Control-Allow-Headers': True,
-                    'method.response.header.Access-Control-Allow-Methods': True,
-                    'method.response.header.Access-Control-Allow-Origin': True
-                }
-            )
-            
-            apigateway_client.put_integration(
-                restApiId=api_id,
-                resourceId=resource_id,
-                httpMethod='OPTIONS',
-                type='MOCK',
-                requestTemplates={'application/json': '{"statusCode": 200}'}
-            )
-            
-            apigateway_client.put_integration_response(
-                restApiId=api_id,
-                resourceId=resource_id,
-                httpMethod='OPTIONS',
-                statusCode='200',
-                responseParameters={
-                    'method.response.header.Access-Control-Allow-Headers': "'Content-Type,Authorization,user-id,User-Id'",
-                    'method.response.header.Access-Control-Allow-Methods': "'GET,POST,DELETE,OPTIONS'",
-                    'method.response.header.Access-Control-Allow-Origin': "'*'"
-                }
-            )
-        except:
-            pass
+    print(f"✅ Configured {sum(len(methods) for methods in spec['paths'].values())} methods from OpenAPI definition")
     
     # Deploy API
     deployment = apigateway_client.create_deployment(
@@ -309,7 +435,7 @@ def create_api_gateway(lambda_functions):
     )
     
     api_url = f"{LOCALSTACK_ENDPOINT}/restapis/{api_id}/dev/_user_request_"
-    print(f"\n✅ API deployed successfully!")
+    print("\n✅ API deployed successfully!")
     print(f"📍 API URL: {api_url}")
     
     return api_id, api_url
@@ -323,7 +449,9 @@ def main():
     
     try:
         # Create deployment package
-        zip_path = create_deployment_package()
+        zip_bytes = create_deployment_package()
+        s3_bucket, s3_key = upload_deployment_package(zip_bytes)
+        code_sha256 = package_code_sha256(zip_bytes)
         
         # Create IAM role
         role_arn = create_lambda_role()
@@ -356,19 +484,12 @@ def main():
             }
         }
         
-        # Create Lambda functions
-        lambda_arns = {}
-        for name, config in functions.items():
-            lambda_arns[name] = create_lambda_function(
-                name, config['handler'], config['description'], zip_path, role_arn
-            )
+        # Create Lambda functions concurrently
+        lambda_arns = deploy_lambda_functions(functions, s3_bucket, s3_key, role_arn, code_sha256)
         
         # Create API Gateway
         api_id, api_url = create_api_gateway(lambda_arns)
         
-        # Clean up
-        shutil.rmtree(os.path.dirname(zip_path))
-        
         print("\n" + "=" * 60)
         print("✅ Deployment completed successfully!")
         print("=" * 60)
@@ -11,30 +11,28 @@ Usage:
 import boto3
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.exceptions import ClientError
 
 
-def verify_s3_bucket(s3_client, bucket_name):
-    """Verify S3 bucket exists"""
+def verify_s3_bucket(s3_client, bucket_name, out=print):
+    """Verify S3 bucket exists and is accessible"""
     try:
-        buckets = s3_client.list_buckets()
-        bucket_names = [b['Name'] for b in buckets['Buckets']]
-        
-        if bucket_name in bucket_names:
-            print(f"✅ S3 bucket '{bucket_name}' exists")
-            
-            # Check if we can access the bucket
-            s3_client.head_bucket(Bucket=bucket_name)
-            print(f"✅ S3 bucket '{bucket_name}' is accessible")
-            return True
+        s3_client.head_bucket(Bucket=bucket_name)
+        out(f"✅ S3 bucket '{bucket_name}' exists and is accessible")
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchBucket'):
+            out(f"❌ S3 bucket '{bucket_name}' not found")
         else:
-            print(f"❌ S3 bucket '{bucket_name}' not found")
-            return False
+            out(f"❌ Error verifying S3 bucket: {e}")
+        return False
     except Exception as e:
-        print(f"❌ Error verifying S3 bucket: {e}")
+        out(f"❌ Error verifying S3 bucket: {e}")
         return False
 
 
-def verify_dynamodb_table(dynamodb_client, table_name):
+def verify_dynamodb_table(dynamodb_client, table_name, out=print):
     """Verify DynamoDB table exists with correct configuration"""
     try:
         response = dynamodb_client.describe_table(TableName=table_name)
@@ -43,18 +41,18 @@ def verify_dynamodb_table(dynamodb_client, table_name):
         # Check table status
         status = table['TableStatus']
         if status == 'ACTIVE':
-            print(f"✅ DynamoDB table '{table_name}' is ACTIVE")
+            out(f"✅ DynamoDB table '{table_name}' is ACTIVE")
         else:
-            print(f"⚠️  DynamoDB table '{table_name}' status: {status}")
+            out(f"⚠️  DynamoDB table '{table_name}' status: {status}")
             return False
         
         # Check primary key
         key_schema = table['KeySchema']
         primary_key = next((k for k in key_schema if k['KeyType'] == 'HASH'), None)
         if primary_key and primary_key['AttributeName'] == 'image_id':
-            print(f"✅ Primary key 'image_id' verified")
+            out(f"✅ Primary key 'image_id' verified")
         else:
-            print(f"❌ Primary key configuration incorrect")
+            out(f"❌ Primary key configuration incorrect")
             return False
         
         # Check GSIs
@@ -68,26 +66,26 @@ def verify_dynamodb_table(dynamodb_client, table_name):
                 gsi = next(g for g in gsis if g['IndexName'] == gsi_name)
                 gsi_status = gsi.get('IndexStatus', 'ACTIVE')
                 if gsi_status == 'ACTIVE':
-                    print(f"✅ GSI '{gsi_name}' is ACTIVE")
+                    out(f"✅ GSI '{gsi_name}' is ACTIVE")
                 else:
-                    print(f"⚠️  GSI '{gsi_name}' status: {gsi_status}")
+                    out(f"⚠️  GSI '{gsi_name}' status: {gsi_status}")
                     all_gsis_found = False
             else:
-                print(f"❌ GSI '{gsi_name}' not found")
+                out(f"❌ GSI '{gsi_name}' not found")
                 all_gsis_found = False
         
         return all_gsis_found
         
     except dynamodb_client.exceptions.ResourceNotFoundException:
-        print(f"❌ DynamoDB table '{table_name}' not found")
+        out(f"❌ DynamoDB table '{table_name}' not found")
         return False
     except Exception as e:
-        print(f"❌ Error verifying DynamoDB table: {e}")
+        out(f"❌ Error verifying DynamoDB table: {e}")
         return False
 
 
-def list_all_resources(s3_client, dynamodb_client):
-    """List all S3 buckets and DynamoDB tables"""
+def list_all_resources(buckets_future, tables_future):
+    """List all S3 buckets and DynamoDB tables from pending list calls"""
     print("\n" + "="*50)
     print("ALL RESOURCES IN LOCALSTACK")
     print("="*50)
@@ -95,7 +93,7 @@ def list_all_resources(s3_client, dynamodb_client):
     # List S3 buckets
     print("\n📦 S3 Buckets:")
     try:
-        buckets = s3_client.list_buckets()
+        buckets = buckets_future.result()
         if buckets['Buckets']:
             for bucket in buckets['Buckets']:
                 print(f"  - {bucket['Name']}")
@@ -107,7 +105,7 @@ def list_all_resources(s3_client, dynamodb_client):
     # List DynamoDB tables
     print("\n🗄️  DynamoDB Tables:")
     try:
-        tables = dynamodb_client.list_tables()
+        tables = tables_future.result()
         if tables['TableNames']:
             for table in tables['TableNames']:
                 print(f"  - {table}")
@@ -156,12 +154,27 @@ def main():
         print("="*50)
         print()
         
-        s3_ok = verify_s3_bucket(s3_client, bucket_name)
+        # The four calls are independent (clients are thread-safe), so fan them
+        # out and collect every result before printing anything
+        s3_output, dynamodb_output = [], []
+        tasks = {
+            's3': (verify_s3_bucket, s3_client, bucket_name, s3_output.append),
+            'dynamodb': (verify_dynamodb_table, dynamodb_client, table_name, dynamodb_output.append),
+            'buckets': (s3_client.list_buckets,),
+            'tables': (dynamodb_client.list_tables,),
+        }
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(*task): name for name, task in tasks.items()}
+            results = {futures[future]: future for future in as_completed(futures)}
+        
+        s3_ok = results['s3'].result()
+        print("\n".join(s3_output))
         print()
-        dynamodb_ok = verify_dynamodb_table(dynamodb_client, table_name)
+        dynamodb_ok = results['dynamodb'].result()
+        print("\n".join(dynamodb_output))
         
         # List all resources
-        list_all_resources(s3_client, dynamodb_client)
+        list_all_resources(results['buckets'], results['tables'])
         
         # Final result
         print("\n" + "="*50)
@@ -4,7 +4,12 @@ Handles environment variables and AWS service configuration.
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional
+
+if TYPE_CHECKING:
+    from botocore.config import Config
 
 
 class Settings:
@@ -26,6 +31,8 @@ class Settings:
     DYNAMODB_TABLE_NAME: str = os.getenv('DYNAMODB_TABLE_NAME', 'images')
     DYNAMODB_USER_INDEX: str = 'UserIndex'
     DYNAMODB_STATUS_INDEX: str = 'StatusIndex'
+    # Optional DAX cluster endpoint (e.g. daxs://my-cluster.abc123.dax-clusters.us-east-1.amazonaws.com)
+    DAX_ENDPOINT: str = os.getenv('DAX_ENDPOINT', '')
     
     # Image Validation
     # Support both MAX_IMAGE_SIZE and legacy MAX_FILE_SIZE env vars
@@ -36,6 +43,21 @@ class Settings:
         'image/jpeg,image/jpg,image/png,image/gif,image/webp'
     ).split(',') if ct.strip()]
     ALLOWED_EXTENSIONS: list = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+    # Lower-cased lookup sets for O(1) membership checks
+    _ALLOWED_CONTENT_TYPES_SET: frozenset = frozenset(ct.lower() for ct in ALLOWED_CONTENT_TYPES)
+    _ALLOWED_EXTENSIONS_SET: frozenset = frozenset(ext.lower() for ext in ALLOWED_EXTENSIONS)
+    
+    # In-process metadata cache (reused across warm Lambda invocations)
+    METADATA_CACHE_ENABLED: bool = os.getenv('METADATA_CACHE_ENABLED', 'true').lower() == 'true'
+    METADATA_CACHE_SIZE: int = int(os.getenv('METADATA_CACHE_SIZE', '1024'))
+    METADATA_CACHE_TTL: int = int(os.getenv('METADATA_CACHE_TTL', '30'))  # seconds
+    
+    # AWS client timeouts (seconds) and total attempts per call, retries included
+    AWS_CONNECT_TIMEOUT: float = float(os.getenv('AWS_CONNECT_TIMEOUT', '1'))
+    AWS_READ_TIMEOUT: float = float(os.getenv('AWS_READ_TIMEOUT', '3'))
+    AWS_MAX_ATTEMPTS: int = int(os.getenv('AWS_MAX_ATTEMPTS', '5'))
+    # Connections kept per client; should cover the threads sharing a client
+    AWS_MAX_POOL_CONNECTIONS: int = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '50'))
     
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
@@ -45,11 +67,30 @@ class Settings:
     APP_NAME: str = 'image-service'
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
 
+    # The config getters below only read class attributes, so each is built
+    # once; mappings are read-only, copy with dict() to modify.
+
     @classmethod
-    def get_aws_config(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_botocore_config(cls) -> 'Config':
+        """Get botocore client configuration shared by every client (keep-alive, pool size, timeouts and retries)"""
+        from botocore.config import Config
+        
+        return Config(
+            tcp_keepalive=True,
+            max_pool_connections=cls.AWS_MAX_POOL_CONNECTIONS,
+            connect_timeout=cls.AWS_CONNECT_TIMEOUT,
+            read_timeout=cls.AWS_READ_TIMEOUT,
+            retries={'total_max_attempts': cls.AWS_MAX_ATTEMPTS, 'mode': 'adaptive'}
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_aws_config(cls) -> Mapping:
         """Get AWS service configuration"""
         config = {
-            'region_name': cls.AWS_REGION
+            'region_name': cls.AWS_REGION,
+            'config': cls.get_botocore_config()
         }
         
         if cls.USE_LOCALSTACK:
@@ -57,30 +98,38 @@ class Settings:
             config['aws_access_key_id'] = 'test'
             config['aws_secret_access_key'] = 'test'
         
-        return config
+        return MappingProxyType(config)
 
     @classmethod
-    def get_s3_config(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_s3_config(cls) -> Mapping:
         """Get S3 specific configuration"""
-        config = cls.get_aws_config()
+        config = dict(cls.get_aws_config())
         config['bucket_name'] = cls.S3_BUCKET_NAME
         config['presigned_url_expiry'] = cls.S3_PRESIGNED_URL_EXPIRATION
         config['key_prefix'] = ''  # No prefix for now
-        return config
+        return MappingProxyType(config)
 
     @classmethod
-    def get_dynamodb_config(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_dynamodb_config(cls) -> Mapping:
         """Get DynamoDB specific configuration"""
-        config = cls.get_aws_config()
+        config = dict(cls.get_aws_config())
         config['table_name'] = cls.DYNAMODB_TABLE_NAME
         config['user_index'] = cls.DYNAMODB_USER_INDEX
         config['status_index'] = cls.DYNAMODB_STATUS_INDEX
-        return config
+        config['dax_endpoint'] = cls.DAX_ENDPOINT or None
+        return MappingProxyType(config)
 
     @classmethod
     def validate_content_type(cls, content_type: str) -> bool:
         """Check if content type is allowed"""
-        return content_type.lower() in [ct.lower() for ct in cls.ALLOWED_CONTENT_TYPES]
+        return content_type.lower() in cls._ALLOWED_CONTENT_TYPES_SET
+
+    @classmethod
+    def validate_extension(cls, filename: str) -> bool:
+        """Check if the file extension is allowed"""
+        return os.path.splitext(filename)[1].lower() in cls._ALLOWED_EXTENSIONS_SET
 
     @classmethod
     def validate_file_size(cls, size: int) -> bool:
@@ -0,0 +1,71 @@
+"""
+Service instances shared by the Lambda handlers.
+
+Each service is imported and created on first use, so a handler's cold start
+only pays for the services it needs, and is reused across warm invocations
+of the same Lambda container.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+
+if TYPE_CHECKING:
+    from src.services.dynamodb_service import DynamoDBService
+    from src.services.image_service import ImageService
+    from src.services.s3_service import S3Service
+
+
+# Created services, keyed by service name
+_services: Dict[str, Any] = {}
+
+
+def _get_service(name: str, create: Callable[[], Any]) -> Any:
+    """
+    Get a shared service, creating it on first use.
+    
+    Args:
+        name: Service name
+        create: Imports and constructs the service
+    
+    Returns:
+        Service instance
+    """
+    service = _services.get(name)
+    if service is None:
+        service = _services[name] = create()
+    return service
+
+
+def _create_image_service() -> 'ImageService':
+    from src.services.image_service import ImageService
+    return ImageService()
+
+
+def _create_dynamodb_service() -> 'DynamoDBService':
+    from src.services.dynamodb_service import DynamoDBService
+    return DynamoDBService()
+
+
+def _create_s3_service() -> 'S3Service':
+    from src.services.s3_service import S3Service
+    return S3Service()
+
+
+def get_image_service() -> 'ImageService':
+    """Return the shared ImageService."""
+    return _get_service('image', _create_image_service)
+
+
+def get_dynamodb_service() -> 'DynamoDBService':
+    """Return the shared DynamoDBService."""
+    return _get_service('dynamodb', _create_dynamodb_service)
+
+
+def get_s3_service() -> 'S3Service':
+    """Return the shared S3Service."""
+    return _get_service('s3', _create_s3_service)
+
+
+def reset_services() -> None:
+    """Drop all shared services so the next call creates them again."""
+    _services.clear()
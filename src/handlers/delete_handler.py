@@ -6,9 +6,10 @@ Supports both soft delete (mark as deleted) and hard delete (remove from S3 and
 import json
 from typing import Dict, Any
 
-from src.services.image_service import ImageService
+from src.handlers.common import get_image_service
 from src.utils.response import success_response, not_found_response, validation_error_response, internal_error_response, error_response
 from src.utils.logger import get_logger
+from src.utils.request import get_headers
 from src.utils.validators import validate_image_id, validate_user_id
 
 
@@ -48,18 +49,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not image_id:
             return validation_error_response("image_id path parameter is required")
         
-        # Validate image_id format
-        is_valid, error = validate_image_id(image_id)
-        if not is_valid:
-            return validation_error_response(f"Invalid image_id: {error}")
-        
         # Extract user_id from headers
-        headers = event.get('headers', {}) or {}
-        user_id = headers.get('user-id') or headers.get('User-Id', '')
+        headers = get_headers(event)
+        user_id = headers.get('user-id', '')
         
         if not user_id:
             return validation_error_response("user-id header is required")
         
+        # Validate formats only once both values are present
+        is_valid, error = validate_image_id(image_id)
+        if not is_valid:
+            return validation_error_response(f"Invalid image_id: {error}")
+        
         # Validate user_id
         is_valid, error = validate_user_id(user_id)
         if not is_valid:
@@ -70,7 +71,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         hard_delete = query_params.get('hard_delete', '').lower() == 'true'
         
         # Delete image
-        image_service = ImageService()
+        image_service = get_image_service()
         success, error = image_service.delete_image(
             image_id=image_id,
             user_id=user_id,
@@ -98,5 +99,5 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error in delete handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in delete handler: %s", e, exc_info=True)
         return internal_error_response(str(e))
@@ -6,9 +6,11 @@ Generates presigned S3 URLs for secure downloads.
 import json
 from typing import Dict, Any
 
-from src.services.image_service import ImageService
+from src.handlers.common import get_image_service
 from src.utils.response import success_response, not_found_response, validation_error_response, internal_error_response, error_response
 from src.utils.logger import get_logger
+from src.utils.request import get_headers
+from src.utils.time_utils import utc_timestamp
 from src.utils.validators import validate_image_id, validate_user_id
 
 
@@ -48,18 +50,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not image_id:
             return validation_error_response("image_id path parameter is required")
         
-        # Validate image_id format
-        is_valid, error = validate_image_id(image_id)
-        if not is_valid:
-            return validation_error_response(f"Invalid image_id: {error}")
-        
         # Extract user_id from headers
-        headers = event.get('headers', {}) or {}
-        user_id = headers.get('user-id') or headers.get('User-Id', '')
+        headers = get_headers(event)
+        user_id = headers.get('user-id', '')
         
         if not user_id:
             return validation_error_response("user-id header is required")
         
+        # Validate formats only once both values are present
+        is_valid, error = validate_image_id(image_id)
+        if not is_valid:
+            return validation_error_response(f"Invalid image_id: {error}")
+        
         # Validate user_id
         is_valid, error = validate_user_id(user_id)
         if not is_valid:
@@ -77,12 +79,16 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 expiry = min(expiry, 3600)
             except ValueError:
                 return validation_error_response("Invalid expiry value. Must be an integer.")
+            # S3Service treats 0 as "use the default", which would make
+            # expires_at disagree with the URL
+            if expiry <= 0:
+                return validation_error_response("Invalid expiry value. Must be greater than 0.")
         
         # Check if redirect is requested
         redirect = query_params.get('redirect', '').lower() == 'true'
         
         # Generate presigned URL
-        image_service = ImageService()
+        image_service = get_image_service()
         success, presigned_url, error = image_service.generate_presigned_url(
             image_id=image_id,
             user_id=user_id,
@@ -114,16 +120,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
         else:
             # Return JSON with presigned URL
+            expires_at = utc_timestamp(expiry)
             return success_response(
                 data={
                     'presigned_url': presigned_url,
                     'image_id': image_id,
                     'expiry_seconds': expiry,
-                    'expires_at': None  # Could calculate ISO timestamp
+                    'expires_at': expires_at
                 },
                 message="Presigned download URL generated successfully"
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error in download handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in download handler: %s", e, exc_info=True)
         return internal_error_response(str(e))
@@ -2,12 +2,14 @@
 Lambda handler for listing images with filters and pagination.
 """
 
-import json
-from typing import Dict, Any, Optional, List
+import base64
+from typing import Dict, Any, List
 
-from src.services.image_service import ImageService
+from src.handlers.common import get_image_service
 from src.utils.response import success_response, validation_error_response, internal_error_response, paginated_response
+from src.utils import json_utils
 from src.utils.logger import get_logger
+from src.utils.request import get_headers
 from src.utils.validators import validate_user_id
 
 
@@ -35,10 +37,10 @@ def parse_query_parameters(event: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with parsed parameters
     """
     query_params = event.get('queryStringParameters') or {}
-    headers = event.get('headers', {}) or {}
+    headers = get_headers(event)
     
     # Get user_id from query params or header
-    user_id = query_params.get('user_id') or headers.get('user-id') or headers.get('User-Id', '')
+    user_id = query_params.get('user_id') or headers.get('user-id', '')
     
     # Parse tags
     tags = None
@@ -72,8 +74,8 @@ def parse_query_parameters(event: Dict[str, Any]) -> Dict[str, Any]:
     if query_params.get('limit'):
         try:
             limit = int(query_params['limit'])
-            # Cap at 100
-            limit = min(limit, 100)
+            # Keep within 1..100
+            limit = max(1, min(limit, 100))
         except ValueError:
             pass
     
@@ -83,11 +85,9 @@ def parse_query_parameters(event: Dict[str, Any]) -> Dict[str, Any]:
     
     if next_token:
         try:
-            import base64
-            decoded = base64.b64decode(next_token).decode('utf-8')
-            last_evaluated_key = json.loads(decoded)
+            last_evaluated_key = json_utils.loads(base64.b64decode(next_token))
         except Exception as e:
-            logger.warning(f"Invalid pagination token: {str(e)}")
+            logger.warning("Invalid pagination token: %s", e)
     
     return {
         'user_id': user_id,
@@ -111,10 +111,7 @@ def encode_pagination_token(last_evaluated_key: Dict[str, Any]) -> str:
     Returns:
         Base64-encoded token
     """
-    import base64
-    
-    token_json = json.dumps(last_evaluated_key)
-    token_bytes = token_json.encode('utf-8')
+    token_bytes = json_utils.dumps_bytes(last_evaluated_key)
     return base64.b64encode(token_bytes).decode('utf-8')
 
 
@@ -155,57 +152,24 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not is_valid:
             return validation_error_response(f"Invalid user_id: {error}")
         
-        # Determine if we need advanced filtering
-        use_advanced_filters = any([
-            params['tags'],
-            params['content_type'],
-            params['min_size'],
-            params['max_size']
-        ])
-        
-        # Query images
-        image_service = ImageService()
-        
-        if use_advanced_filters:
-            # Use search with filters
-            success, metadata_list, next_key, error = image_service.search_images(
-                user_id=user_id,
-                tags=params['tags'],
-                content_type=params['content_type'],
-                status=params['status'],
-                min_size=params['min_size'],
-                max_size=params['max_size'],
-                limit=params['limit'],
-                last_evaluated_key=params['last_evaluated_key']
-            )
-        else:
-            # Simple list by user
-            success, metadata_list, next_key, error = image_service.list_user_images(
-                user_id=user_id,
-                status=params['status'],
-                limit=params['limit'],
-                last_evaluated_key=params['last_evaluated_key']
-            )
+        # Query the user's images; any filters are applied server-side on the same Query
+        image_service = get_image_service()
+        success, metadata_list, next_key, error = image_service.search_images(
+            user_id=user_id,
+            tags=params['tags'],
+            content_type=params['content_type'],
+            status=params['status'],
+            min_size=params['min_size'],
+            max_size=params['max_size'],
+            limit=params['limit'],
+            last_evaluated_key=params['last_evaluated_key']
+        )
         
         if not success:
             return internal_error_response(error)
         
         # Convert metadata to dict
-        images = []
-        for metadata in metadata_list:
-            images.append({
-                'image_id': metadata.image_id,
-                'user_id': metadata.user_id,
-                'filename': metadata.filename,
-                'content_type': metadata.content_type,
-                'size': metadata.size,
-                'upload_timestamp': metadata.upload_timestamp,
-                'tags': metadata.tags,
-                'description': metadata.description,
-                'width': metadata.width,
-                'height': metadata.height,
-                'status': metadata.status
-            })
+        images = [metadata.to_response(include_storage=False) for metadata in metadata_list]
         
         # Encode pagination token
         next_token = None
@@ -220,5 +184,5 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error in list handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in list handler: %s", e, exc_info=True)
         return internal_error_response(str(e))
@@ -8,21 +8,30 @@ Typical flow:
 3. Client calls PATCH /images/{image_id} to mark as 'active'
 """
 
-import json
-import base64
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 
+from src.handlers.common import get_dynamodb_service, get_s3_service
 from src.models.image_metadata import ImageMetadata
-from src.services.dynamodb_service import DynamoDBService
-from src.services.s3_service import S3Service
 from src.utils.response import success_response, error_response, validation_error_response, not_found_response, internal_error_response
 from src.utils.logger import get_logger
+from src.utils.request import get_headers, parse_json_body
+from src.utils.time_utils import utc_timestamp
 from src.utils.validators import validate_user_id
 
 
 logger = get_logger(__name__)
 
+# Statuses a client may set; deletion goes through the delete endpoint
+VALID_UPDATE_STATUSES = frozenset(('active', 'processing', 'error'))
+_INVALID_STATUS_MESSAGE = "Invalid status. Must be one of: active, processing, error"
+
+# Attributes read when a rejected status update needs the stored record
+AUTH_ATTRIBUTES = ['image_id', 'user_id', 'status']
+
+# Attributes read before activating an upload, to check its S3 object. None
+# of them change after creation, so the read may be served from the cache
+UPLOAD_CHECK_ATTRIBUTES = ['image_id', 'user_id', 's3_bucket', 's3_key']
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -63,8 +72,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.info("Update status handler invoked")
         
         # Extract headers
-        headers = event.get('headers', {}) or {}
-        user_id = headers.get('user-id') or headers.get('User-Id', '')
+        headers = get_headers(event)
+        user_id = headers.get('user-id', '')
         
         # Validate user_id
         if not user_id:
@@ -89,11 +98,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return validation_error_response("Request body is required")
         
         try:
-            if is_base64:
-                body = base64.b64decode(body).decode('utf-8')
-            
-            data = json.loads(body)
-        except json.JSONDecodeError as e:
+            data = parse_json_body(body, is_base64)
+        except ValueError as e:
             return validation_error_response(f"Invalid JSON: {str(e)}")
         
         # Validate required fields
@@ -101,70 +107,32 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return validation_error_response("Missing 'status' field")
         
         new_status = data['status']
-        valid_statuses = ['active', 'processing', 'error']
-        
-        if new_status not in valid_statuses:
-            return validation_error_response(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
-        
-        # Extract optional fields
-        size = data.get('size')
-        width = data.get('width')
-        height = data.get('height')
-        
-        # Validate optional numeric fields
-        if size is not None:
-            try:
-                size = int(size)
-                if size <= 0:
-                    return validation_error_response("size must be greater than 0")
-            except (ValueError, TypeError):
-                return validation_error_response("size must be a valid integer")
-        
-        if width is not None:
-            try:
-                width = int(width)
-                if width <= 0:
-                    return validation_error_response("width must be greater than 0")
-            except (ValueError, TypeError):
-                return validation_error_response("width must be a valid integer")
-        
-        if height is not None:
-            try:
-                height = int(height)
-                if height <= 0:
-                    return validation_error_response("height must be greater than 0")
-            except (ValueError, TypeError):
-                return validation_error_response("height must be a valid integer")
-        
-        # Get existing metadata
-        dynamodb_service = DynamoDBService()
-        success, metadata, error_msg = dynamodb_service.get_metadata(image_id)
-        
-        if not success:
-            logger.error(f"Failed to retrieve metadata: {error_msg}")
-            return internal_error_response(f"Failed to retrieve image metadata: {error_msg}")
-        
-        if metadata is None:
-            return not_found_response(f"Image not found: {image_id}")
-        
-        # Verify ownership
-        if metadata.user_id != user_id:
-            logger.warning(f"User {user_id} attempted to access image {image_id} owned by {metadata.user_id}")
-            return not_found_response(f"Image not found: {image_id}")
-        
-        # Check if image is already deleted
-        if metadata.status == 'deleted':
-            return error_response("Cannot update status of deleted image", status_code=409)
+        if not isinstance(new_status, str) or new_status not in VALID_UPDATE_STATUSES:
+            return validation_error_response(_INVALID_STATUS_MESSAGE)
+        
+        # Extract and validate optional numeric fields
+        dimensions = {}
+        for field in ('size', 'width', 'height'):
+            value = data.get(field)
+            if value is not None:
+                value, error = _parse_positive_int(field, value)
+                if error:
+                    return validation_error_response(error)
+            dimensions[field] = value
+        size, width, height = dimensions['size'], dimensions['width'], dimensions['height']
+        
+        # boto3 is only imported once a request has passed validation
+        from boto3.dynamodb.conditions import Attr
+        from src.services.dynamodb_service import CONDITIONAL_CHECK_FAILED
+        
+        dynamodb_service = get_dynamodb_service()
         
         # Prepare update data
         update_data = {
             'status': new_status,
-            'metadata': metadata.metadata or {}
+            'metadata.status_updated_at': utc_timestamp()
         }
         
-        # Add timestamp for status update
-        update_data['metadata']['status_updated_at'] = datetime.utcnow().isoformat() + 'Z'
-        
         # Update size if provided and status is active
         if size is not None and new_status == 'active':
             update_data['size'] = size
@@ -176,55 +144,131 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if height is not None:
             update_data['height'] = height
         
-        # If status is being set to active and we have size, verify S3 object exists
+        # Ownership and deleted-status checks happen in the same conditional write
+        condition = (
+            Attr('image_id').exists()
+            & Attr('user_id').eq(user_id)
+            & Attr('status').ne('deleted')
+        )
+        
+        # Activating with a size must be backed by an uploaded S3 object. Its
+        # location is only stored on the item, so this case reads the item
+        # first and writes nothing if the object is missing. The deleted
+        # check is left to the conditional write
         if new_status == 'active' and size is not None:
-            try:
-                s3_service = S3Service()
-                exists, s3_size, error = s3_service.check_object_exists(
-                    metadata.s3_bucket,
-                    metadata.s3_key
+            success, metadata, error_msg = dynamodb_service.get_metadata(
+                image_id, attributes=UPLOAD_CHECK_ATTRIBUTES
+            )
+            if not success:
+                logger.error("Failed to retrieve metadata: %s", error_msg)
+                return internal_error_response(f"Failed to retrieve image metadata: {error_msg}")
+            
+            if metadata is None or metadata.user_id != user_id:
+                return not_found_response(f"Image not found: {image_id}")
+            
+            s3_service = get_s3_service()
+            exists, _, error_msg = s3_service.check_object_exists(
+                metadata.s3_bucket,
+                metadata.s3_key
+            )
+            
+            if error_msg:
+                logger.error("Failed to verify S3 object: %s", error_msg)
+                return internal_error_response(f"Failed to verify S3 object: {error_msg}")
+            
+            if not exists:
+                logger.warning("S3 object not found for image %s: %s", image_id, metadata.s3_key)
+                return error_response(
+                    "Cannot set status to active: file not found in S3. Please upload the file first.",
+                    status_code=400
                 )
-                
-                if not exists:
-                    logger.warning(f"S3 object not found for image {image_id}: {metadata.s3_key}")
-                    return error_response(
-                        "Cannot set status to active: file not found in S3. Please upload the file first.",
-                        status_code=400
-                    )
-                
-                # Use S3 size if size wasn't provided
-                if s3_size and not size:
-                    update_data['size'] = s3_size
-                    
-            except Exception as e:
-                logger.error(f"Failed to verify S3 object: {str(e)}")
-                # Continue anyway - S3 check is optional
-        
-        # Update metadata in DynamoDB
-        success, error_msg = dynamodb_service.update_metadata(image_id, update_data)
+        
+        success, _, error_msg = dynamodb_service.update_metadata(image_id, update_data, condition=condition)
         
         if not success:
-            logger.error(f"Failed to update metadata: {error_msg}")
+            if error_msg == CONDITIONAL_CHECK_FAILED:
+                # Only a rejected write pays for the read that explains why
+                success, metadata, error_msg = dynamodb_service.get_metadata(
+                    image_id, attributes=AUTH_ATTRIBUTES, use_cache=False
+                )
+                if success:
+                    rejection = _check_updatable(metadata, image_id, user_id)
+                    if rejection is not None:
+                        return rejection
+                    return error_response("Image was modified concurrently, please retry", status_code=409)
+            
+            logger.error("Failed to update metadata: %s", error_msg)
             return internal_error_response(f"Failed to update image status: {error_msg}")
         
-        logger.info(f"Successfully updated status for image: {image_id} to {new_status}")
+        logger.info("Successfully updated status for image: %s to %s", image_id, new_status)
         
         # Return success response
         response_data = {
             'image_id': image_id,
             'status': new_status,
-            'message': 'Image status updated successfully'
+            'message': 'Image status updated successfully',
+            **{field: value for field, value in dimensions.items() if value is not None}
         }
         
-        if size is not None:
-            response_data['size'] = size
-        if width is not None:
-            response_data['width'] = width
-        if height is not None:
-            response_data['height'] = height
-        
         return success_response(data=response_data)
         
     except Exception as e:
-        logger.error(f"Unexpected error in update status handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in update status handler: %s", e, exc_info=True)
         return internal_error_response(str(e))
+
+
+def _parse_positive_int(name: str, value: Any) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Parse a positive integer request field.
+    
+    Integers and digit strings are handled without raising; anything else
+    falls back to int() as before (so e.g. floats are truncated).
+    
+    Args:
+        name: Field name used in the error message
+        value: Raw value from the request body
+    
+    Returns:
+        Tuple of (value, error_message)
+    """
+    if type(value) is not int:
+        if isinstance(value, str) and value.isdecimal():
+            value = int(value)
+        else:
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                return None, f"{name} must be a valid integer"
+    
+    if value <= 0:
+        return None, f"{name} must be greater than 0"
+    
+    return value, None
+
+
+def _check_updatable(metadata: Optional[ImageMetadata], image_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Check that an image exists, belongs to the user and is not deleted.
+    
+    Args:
+        metadata: Stored image metadata (None if not found)
+        image_id: Image ID
+        user_id: Requesting user ID
+    
+    Returns:
+        Error response if the image cannot be updated, otherwise None
+    """
+    if metadata is None:
+        return not_found_response(f"Image not found: {image_id}")
+    
+    # Verify ownership
+    if metadata.user_id != user_id:
+        logger.warning("User %s attempted to access image %s owned by %s", user_id, image_id, metadata.user_id)
+        return not_found_response(f"Image not found: {image_id}")
+    
+    # Check if image is already deleted
+    if metadata.status == 'deleted':
+        return error_response("Cannot update status of deleted image", status_code=409)
+    
+    return None
+
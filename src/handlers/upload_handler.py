@@ -12,17 +12,14 @@ Flow:
 This approach avoids Lambda's 6MB payload limit and is much more efficient.
 """
 
-import json
-import base64
-from typing import Dict, Any
-from datetime import datetime
-import uuid
+from typing import Dict, Any, Optional
 
-from src.models.image_metadata import ImageMetadata
-from src.services.s3_service import S3Service
-from src.services.dynamodb_service import DynamoDBService
+from src.handlers.common import get_dynamodb_service, get_s3_service
+from src.models.image_metadata import ImageMetadata, generate_image_id
 from src.utils.response import success_response, error_response, validation_error_response, internal_error_response
 from src.utils.logger import get_logger
+from src.utils.request import get_headers, parse_json_body
+from src.utils.time_utils import utc_timestamp
 from src.utils.validators import (
     validate_user_id,
     validate_content_type,
@@ -34,6 +31,14 @@ from src.utils.validators import (
 
 logger = get_logger(__name__)
 
+# Upload instructions that are the same for every request; only the URL and
+# content type steps are formatted per call
+_STATIC_INSTRUCTIONS = {
+    'step3': 'Upload image as binary body',
+    'step4': 'PATCH /images/{image_id} with status=active to mark as complete',
+    'note': 'Image status is "processing" until you mark it complete'
+}
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -82,8 +87,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.info("Upload handler invoked - presigned URL generation")
         
         # Extract headers
-        headers = event.get('headers', {}) or {}
-        user_id = headers.get('user-id') or headers.get('User-Id', '')
+        headers = get_headers(event)
+        user_id = headers.get('user-id', '')
         
         # Validate user_id
         if not user_id:
@@ -101,11 +106,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return validation_error_response("Request body is required")
         
         try:
-            if is_base64:
-                body = base64.b64decode(body).decode('utf-8')
-            
-            data = json.loads(body)
-        except json.JSONDecodeError as e:
+            data = parse_json_body(body, is_base64)
+        except ValueError as e:
             return validation_error_response(f"Invalid JSON: {str(e)}")
         
         # Extract and validate required fields
@@ -141,7 +143,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 return validation_error_response(f"Invalid description: {error}")
         
         # Generate presigned URL
-        s3_service = S3Service()
+        s3_service = get_s3_service()
         success, presigned_url, s3_key, error = s3_service.generate_presigned_upload_url(
             user_id=user_id,
             filename=filename,
@@ -154,7 +156,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         # Create metadata entry with 'processing' status
         # This reserves the image_id and tracks the pending upload
-        image_id = str(uuid.uuid4())
+        image_id = generate_image_id()
         metadata = ImageMetadata(
             image_id=image_id,
             user_id=user_id,
@@ -163,7 +165,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             size=0,  # Will be updated when upload completes
             s3_key=s3_key,
             s3_bucket=s3_service.bucket_name,
-            upload_timestamp=datetime.utcnow().isoformat() + 'Z',
+            upload_timestamp=utc_timestamp(),
             tags=tags,
             description=description,
             width=None,  # Will be updated after upload if needed
@@ -173,14 +175,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
         
         # Save metadata to DynamoDB (skip validation for processing status with size=0)
-        dynamodb_service = DynamoDBService()
+        dynamodb_service = get_dynamodb_service()
         success, error = dynamodb_service.save_metadata(metadata, skip_validation=True)
         
         if not success:
-            logger.error(f"Failed to save metadata: {error}")
+            logger.error("Failed to save metadata: %s", error)
             return internal_error_response(f"Failed to create metadata entry: {error}")
         
-        logger.info(f"Generated presigned URL for image: {image_id}")
+        logger.info("Generated presigned URL for image: %s", image_id)
         
         # Return presigned URL and image_id
         return success_response(
@@ -204,10 +206,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 },
                 'instructions': {
                     'step1': f'PUT {presigned_url}',
-                    'step2': 'Set Content-Type header to: ' + content_type,
-                    'step3': 'Upload image as binary body',
-                    'step4': 'PATCH /images/{image_id} with status=active to mark as complete',
-                    'note': 'Image status is "processing" until you mark it complete'
+                    'step2': f'Set Content-Type header to: {content_type}',
+                    **_STATIC_INSTRUCTIONS
                 }
             },
             message="Upload URL generated successfully",
@@ -215,5 +215,5 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error in upload handler: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in upload handler: %s", e, exc_info=True)
         return internal_error_response(str(e))
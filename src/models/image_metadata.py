@@ -3,13 +3,36 @@ ImageMetadata data model.
 Represents image metadata stored in DynamoDB.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, replace
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+import sys
 import uuid
 
+from src.utils.time_utils import utc_timestamp
 
-@dataclass
+
+# slots drop the per-instance __dict__; dataclass only supports them on
+# Python 3.10+, and the Lambda runtime is still python3.9
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+VALID_STATUSES = frozenset(('active', 'deleted', 'processing', 'error'))
+_INVALID_STATUS_MESSAGE = "Invalid status. Must be one of: active, deleted, processing, error"
+
+
+def generate_image_id() -> str:
+    """
+    Generate a new image ID.
+    
+    Random (version 4) UUIDs spread writes evenly across DynamoDB partitions,
+    which time-ordered IDs would not.
+    
+    Returns:
+        Hyphenated UUID string
+    """
+    return str(uuid.uuid4())
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ImageMetadata:
     """
     Image metadata model.
@@ -45,6 +68,8 @@ class ImageMetadata:
     height: Optional[int] = None
     status: str = 'active'
     metadata: Optional[Dict[str, Any]] = None
+    # Values of the checked fields when validate() last passed
+    _validated_state: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def create(
@@ -81,14 +106,14 @@ class ImageMetadata:
             New ImageMetadata instance
         """
         return cls(
-            image_id=str(uuid.uuid4()),
+            image_id=generate_image_id(),
             user_id=user_id,
             filename=filename,
             content_type=content_type,
             size=size,
             s3_key=s3_key,
             s3_bucket=s3_bucket,
-            upload_timestamp=datetime.utcnow().isoformat() + 'Z',
+            upload_timestamp=utc_timestamp(),
             tags=tags or [],
             description=description,
             width=width,
@@ -104,10 +129,73 @@ class ImageMetadata:
         Returns:
             Dictionary representation
         """
-        data = asdict(self)
+        # Built field by field rather than with dataclasses.asdict, which
+        # introspects fields() and deep-copies every value on each call.
+        # tags and metadata are copied one level deep so callers can modify them.
+        data = {
+            'image_id': self.image_id,
+            'user_id': self.user_id,
+            'filename': self.filename,
+            'content_type': self.content_type,
+            'size': self.size,
+            's3_key': self.s3_key,
+            's3_bucket': self.s3_bucket,
+            'upload_timestamp': self.upload_timestamp,
+            'tags': list(self.tags) if self.tags is not None else None,
+            'description': self.description,
+            'width': self.width,
+            'height': self.height,
+            'status': self.status,
+            'metadata': dict(self.metadata) if self.metadata is not None else None,
+        }
         # Remove None values
         return {k: v for k, v in data.items() if v is not None}
     
+    def to_response(self, include_storage: bool = True) -> Dict[str, Any]:
+        """
+        Convert to the API response representation.
+        
+        Unlike to_dict, None fields are kept so clients always see every key.
+        
+        Args:
+            include_storage: Include the S3 location and the additional metadata
+                map (single-image responses); listings leave them out
+        
+        Returns:
+            Dictionary ready for JSON serialization
+        """
+        if not include_storage:
+            return {
+                'image_id': self.image_id,
+                'user_id': self.user_id,
+                'filename': self.filename,
+                'content_type': self.content_type,
+                'size': self.size,
+                'upload_timestamp': self.upload_timestamp,
+                'tags': self.tags,
+                'description': self.description,
+                'width': self.width,
+                'height': self.height,
+                'status': self.status
+            }
+        
+        return {
+            'image_id': self.image_id,
+            'user_id': self.user_id,
+            'filename': self.filename,
+            'content_type': self.content_type,
+            'size': self.size,
+            's3_key': self.s3_key,
+            's3_bucket': self.s3_bucket,
+            'upload_timestamp': self.upload_timestamp,
+            'tags': self.tags,
+            'description': self.description,
+            'width': self.width,
+            'height': self.height,
+            'status': self.status,
+            'metadata': self.metadata
+        }
+    
     def to_dynamodb(self) -> Dict[str, Any]:
         """
         Convert to DynamoDB item format.
@@ -115,21 +203,29 @@ class ImageMetadata:
         Returns:
             Dictionary formatted for DynamoDB
         """
-        item = self.to_dict()
-        
-        # DynamoDB doesn't support empty strings in certain contexts
-        # Convert empty strings to None
-        for key, value in item.items():
-            if isinstance(value, str) and not value:
-                item[key] = None
-        
-        # Ensure tags is always a list
-        if 'tags' not in item:
-            item['tags'] = []
+        # Built in a single pass: None fields are omitted, and empty strings are
+        # stored as None since DynamoDB doesn't support them in certain contexts
+        item = {}
+        for key, value in (
+            ('image_id', self.image_id),
+            ('user_id', self.user_id),
+            ('filename', self.filename),
+            ('content_type', self.content_type),
+            ('size', self.size),
+            ('s3_key', self.s3_key),
+            ('s3_bucket', self.s3_bucket),
+            ('upload_timestamp', self.upload_timestamp),
+            ('description', self.description),
+            ('width', self.width),
+            ('height', self.height),
+            ('status', self.status),
+        ):
+            if value is not None:
+                item[key] = None if value == '' else value
         
-        # Ensure metadata is always a dict
-        if 'metadata' not in item or item['metadata'] is None:
-            item['metadata'] = {}
+        # tags is always a list and metadata always a dict
+        item['tags'] = list(self.tags) if self.tags is not None else []
+        item['metadata'] = dict(self.metadata) if self.metadata is not None else {}
         
         return item
     
@@ -138,36 +234,65 @@ class ImageMetadata:
         """
         Create ImageMetadata from DynamoDB item.
         
+        Items read with a projection (e.g. listings or access checks) may omit
+        any attribute other than image_id and user_id; missing fields fall back
+        to empty values.
+        
+        This runs once per returned item, so it is written out for the fixed
+        schema: one lookup per field, with only the numeric fields converted
+        from Decimal.
+        
         Args:
             item: DynamoDB item dictionary
         
         Returns:
             ImageMetadata instance
         """
+        get = item.get
+        width = get('width')
+        height = get('height')
         return cls(
             image_id=item['image_id'],
             user_id=item['user_id'],
-            filename=item['filename'],
-            content_type=item['content_type'],
-            size=int(item['size']),
-            s3_key=item['s3_key'],
-            s3_bucket=item['s3_bucket'],
-            upload_timestamp=item['upload_timestamp'],
-            tags=item.get('tags', []),
-            description=item.get('description'),
-            width=int(item['width']) if item.get('width') else None,
-            height=int(item['height']) if item.get('height') else None,
-            status=item.get('status', 'active'),
-            metadata=item.get('metadata', {})
+            filename=get('filename', ''),
+            content_type=get('content_type', ''),
+            size=int(get('size', 0)),
+            s3_key=get('s3_key', ''),
+            s3_bucket=get('s3_bucket', ''),
+            upload_timestamp=get('upload_timestamp', ''),
+            tags=get('tags', []),
+            description=get('description'),
+            width=int(width) if width else None,
+            height=int(height) if height else None,
+            status=get('status', 'active'),
+            metadata=get('metadata', {})
         )
     
     def validate(self) -> tuple[bool, Optional[str]]:
         """
         Validate the image metadata.
         
+        A passing result is remembered together with the values it checked,
+        so validating an unchanged instance again (e.g. when a save is retried)
+        returns immediately. Any change to a checked field, including editing
+        the tags list in place, triggers a full validation.
+        
         Returns:
             Tuple of (is_valid, error_message)
         """
+        state = (
+            self.user_id,
+            self.content_type,
+            self.size,
+            tuple(self.tags) if self.tags else None,
+            self.description,
+            self.width,
+            self.height,
+            self.status
+        )
+        if state == self._validated_state:
+            return True, None
+        
         from src.utils.validators import (
             validate_user_id,
             validate_content_type,
@@ -211,10 +336,10 @@ class ImageMetadata:
             return False, "Height must be greater than 0"
         
         # Validate status
-        valid_statuses = ['active', 'deleted', 'processing', 'error']
-        if self.status not in valid_statuses:
-            return False, f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+        if self.status not in VALID_STATUSES:
+            return False, _INVALID_STATUS_MESSAGE
         
+        self._validated_state = state
         return True, None
     
     def update(self, **kwargs) -> 'ImageMetadata':
@@ -231,6 +356,19 @@ class ImageMetadata:
         data.update(kwargs)
         return ImageMetadata(**data)
     
+    def copy(self) -> 'ImageMetadata':
+        """
+        Create a copy whose tags and metadata can be modified independently.
+        
+        Returns:
+            New ImageMetadata instance
+        """
+        return replace(
+            self,
+            tags=list(self.tags) if self.tags is not None else None,
+            metadata=dict(self.metadata) if self.metadata is not None else None
+        )
+    
     def mark_deleted(self) -> 'ImageMetadata':
         """
         Mark the image as deleted (soft delete).
@@ -2,18 +2,128 @@
 DynamoDBService for managing image metadata storage.
 """
 
-from typing import Optional, List, Dict, Any
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
 import boto3
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.conditions import Key, Attr, ConditionBase
 
 from src.config.settings import Settings
 from src.models.image_metadata import ImageMetadata
+from src.utils.cache import TTLCache
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Error returned when a conditional write is rejected because the item
+# (or its absence) did not satisfy the condition
+CONDITIONAL_CHECK_FAILED = "Condition check failed"
+
+# TransactWriteItems accepts at most 100 actions per request
+TRANSACT_WRITE_LIMIT = 100
+
+# BatchGetItem accepts at most 100 keys per request; larger fetches are split
+# and the requests issued from a small thread pool shared by the service
+BATCH_GET_LIMIT = 100
+BATCH_GET_WORKERS = 16
+BATCH_GET_MAX_ATTEMPTS = 5
+BATCH_GET_BACKOFF_BASE = 0.05  # seconds
+
+# Default number of segments read concurrently by a parallel scan
+SCAN_SEGMENTS = 8
+
+# Filtered queries read at least this many items per page, since the filter
+# runs after the read and small pages would often come back empty
+QUERY_PAGE_SIZE = 100
+
+# Attributes forming an exclusive start key for a table scan and for a
+# UserIndex query (table key plus index key)
+TABLE_KEY_ATTRIBUTES = ('image_id',)
+USER_INDEX_KEY_ATTRIBUTES = ('image_id', 'user_id', 'upload_timestamp')
+STATUS_INDEX_KEY_ATTRIBUTES = ('image_id', 'status', 'upload_timestamp')
+
+# Attributes ImageMetadata.from_dynamodb needs; added to every projection
+# whose items are converted
+ITEM_REQUIRED_ATTRIBUTES = ('image_id', 'user_id')
+
+# Key conditions are immutable, so one instance is shared by every request
+_KEY_USER_ID = Key('user_id')
+_KEY_STATUS = Key('status')
+
+# Default update condition, so updating a missing ID fails instead of
+# creating a partial item
+_ITEM_EXISTS = Attr('image_id').exists()
+
+# Transaction conditions are plain strings: boto3 adds the names of built
+# conditions at the top level of TransactWriteItems, where they are rejected
+_TRANSACT_ITEM_EXISTS = 'attribute_exists(image_id)'
+_TRANSACT_ITEM_NOT_EXISTS = 'attribute_not_exists(image_id)'
+
+# Filters matched by equality; each uses '#<name>'/':<name>' placeholders
+_EQUALITY_FILTERS = ('status', 'user_id', 'content_type')
+
+
+@dataclass(frozen=True)
+class Increment:
+    """
+    update_metadata value that adds to a number in place, e.g.
+    {'view_count': Increment(1)}. A missing attribute counts as 0.
+    """
+    amount: Any = 1
+
+
+@dataclass(frozen=True)
+class Append:
+    """
+    update_metadata value that appends to a list in place, e.g.
+    {'tags': Append(['new'])}. A missing attribute counts as an empty list.
+    """
+    values: List[Any]
+
+
+@lru_cache(maxsize=128)
+def _filter_template(
+    equality: Tuple[str, ...],
+    tag_count: int,
+    has_min: bool,
+    has_max: bool
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Build the FilterExpression and attribute names for one filter shape.
+    
+    Args:
+        equality: Names of the equality filters set, in _EQUALITY_FILTERS order
+        tag_count: Number of tags to match (any of them)
+        has_min: Whether a minimum size is set
+        has_max: Whether a maximum size is set
+    
+    Returns:
+        Tuple of (expression, attribute_names); the names must not be modified
+    """
+    parts = [f'#{name} = :{name}' for name in equality]
+    names = {f'#{name}': name for name in equality}
+    
+    if tag_count:
+        names['#tags'] = 'tags'
+        tag_parts = [f'contains(#tags, :tag{i})' for i in range(tag_count)]
+        parts.append(f"({' OR '.join(tag_parts)})")
+    
+    if has_min or has_max:
+        names['#size'] = 'size'
+        if has_min and has_max:
+            parts.append('#size BETWEEN :min_size AND :max_size')
+        else:
+            parts.append('#size >= :min_size' if has_min else '#size <= :max_size')
+    
+    return ' AND '.join(parts), names
 
 class DynamoDBService:
     """Service for DynamoDB operations."""
@@ -28,16 +138,344 @@ class DynamoDBService:
         self.settings = settings or Settings()
         
         # Get DynamoDB config
-        dynamodb_config = self.settings.get_dynamodb_config()
+        dynamodb_config = dict(self.settings.get_dynamodb_config())
         self.table_name = dynamodb_config.pop('table_name', self.settings.DYNAMODB_TABLE_NAME)
         self.user_index = dynamodb_config.pop('user_index', self.settings.DYNAMODB_USER_INDEX)
         self.status_index = dynamodb_config.pop('status_index', self.settings.DYNAMODB_STATUS_INDEX)
+        dax_endpoint = dynamodb_config.pop('dax_endpoint', None)
+        
+        # Create DynamoDB resource with remaining config (AWS credentials and endpoint),
+        # going through DAX when a cluster is configured
+        self.dynamodb = None
+        if dax_endpoint:
+            self.dynamodb = self._create_dax_resource(dax_endpoint, dynamodb_config.get('region_name'))
+        if self.dynamodb is None:
+            self.dynamodb = boto3.resource('dynamodb', **dynamodb_config)
+        self.table = self.dynamodb.Table(self.table_name)
+        
+        # Full items read by ID, keyed by image_id and dropped on every write
+        # to that ID through this service (None when disabled). Entries are
+        # copied in and out, so callers may modify what they get back
+        self._metadata_cache = None
+        if self.settings.METADATA_CACHE_ENABLED:
+            self._metadata_cache = TTLCache(
+                maxsize=self.settings.METADATA_CACHE_SIZE,
+                ttl=self.settings.METADATA_CACHE_TTL
+            )
+        
+        # Thread pool for batch reads, created on first use and kept for the
+        # life of the service so warm invocations reuse its threads
+        self._executor = None
+        
+        logger.info("DynamoDBService initialized with table: %s", self.table_name)
+    
+    @staticmethod
+    def _create_dax_resource(endpoint_url: str, region_name: Optional[str]):
+        """
+        Create a DynamoDB resource backed by a DAX cluster.
+        
+        DAX implements the resource API and writes through to the table, so
+        reads, queries and writes all go through it and its item cache stays
+        current. The amazon-dax-client package is optional; without it the
+        service falls back to DynamoDB.
+        
+        Args:
+            endpoint_url: DAX cluster endpoint
+            region_name: AWS region
+        
+        Returns:
+            DAX resource, or None if amazon-dax-client is not installed
+        """
+        try:
+            from amazondax import AmazonDaxClient
+        except ImportError:
+            logger.warning("DAX_ENDPOINT is set but amazon-dax-client is not installed; using DynamoDB directly")
+            return None
+        
+        return AmazonDaxClient.resource(endpoint_url=endpoint_url, region_name=region_name)
+    
+    def _invalidate(self, image_ids: List[str]) -> None:
+        """
+        Drop cached metadata for images that were just written.
+        
+        Invalidation bumps the cache generation, and reads only cache what
+        they fetched if the generation is unchanged, so a read that overlaps
+        a write through this service does not put the old item back. Writes
+        made elsewhere are still only seen once the entry expires (best
+        effort within METADATA_CACHE_TTL).
+        
+        Args:
+            image_ids: Image IDs
+        """
+        if self._metadata_cache is not None:
+            for image_id in image_ids:
+                self._metadata_cache.pop(image_id)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used to issue batch reads in parallel.
+        
+        Returns:
+            Shared ThreadPoolExecutor with BATCH_GET_WORKERS threads
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=BATCH_GET_WORKERS,
+                thread_name_prefix='dynamodb-batch'
+            )
+        return self._executor
+    
+    @staticmethod
+    def _projection_params(attributes: List[str]) -> Dict[str, Any]:
+        """
+        Build ProjectionExpression parameters for a list of attribute names.
+        
+        Every name is aliased so reserved words (e.g. 'size', 'status') are safe.
+        
+        Args:
+            attributes: Attribute names to return
+        
+        Returns:
+            Dictionary with ProjectionExpression and ExpressionAttributeNames
+        """
+        names = {f'#p{i}': attribute for i, attribute in enumerate(attributes)}
+        return {
+            'ProjectionExpression': ', '.join(names),
+            'ExpressionAttributeNames': names
+        }
+    
+    def _read_until_limit(
+        self,
+        read: Callable[..., Dict[str, Any]],
+        query_params: Dict[str, Any],
+        limit: int,
+        key_attributes: Tuple[str, ...] = USER_INDEX_KEY_ATTRIBUTES
+    ) -> tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Run a query or scan, following pages until `limit` items match or the data is exhausted.
+        
+        A FilterExpression is applied after DynamoDB reads each page, so a page
+        sized to the limit can come back short (or empty) while more matches
+        remain. Filtered queries therefore read pages of at least
+        QUERY_PAGE_SIZE items and keep only the first `limit` matches. When a
+        page is cut short, the next key is built from the last returned item,
+        so the following request resumes right after it and no match is skipped.
+        
+        Args:
+            read: self.table.query or self.table.scan
+            query_params: Request parameters (without Limit); a projection must
+                include the key attributes
+            limit: Maximum number of items to return
+            key_attributes: Attributes forming an exclusive start key
+        
+        Returns:
+            Tuple of (items, next_key)
+        """
+        page_size = max(limit, QUERY_PAGE_SIZE) if 'FilterExpression' in query_params else limit
+        items: List[Dict[str, Any]] = []
+        next_key = query_params.pop('ExclusiveStartKey', None)
+        if limit <= 0:
+            return items, next_key
+        
+        while True:
+            if next_key:
+                query_params['ExclusiveStartKey'] = next_key
+            response = read(Limit=page_size, **query_params)
+            page = response.get('Items', [])
+            next_key = response.get('LastEvaluatedKey')
+            
+            remaining = limit - len(items)
+            if len(page) > remaining:
+                items.extend(page[:remaining])
+                last_item = items[-1]
+                return items, {name: last_item[name] for name in key_attributes}
+            
+            items.extend(page)
+            if not next_key or len(items) >= limit:
+                return items, next_key
+    
+    @staticmethod
+    def _with_key_attributes(
+        attributes: List[str],
+        key_attributes: Tuple[str, ...] = USER_INDEX_KEY_ATTRIBUTES
+    ) -> List[str]:
+        """
+        Add key attributes to a projection so pages can be resumed and items converted.
+        
+        Args:
+            attributes: Attribute names requested by the caller
+            key_attributes: Attributes that must be returned
+        
+        Returns:
+            Attribute names including key_attributes
+        """
+        return list(dict.fromkeys([*attributes, *key_attributes]))
+    
+    @staticmethod
+    def _iter_items(read: Callable[..., Dict[str, Any]], params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a query or scan one page at a time.
+        
+        Args:
+            read: self.table.query or self.table.scan
+            params: Request parameters (including Limit, used as the page size)
+        
+        Yields:
+            Items in the order DynamoDB returns them
+        """
+        while True:
+            response = read(**params)
+            yield from response.get('Items', [])
+            next_key = response.get('LastEvaluatedKey')
+            if not next_key:
+                return
+            params['ExclusiveStartKey'] = next_key
+    
+    @staticmethod
+    def _filter_params(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a FilterExpression string and its placeholders for a set of filters.
+        
+        The expression is written out directly rather than composed from
+        Attr conditions, so boto3 has no condition tree to walk per request.
+        Tags match if the image has any of them; all other filters must match.
+        Placeholders are named after the attribute, so they never clash with
+        projection ('#pN') or boto3-generated ('#nN', ':vN') ones. The
+        expression depends only on which filters are set (see
+        _filter_template), so per call only the values are filled in.
+        
+        Args:
+            filters: Dictionary of filters (status, user_id, content_type, tags, min_size, max_size)
         
-        # Create DynamoDB resource with remaining config (AWS credentials and endpoint)
-        dynamodb = boto3.resource('dynamodb', **dynamodb_config)
-        self.table = dynamodb.Table(self.table_name)
+        Returns:
+            Dictionary with FilterExpression, ExpressionAttributeNames and
+            ExpressionAttributeValues, or an empty dictionary if nothing is filtered
+        """
+        if not filters:
+            return {}
+        
+        equality = tuple(name for name in _EQUALITY_FILTERS if name in filters)
+        tags = filters.get('tags') or ()
+        has_min, has_max = 'min_size' in filters, 'max_size' in filters
+        if not (equality or tags or has_min or has_max):
+            return {}
         
-        logger.info(f"DynamoDBService initialized with table: {self.table_name}")
+        expression, names = _filter_template(equality, len(tags), has_min, has_max)
+        
+        values = {f':{name}': filters[name] for name in equality}
+        for i, tag in enumerate(tags):
+            values[f':tag{i}'] = tag
+        if has_min:
+            values[':min_size'] = filters['min_size']
+        if has_max:
+            values[':max_size'] = filters['max_size']
+        
+        return {
+            'FilterExpression': expression,
+            # Copied because boto3 and _add_projection add to it in place
+            'ExpressionAttributeNames': dict(names),
+            'ExpressionAttributeValues': values
+        }
+    
+    def _add_projection(self, params: Dict[str, Any], attributes: List[str]) -> None:
+        """
+        Add a projection to request parameters, merging its placeholder names with any filter's.
+        
+        Args:
+            params: Request parameters (modified in place)
+            attributes: Attribute names to return, including any required key attributes
+        """
+        projection = self._projection_params(attributes)
+        params['ProjectionExpression'] = projection['ProjectionExpression']
+        params.setdefault('ExpressionAttributeNames', {}).update(projection['ExpressionAttributeNames'])
+    
+    def _user_query_params(
+        self,
+        user_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build UserIndex query parameters for a user's images, newest first.
+        
+        Args:
+            user_id: User ID
+            filters: Dictionary of filters (see _filter_params)
+            attributes: Attributes to return (all attributes if not provided)
+        
+        Returns:
+            Query parameters
+        """
+        query_params = {
+            'IndexName': self.user_index,
+            'KeyConditionExpression': _KEY_USER_ID.eq(user_id),
+            'ScanIndexForward': False,  # Sort by upload_timestamp descending (newest first)
+            **self._filter_params(filters)
+        }
+        
+        # Only read the attributes the caller needs
+        if attributes:
+            self._add_projection(query_params, self._with_key_attributes(attributes))
+        
+        return query_params
+    
+    def _status_query_params(
+        self,
+        status: str,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build StatusIndex query parameters for all images with a status, newest first.
+        
+        Args:
+            status: Image status
+            filters: Dictionary of filters (see _filter_params)
+            attributes: Attributes to return (all attributes if not provided)
+        
+        Returns:
+            Query parameters
+        """
+        query_params = {
+            'IndexName': self.status_index,
+            'KeyConditionExpression': _KEY_STATUS.eq(status),
+            'ScanIndexForward': False,  # Sort by upload_timestamp descending (newest first)
+            **self._filter_params(filters)
+        }
+        
+        # Only read the attributes the caller needs
+        if attributes:
+            self._add_projection(
+                query_params,
+                self._with_key_attributes(attributes, STATUS_INDEX_KEY_ATTRIBUTES + ('user_id',))
+            )
+        
+        return query_params
+    
+    def _scan_params(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build table scan parameters for a set of filters.
+        
+        Args:
+            filters: Dictionary of filters
+            attributes: Attributes to return (all attributes if not provided)
+        
+        Returns:
+            Scan parameters
+        """
+        scan_params = self._filter_params(filters)
+        
+        # Only read the attributes the caller needs
+        if attributes:
+            self._add_projection(
+                scan_params, self._with_key_attributes(attributes, ITEM_REQUIRED_ATTRIBUTES)
+            )
+        
+        return scan_params
     
     def save_metadata(self, metadata: ImageMetadata, skip_validation: bool = False) -> tuple[bool, Optional[str]]:
         """
@@ -62,8 +500,9 @@ class DynamoDBService:
             
             # Save to DynamoDB
             self.table.put_item(Item=item)
+            self._invalidate([metadata.image_id])
             
-            logger.info(f"Successfully saved metadata for image: {metadata.image_id}")
+            logger.info("Successfully saved metadata for image: %s", metadata.image_id)
             return True, None
             
         except ClientError as e:
@@ -75,24 +514,58 @@ class DynamoDBService:
             logger.error(error_msg)
             return False, error_msg
     
-    def get_metadata(self, image_id: str) -> tuple[bool, Optional[ImageMetadata], Optional[str]]:
+    def get_metadata(
+        self,
+        image_id: str,
+        attributes: Optional[List[str]] = None,
+        use_cache: bool = True,
+        consistent: bool = False
+    ) -> tuple[bool, Optional[ImageMetadata], Optional[str]]:
         """
         Get image metadata by ID.
         
+        Full items are cached for METADATA_CACHE_TTL seconds, and a cached item
+        also answers reads of a subset of its attributes. Writes made by other
+        containers are not seen until the entry expires, so authorization and
+        status checks pass use_cache=False (a full read still refreshes the cache).
+        
         Args:
             image_id: Image ID
+            attributes: Attributes to return (all attributes if not provided)
+            use_cache: Whether a cached item may answer the read
+            consistent: Use a strongly consistent read (twice the read capacity;
+                implies use_cache=False)
         
         Returns:
             Tuple of (success, metadata, error_message)
         """
         try:
-            response = self.table.get_item(Key={'image_id': image_id})
+            if use_cache and not consistent and self._metadata_cache is not None:
+                metadata = self._metadata_cache.get(image_id)
+                if metadata is not None:
+                    return True, metadata.copy(), None
+            
+            if self._metadata_cache is not None:
+                generation = self._metadata_cache.generation()
+            
+            get_params = {'Key': {'image_id': image_id}}
+            if attributes:
+                # image_id and user_id are needed to build ImageMetadata
+                attributes = self._with_key_attributes(attributes, ITEM_REQUIRED_ATTRIBUTES)
+                get_params.update(self._projection_params(attributes))
+            if consistent:
+                get_params['ConsistentRead'] = True
+            
+            response = self.table.get_item(**get_params)
             
             if 'Item' not in response:
                 return True, None, None
             
             metadata = ImageMetadata.from_dynamodb(response['Item'])
-            logger.info(f"Successfully retrieved metadata for image: {image_id}")
+            if not attributes and self._metadata_cache is not None:
+                self._metadata_cache.set(image_id, metadata.copy(), generation)
+            
+            logger.info("Successfully retrieved metadata for image: %s", image_id)
             return True, metadata, None
             
         except ClientError as e:
@@ -109,7 +582,8 @@ class DynamoDBService:
         user_id: str,
         status: Optional[str] = None,
         limit: int = 100,
-        last_evaluated_key: Optional[Dict[str, Any]] = None
+        last_evaluated_key: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
     ) -> tuple[bool, List[ImageMetadata], Optional[Dict[str, Any]], Optional[str]]:
         """
         Query images by user ID using UserIndex GSI.
@@ -119,39 +593,28 @@ class DynamoDBService:
             status: Optional status filter
             limit: Maximum number of items to return
             last_evaluated_key: Pagination token
+            attributes: Attributes to return (all attributes if not provided)
         
         Returns:
             Tuple of (success, metadata_list, next_key, error_message)
         """
         try:
-            # Build query parameters
-            query_params = {
-                'IndexName': self.user_index,
-                'KeyConditionExpression': Key('user_id').eq(user_id),
-                'Limit': limit,
-                'ScanIndexForward': False  # Sort by upload_timestamp descending (newest first)
-            }
-            
-            # Add status filter if provided
-            if status:
-                query_params['FilterExpression'] = Attr('status').eq(status)
+            query_params = self._user_query_params(user_id, {'status': status} if status else None, attributes)
             
             # Add pagination token if provided
             if last_evaluated_key:
                 query_params['ExclusiveStartKey'] = last_evaluated_key
             
-            # Execute query
-            response = self.table.query(**query_params)
+            # Execute query, following pages so filtered results fill the limit
+            items, next_key = self._read_until_limit(self.table.query, query_params, limit)
             
             # Convert items to ImageMetadata
             metadata_list = [
                 ImageMetadata.from_dynamodb(item)
-                for item in response.get('Items', [])
+                for item in items
             ]
             
-            next_key = response.get('LastEvaluatedKey')
-            
-            logger.info(f"Successfully queried {len(metadata_list)} images for user: {user_id}")
+            logger.info("Successfully queried %s images for user: %s", len(metadata_list), user_id)
             return True, metadata_list, next_key, None
             
         except ClientError as e:
@@ -163,12 +626,86 @@ class DynamoDBService:
             logger.error(error_msg)
             return False, [], None, error_msg
     
+    def count_by_user(
+        self,
+        user_id: str,
+        status: Optional[str] = None
+    ) -> tuple[bool, int, Optional[str]]:
+        """
+        Count a user's images without transferring them.
+        
+        Uses Select='COUNT', so each page returns only its match count. Every
+        page still reads (and is billed for) up to 1 MB of index data.
+        
+        Args:
+            user_id: User ID
+            status: Optional status filter
+        
+        Returns:
+            Tuple of (success, count, error_message)
+        """
+        try:
+            query_params = self._user_query_params(user_id, {'status': status} if status else None)
+            query_params['Select'] = 'COUNT'
+            
+            count = 0
+            while True:
+                response = self.table.query(**query_params)
+                count += response.get('Count', 0)
+                next_key = response.get('LastEvaluatedKey')
+                if not next_key:
+                    break
+                query_params['ExclusiveStartKey'] = next_key
+            
+            logger.info("Counted %s images for user: %s", count, user_id)
+            return True, count, None
+            
+        except ClientError as e:
+            error_msg = f"Failed to count images: {str(e)}"
+            logger.error(error_msg)
+            return False, 0, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error counting images: {str(e)}"
+            logger.error(error_msg)
+            return False, 0, error_msg
+    
+    def iter_query_by_user(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        attributes: Optional[List[str]] = None,
+        page_size: int = QUERY_PAGE_SIZE
+    ) -> Iterator[ImageMetadata]:
+        """
+        Iterate over all of a user's images, newest first, one page in memory at a time.
+        
+        Unlike query_by_user, errors are raised rather than returned, since a
+        generator cannot hand back a status tuple.
+        
+        Args:
+            user_id: User ID
+            status: Optional status filter
+            attributes: Attributes to return (all attributes if not provided)
+            page_size: Items read per request
+        
+        Yields:
+            ImageMetadata for each matching image
+        
+        Raises:
+            ClientError: If a DynamoDB request fails
+        """
+        query_params = self._user_query_params(user_id, {'status': status} if status else None, attributes)
+        query_params['Limit'] = page_size
+        for item in self._iter_items(self.table.query, query_params):
+            yield ImageMetadata.from_dynamodb(item)
+    
     def query_with_filters(
         self,
         user_id: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        last_evaluated_key: Optional[Dict[str, Any]] = None
+        last_evaluated_key: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
     ) -> tuple[bool, List[ImageMetadata], Optional[Dict[str, Any]], Optional[str]]:
         """
         Query images with advanced filters.
@@ -178,68 +715,28 @@ class DynamoDBService:
             filters: Dictionary of filters (e.g., {'status': 'active', 'tags': ['vacation']})
             limit: Maximum number of items to return
             last_evaluated_key: Pagination token
+            attributes: Attributes to return (all attributes if not provided)
         
         Returns:
             Tuple of (success, metadata_list, next_key, error_message)
         """
         try:
-            # Build query parameters
-            query_params = {
-                'IndexName': self.user_index,
-                'KeyConditionExpression': Key('user_id').eq(user_id),
-                'Limit': limit,
-                'ScanIndexForward': False  # Sort by upload_timestamp descending (newest first)
-            }
-            
-            # Build filter expression
-            if filters:
-                filter_expressions = []
-                
-                if 'status' in filters:
-                    filter_expressions.append(Attr('status').eq(filters['status']))
-                
-                if 'tags' in filters and filters['tags']:
-                    # Check if any of the provided tags exist in the image tags
-                    tag_conditions = [Attr('tags').contains(tag) for tag in filters['tags']]
-                    if tag_conditions:
-                        # Combine with OR logic
-                        combined = tag_conditions[0]
-                        for condition in tag_conditions[1:]:
-                            combined = combined | condition
-                        filter_expressions.append(combined)
-                
-                if 'content_type' in filters:
-                    filter_expressions.append(Attr('content_type').eq(filters['content_type']))
-                
-                if 'min_size' in filters:
-                    filter_expressions.append(Attr('size').gte(filters['min_size']))
-                
-                if 'max_size' in filters:
-                    filter_expressions.append(Attr('size').lte(filters['max_size']))
-                
-                # Combine all filter expressions with AND logic
-                if filter_expressions:
-                    combined_filter = filter_expressions[0]
-                    for expr in filter_expressions[1:]:
-                        combined_filter = combined_filter & expr
-                    query_params['FilterExpression'] = combined_filter
+            query_params = self._user_query_params(user_id, filters, attributes)
             
             # Add pagination token if provided
             if last_evaluated_key:
                 query_params['ExclusiveStartKey'] = last_evaluated_key
             
-            # Execute query
-            response = self.table.query(**query_params)
+            # Execute query, following pages so filtered results fill the limit
+            items, next_key = self._read_until_limit(self.table.query, query_params, limit)
             
             # Convert items to ImageMetadata
             metadata_list = [
                 ImageMetadata.from_dynamodb(item)
-                for item in response.get('Items', [])
+                for item in items
             ]
             
-            next_key = response.get('LastEvaluatedKey')
-            
-            logger.info(f"Successfully queried {len(metadata_list)} images with filters for user: {user_id}")
+            logger.info("Successfully queried %s images with filters for user: %s", len(metadata_list), user_id)
             return True, metadata_list, next_key, None
             
         except ClientError as e:
@@ -251,118 +748,210 @@ class DynamoDBService:
             logger.error(error_msg)
             return False, [], None, error_msg
     
-    def update_metadata(
+    def iter_query_with_filters(
         self,
-        image_id: str,
-        updates: Dict[str, Any]
-    ) -> tuple[bool, Optional[ImageMetadata], Optional[str]]:
+        user_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None,
+        page_size: int = QUERY_PAGE_SIZE
+    ) -> Iterator[ImageMetadata]:
+        """
+        Iterate over all of a user's images matching the filters, newest first.
+        
+        Holds one page in memory at a time. Errors are raised rather than returned.
+        
+        Args:
+            user_id: User ID
+            filters: Dictionary of filters (e.g., {'status': 'active', 'tags': ['vacation']})
+            attributes: Attributes to return (all attributes if not provided)
+            page_size: Items read per request
+        
+        Yields:
+            ImageMetadata for each matching image
+        
+        Raises:
+            ClientError: If a DynamoDB request fails
+        """
+        query_params = self._user_query_params(user_id, filters, attributes)
+        query_params['Limit'] = page_size
+        for item in self._iter_items(self.table.query, query_params):
+            yield ImageMetadata.from_dynamodb(item)
+    
+    def query_by_status(
+        self,
+        status: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        last_evaluated_key: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None
+    ) -> tuple[bool, List[ImageMetadata], Optional[Dict[str, Any]], Optional[str]]:
         """
-        Update image metadata.
+        Query images of every user by status using StatusIndex GSI.
         
         Args:
-            image_id: Image ID
-            updates: Dictionary of fields to update
+            status: Image status
+            filters: Dictionary of further filters (e.g., {'content_type': 'image/png'})
+            limit: Maximum number of items to return
+            last_evaluated_key: Pagination token
+            attributes: Attributes to return (all attributes if not provided)
         
         Returns:
-            Tuple of (success, updated_metadata, error_message)
+            Tuple of (success, metadata_list, next_key, error_message)
         """
         try:
-            # Build update expression
-            update_parts = []
-            expression_attribute_names = {}
-            expression_attribute_values = {}
-            
-            for key, value in updates.items():
-                # Skip primary key
-                if key == 'image_id':
-                    continue
-                
-                attr_name = f"#{key}"
-                attr_value = f":{key}"
-                
-                update_parts.append(f"{attr_name} = {attr_value}")
-                expression_attribute_names[attr_name] = key
-                expression_attribute_values[attr_value] = value
-            
-            if not update_parts:
-                return False, None, "No valid fields to update"
-            
-            update_expression = "SET " + ", ".join(update_parts)
-            
-            # Execute update
-            response = self.table.update_item(
-                Key={'image_id': image_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=expression_attribute_values,
-                ReturnValues='ALL_NEW'
+            query_params = self._status_query_params(status, filters, attributes)
+            
+            # Add pagination token if provided
+            if last_evaluated_key:
+                query_params['ExclusiveStartKey'] = last_evaluated_key
+            
+            # Execute query, following pages so filtered results fill the limit
+            items, next_key = self._read_until_limit(
+                self.table.query, query_params, limit, key_attributes=STATUS_INDEX_KEY_ATTRIBUTES
             )
             
-            # Convert to ImageMetadata
-            updated_metadata = ImageMetadata.from_dynamodb(response['Attributes'])
+            # Convert items to ImageMetadata
+            metadata_list = [
+                ImageMetadata.from_dynamodb(item)
+                for item in items
+            ]
             
-            logger.info(f"Successfully updated metadata for image: {image_id}")
-            return True, updated_metadata, None
+            logger.info("Successfully queried %s images with status: %s", len(metadata_list), status)
+            return True, metadata_list, next_key, None
             
         except ClientError as e:
-            error_msg = f"Failed to update metadata: {str(e)}"
+            error_msg = f"Failed to query by status: {str(e)}"
             logger.error(error_msg)
-            return False, None, error_msg
+            return False, [], None, error_msg
         except Exception as e:
-            error_msg = f"Unexpected error updating metadata: {str(e)}"
+            error_msg = f"Unexpected error querying by status: {str(e)}"
             logger.error(error_msg)
             return False, [], None, error_msg
     
-    def update_metadata(self, image_id: str, updates: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    @staticmethod
+    def _update_params(updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build the UpdateExpression and placeholder maps for update_metadata.
+        
+        Args:
+            updates: Dictionary of fields to update (see update_metadata)
+        
+        Returns:
+            UpdateItem parameters without Key, or None if there is nothing to update
+        """
+        set_parts = []
+        remove_parts = []
+        expr_attr_names = {}
+        expr_attr_values = {}
+        
+        for i, (key, value) in enumerate(updates.items()):
+            # The primary key cannot be updated
+            if key == 'image_id':
+                continue
+            
+            # Use attribute names to handle reserved keywords
+            attr_path = []
+            for j, part in enumerate(key.split('.')):
+                attr_name = f"#attr{i}" if j == 0 else f"#attr{i}_{j}"
+                expr_attr_names[attr_name] = part
+                attr_path.append(attr_name)
+            
+            if value is None:
+                remove_parts.append('.'.join(attr_path))
+                continue
+            
+            path = '.'.join(attr_path)
+            attr_value = f":val{i}"
+            if isinstance(value, Increment):
+                set_parts.append(f"{path} = if_not_exists({path}, {attr_value}_0) + {attr_value}")
+                expr_attr_values[attr_value] = value.amount
+                expr_attr_values[f"{attr_value}_0"] = 0
+            elif isinstance(value, Append):
+                set_parts.append(f"{path} = list_append(if_not_exists({path}, {attr_value}_0), {attr_value})")
+                expr_attr_values[attr_value] = list(value.values)
+                expr_attr_values[f"{attr_value}_0"] = []
+            else:
+                set_parts.append(f"{path} = {attr_value}")
+                expr_attr_values[attr_value] = value
+        
+        if not set_parts and not remove_parts:
+            return None
+        
+        clauses = []
+        if set_parts:
+            clauses.append("SET " + ", ".join(set_parts))
+        if remove_parts:
+            clauses.append("REMOVE " + ", ".join(remove_parts))
+        
+        params = {
+            'UpdateExpression': " ".join(clauses),
+            'ExpressionAttributeNames': expr_attr_names
+        }
+        if expr_attr_values:
+            params['ExpressionAttributeValues'] = expr_attr_values
+        return params
+    
+    def update_metadata(
+        self,
+        image_id: str,
+        updates: Dict[str, Any],
+        condition: Optional[ConditionBase] = None,
+        return_values: Optional[str] = None
+    ) -> tuple[bool, Optional[ImageMetadata], Optional[str]]:
         """
         Update image metadata fields.
         
+        Fields set to None are removed from the item. Increment and Append
+        values are applied atomically by DynamoDB, so counters and lists need
+        no read-modify-write.
+        
         Args:
             image_id: Image ID
-            updates: Dictionary of fields to update
+            updates: Dictionary of fields to update; a dotted key such as
+                'metadata.status_updated_at' sets a field inside a map attribute
+            condition: Optional condition the stored item must satisfy
+                (e.g. Attr('user_id').eq(user_id)); if it does not, nothing is
+                written and the error is CONDITIONAL_CHECK_FAILED. Defaults to
+                requiring that the item exists.
+            return_values: Optional DynamoDB ReturnValues ('ALL_OLD' or 'ALL_NEW')
+                to get the item as it was before or after the write
         
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (success, metadata, error_message); metadata is only set
+            when return_values is given
         """
         try:
-            # Build update expression
-            update_expr_parts = []
-            expr_attr_names = {}
-            expr_attr_values = {}
-            
-            for i, (key, value) in enumerate(updates.items()):
-                # Use attribute names to handle reserved keywords
-                attr_name = f"#attr{i}"
-                attr_value = f":val{i}"
-                
-                update_expr_parts.append(f"{attr_name} = {attr_value}")
-                expr_attr_names[attr_name] = key
-                expr_attr_values[attr_value] = value
+            update_params = self._update_params(updates)
+            if update_params is None:
+                return True, None, None  # Nothing to update
             
-            if not update_expr_parts:
-                return True, None  # Nothing to update
-            
-            update_expression = "SET " + ", ".join(update_expr_parts)
+            update_params['Key'] = {'image_id': image_id}
+            update_params['ConditionExpression'] = condition if condition is not None else _ITEM_EXISTS
+            if return_values is not None:
+                update_params['ReturnValues'] = return_values
             
             # Perform update
-            self.table.update_item(
-                Key={'image_id': image_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expr_attr_names,
-                ExpressionAttributeValues=expr_attr_values
-            )
+            response = self.table.update_item(**update_params)
+            self._invalidate([image_id])
             
-            logger.info(f"Successfully updated metadata for image: {image_id}")
-            return True, None
+            logger.info("Successfully updated metadata for image: %s", image_id)
+            metadata = None
+            if return_values is not None and response.get('Attributes'):
+                metadata = ImageMetadata.from_dynamodb(response['Attributes'])
+            return True, metadata, None
             
         except ClientError as e:
-            error_msg = f"Failed to update metadata: {str(e)}"
-            logger.error(error_msg)
-            return False, error_msg
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                logger.info("Update condition not met for image: %s", image_id)
+                error_msg = CONDITIONAL_CHECK_FAILED
+            else:
+                error_msg = f"Failed to update metadata: {str(e)}"
+                logger.error(error_msg)
         except Exception as e:
             error_msg = f"Unexpected error updating metadata: {str(e)}"
             logger.error(error_msg)
-            return False, error_msg
+        
+        return False, None, error_msg
     
     def delete_metadata(self, image_id: str) -> tuple[bool, Optional[str]]:
         """
@@ -376,8 +965,9 @@ class DynamoDBService:
         """
         try:
             self.table.delete_item(Key={'image_id': image_id})
+            self._invalidate([image_id])
             
-            logger.info(f"Successfully deleted metadata for image: {image_id}")
+            logger.info("Successfully deleted metadata for image: %s", image_id)
             return True, None
             
         except ClientError as e:
@@ -389,71 +979,230 @@ class DynamoDBService:
             logger.error(error_msg)
             return False, error_msg
     
+    def batch_save_metadata(
+        self,
+        items: List[ImageMetadata],
+        skip_validation: bool = False
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Save multiple image metadata items.
+        
+        Items are written with the table's batch writer, which sends
+        BatchWriteItem requests of up to 25 puts and resends unprocessed items.
+        Nothing is written if any item fails validation. The batch is not
+        atomic: on a service error some items may already be saved.
+        
+        Args:
+            items: ImageMetadata instances
+            skip_validation: Skip validation
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        try:
+            if not items:
+                return True, None
+            
+            if not skip_validation:
+                for metadata in items:
+                    is_valid, error = metadata.validate()
+                    if not is_valid:
+                        return False, f"Invalid metadata for image {metadata.image_id}: {error}"
+            
+            # overwrite_by_pkeys keeps only the last write per image_id, since
+            # BatchWriteItem rejects duplicate keys within a request
+            with self.table.batch_writer(overwrite_by_pkeys=list(TABLE_KEY_ATTRIBUTES)) as writer:
+                for metadata in items:
+                    writer.put_item(Item=metadata.to_dynamodb())
+            self._invalidate([metadata.image_id for metadata in items])
+            
+            logger.info("Successfully batch saved %s metadata items", len(items))
+            return True, None
+            
+        except ClientError as e:
+            error_msg = f"Failed to batch save metadata: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error batch saving metadata: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
+    def transact_save(
+        self,
+        items: List[ImageMetadata],
+        updates: Optional[Dict[str, Dict[str, Any]]] = None,
+        skip_validation: bool = False
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Create items and update existing ones atomically in one request.
+        
+        The writes are sent as a single TransactWriteItems call: either all of
+        them are applied or none is. New items must not exist yet and updated
+        items must exist; otherwise nothing is written and the error is
+        CONDITIONAL_CHECK_FAILED.
+        
+        Args:
+            items: ImageMetadata instances to create
+            updates: Optional mapping of image ID to fields to update
+                (same format as update_metadata)
+            skip_validation: Skip validation
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        try:
+            if not skip_validation:
+                for metadata in items:
+                    is_valid, error = metadata.validate()
+                    if not is_valid:
+                        return False, f"Invalid metadata for image {metadata.image_id}: {error}"
+            
+            actions = [
+                {'Put': {
+                    'TableName': self.table_name,
+                    'Item': metadata.to_dynamodb(),
+                    'ConditionExpression': _TRANSACT_ITEM_NOT_EXISTS
+                }}
+                for metadata in items
+            ]
+            for image_id, fields in (updates or {}).items():
+                update_params = self._update_params(fields)
+                if update_params is None:
+                    continue
+                update_params.update(
+                    TableName=self.table_name,
+                    Key={'image_id': image_id},
+                    ConditionExpression=_TRANSACT_ITEM_EXISTS
+                )
+                actions.append({'Update': update_params})
+            
+            if not actions:
+                return True, None
+            if len(actions) > TRANSACT_WRITE_LIMIT:
+                return False, f"Too many writes for one transaction (max {TRANSACT_WRITE_LIMIT})"
+            
+            self.table.meta.client.transact_write_items(TransactItems=actions)
+            self._invalidate([metadata.image_id for metadata in items] + list(updates or ()))
+            
+            logger.info("Successfully wrote %s metadata items in a transaction", len(actions))
+            return True, None
+            
+        except ClientError as e:
+            reasons = e.response.get('CancellationReasons') or []
+            if any(reason.get('Code') == 'ConditionalCheckFailed' for reason in reasons):
+                logger.info("Transaction condition not met")
+                return False, CONDITIONAL_CHECK_FAILED
+            error_msg = f"Failed to write metadata transaction: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error writing metadata transaction: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
+    def batch_delete_metadata(self, image_ids: List[str]) -> tuple[bool, Optional[str]]:
+        """
+        Delete multiple image metadata items (hard delete).
+        
+        Deletes are sent as BatchWriteItem requests of up to 25 keys by the
+        table's batch writer. The batch is not atomic.
+        
+        Args:
+            image_ids: List of image IDs
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        try:
+            if not image_ids:
+                return True, None
+            
+            with self.table.batch_writer(overwrite_by_pkeys=list(TABLE_KEY_ATTRIBUTES)) as writer:
+                for image_id in image_ids:
+                    writer.delete_item(Key={'image_id': image_id})
+            self._invalidate(image_ids)
+            
+            logger.info("Successfully batch deleted %s metadata items", len(image_ids))
+            return True, None
+            
+        except ClientError as e:
+            error_msg = f"Failed to batch delete metadata: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error batch deleting metadata: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
     def scan_with_filters(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        last_evaluated_key: Optional[Dict[str, Any]] = None
+        last_evaluated_key: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None,
+        consistent: bool = False
     ) -> tuple[bool, List[ImageMetadata], Optional[Dict[str, Any]], Optional[str]]:
         """
         Scan table with filters (use sparingly - prefer queries).
         
+        A 'user_id' filter is pushed down into a UserIndex query, which reads
+        only that user's images instead of the whole table. Otherwise a
+        'status' filter is pushed down into a StatusIndex query. Global
+        secondary indexes only support eventually consistent reads, so a
+        consistent scan always reads the table.
+        
         Args:
             filters: Dictionary of filters
             limit: Maximum number of items to return
             last_evaluated_key: Pagination token
+            attributes: Attributes to return (all attributes if not provided)
+            consistent: Use strongly consistent reads (twice the read capacity)
         
         Returns:
             Tuple of (success, metadata_list, next_key, error_message)
         """
+        if filters and filters.get('user_id') and not consistent:
+            remaining_filters = {key: value for key, value in filters.items() if key != 'user_id'}
+            return self.query_with_filters(
+                filters['user_id'],
+                filters=remaining_filters,
+                limit=limit,
+                last_evaluated_key=last_evaluated_key,
+                attributes=attributes
+            )
+        
+        if filters and filters.get('status') and not consistent:
+            remaining_filters = {key: value for key, value in filters.items() if key != 'status'}
+            return self.query_by_status(
+                filters['status'],
+                filters=remaining_filters,
+                limit=limit,
+                last_evaluated_key=last_evaluated_key,
+                attributes=attributes
+            )
+        
         try:
-            # Build scan parameters
-            scan_params = {'Limit': limit}
-            
-            # Build filter expression
-            if filters:
-                filter_expressions = []
-                
-                if 'status' in filters:
-                    filter_expressions.append(Attr('status').eq(filters['status']))
-                
-                if 'user_id' in filters:
-                    filter_expressions.append(Attr('user_id').eq(filters['user_id']))
-                
-                if 'tags' in filters and filters['tags']:
-                    tag_conditions = [Attr('tags').contains(tag) for tag in filters['tags']]
-                    if tag_conditions:
-                        combined = tag_conditions[0]
-                        for condition in tag_conditions[1:]:
-                            combined = combined | condition
-                        filter_expressions.append(combined)
-                
-                if 'content_type' in filters:
-                    filter_expressions.append(Attr('content_type').eq(filters['content_type']))
-                
-                # Combine filter expressions
-                if filter_expressions:
-                    combined_filter = filter_expressions[0]
-                    for expr in filter_expressions[1:]:
-                        combined_filter = combined_filter & expr
-                    scan_params['FilterExpression'] = combined_filter
+            scan_params = self._scan_params(filters, attributes)
+            if consistent:
+                scan_params['ConsistentRead'] = True
             
             # Add pagination token if provided
             if last_evaluated_key:
                 scan_params['ExclusiveStartKey'] = last_evaluated_key
             
-            # Execute scan
-            response = self.table.scan(**scan_params)
+            # Execute scan, following pages so filtered results fill the limit
+            items, next_key = self._read_until_limit(
+                self.table.scan, scan_params, limit, key_attributes=TABLE_KEY_ATTRIBUTES
+            )
             
             # Convert items to ImageMetadata
             metadata_list = [
                 ImageMetadata.from_dynamodb(item)
-                for item in response.get('Items', [])
+                for item in items
             ]
             
-            next_key = response.get('LastEvaluatedKey')
-            
-            logger.info(f"Successfully scanned {len(metadata_list)} images")
+            logger.info("Successfully scanned %s images", len(metadata_list))
             return True, metadata_list, next_key, None
             
         except ClientError as e:
@@ -465,15 +1214,162 @@ class DynamoDBService:
             logger.error(error_msg)
             return False, [], None, error_msg
     
+    def iter_scan_with_filters(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None,
+        page_size: int = QUERY_PAGE_SIZE
+    ) -> Iterator[ImageMetadata]:
+        """
+        Iterate over every image matching the filters, one page in memory at a time.
+        
+        Reads the whole table (use sparingly - prefer iter_query_by_user).
+        Errors are raised rather than returned.
+        
+        Args:
+            filters: Dictionary of filters
+            attributes: Attributes to return (all attributes if not provided)
+            page_size: Items read per request
+        
+        Yields:
+            ImageMetadata for each matching image
+        
+        Raises:
+            ClientError: If a DynamoDB request fails
+        """
+        scan_params = self._scan_params(filters, attributes)
+        scan_params['Limit'] = page_size
+        for item in self._iter_items(self.table.scan, scan_params):
+            yield ImageMetadata.from_dynamodb(item)
+    
+    def parallel_scan_with_filters(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None,
+        total_segments: int = SCAN_SEGMENTS,
+        page_size: int = QUERY_PAGE_SIZE
+    ) -> Iterator[ImageMetadata]:
+        """
+        Iterate over every image matching the filters, scanning table segments in parallel.
+        
+        Each segment is read to exhaustion by its own thread through the
+        resource's thread-safe low-level client. Pages are handed to the caller
+        as they arrive, so items from different segments are interleaved in no
+        particular order. Workers stop after their current page if the caller
+        stops iterating. Errors are raised rather than returned.
+        
+        Args:
+            filters: Dictionary of filters
+            attributes: Attributes to return (all attributes if not provided)
+            total_segments: Number of segments (and threads)
+            page_size: Items read per request
+        
+        Yields:
+            ImageMetadata for each matching image
+        
+        Raises:
+            ClientError: If a DynamoDB request fails
+        """
+        client = self.dynamodb.meta.client
+        pages: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        
+        def scan_segment(segment: int) -> None:
+            scan_params = self._scan_params(filters, attributes)
+            scan_params.update(
+                TableName=self.table_name,
+                Segment=segment,
+                TotalSegments=total_segments,
+                Limit=page_size
+            )
+            try:
+                while not stop.is_set():
+                    response = client.scan(**scan_params)
+                    pages.put(response.get('Items', []))
+                    next_key = response.get('LastEvaluatedKey')
+                    if not next_key:
+                        break
+                    scan_params['ExclusiveStartKey'] = next_key
+            except Exception as e:
+                pages.put(e)
+            finally:
+                # None marks the end of a segment
+                pages.put(None)
+        
+        executor = ThreadPoolExecutor(max_workers=total_segments)
+        try:
+            for segment in range(total_segments):
+                executor.submit(scan_segment, segment)
+            
+            remaining = total_segments
+            while remaining:
+                page = pages.get()
+                if page is None:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield ImageMetadata.from_dynamodb(item)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+    
+    def _batch_get_chunk(
+        self,
+        keys: List[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch up to BATCH_GET_LIMIT items, retrying unprocessed keys with backoff.
+        
+        Uses the resource's low-level client, which is safe to share across
+        threads and still returns items deserialized to native types.
+        
+        Args:
+            keys: Primary keys to fetch
+            options: Extra per-table request parameters (projection, ConsistentRead)
+        
+        Returns:
+            Tuple of (items, number_of_keys_left_unprocessed)
+        """
+        client = self.dynamodb.meta.client
+        # UnprocessedKeys echoes these options back, so retries keep them
+        request_items = {self.table_name: {'Keys': keys, **(options or {})}}
+        items = []
+        
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                # Exponential backoff with full jitter before retrying throttled keys
+                time.sleep(random.uniform(0, BATCH_GET_BACKOFF_BASE * 2 ** attempt))
+            
+            response = client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(self.table_name, []))
+            
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                return items, 0
+        
+        return items, len(request_items.get(self.table_name, {}).get('Keys', []))
+    
     def batch_get_metadata(
         self,
-        image_ids: List[str]
+        image_ids: List[str],
+        attributes: Optional[List[str]] = None,
+        consistent: bool = False
     ) -> tuple[bool, List[ImageMetadata], Optional[str]]:
         """
-        Get multiple image metadata items in a single request.
+        Get multiple image metadata items.
+        
+        Cached items are returned without a read; the remaining IDs are fetched
+        in BatchGetItem requests of up to 100 keys, issued in parallel when
+        there is more than one. Results are not in input order.
         
         Args:
             image_ids: List of image IDs
+            attributes: Attributes to return (all attributes if not provided)
+            consistent: Use strongly consistent reads (twice the read capacity;
+                cached items are not used)
         
         Returns:
             Tuple of (success, metadata_list, error_message)
@@ -482,32 +1378,60 @@ class DynamoDBService:
             if not image_ids:
                 return True, [], None
             
-            # DynamoDB batch_get_item has a limit of 100 items
-            if len(image_ids) > 100:
-                return False, [], "Cannot fetch more than 100 items at once"
-            
-            # Build keys
-            keys = [{'image_id': image_id} for image_id in image_ids]
-            
-            # Execute batch get using DynamoDB client (resource doesn't expose batch_get_item)
-            aws_config = self.settings.get_aws_config()
-            dynamo_client = boto3.client('dynamodb', **aws_config)
-            response = dynamo_client.batch_get_item(
-                RequestItems={
-                    self.table_name: {
-                        'Keys': keys
-                    }
-                }
-            )
+            # BatchGetItem rejects duplicate keys within a request
+            cached = []
+            keys = []
+            for image_id in dict.fromkeys(image_ids):
+                metadata = None
+                if self._metadata_cache is not None and not consistent:
+                    metadata = self._metadata_cache.get(image_id)
+                if metadata is not None:
+                    cached.append(metadata.copy())
+                else:
+                    keys.append({'image_id': image_id})
+            
+            if not keys:
+                return True, cached, None
+            
+            if self._metadata_cache is not None:
+                generation = self._metadata_cache.generation()
+            
+            chunks = [keys[i:i + BATCH_GET_LIMIT] for i in range(0, len(keys), BATCH_GET_LIMIT)]
+            
+            # Request options repeated in every chunk's RequestItems entry
+            options = {}
+            if attributes:
+                options.update(self._projection_params(
+                    self._with_key_attributes(attributes, ITEM_REQUIRED_ATTRIBUTES)
+                ))
+            if consistent:
+                options['ConsistentRead'] = True
+            
+            if len(chunks) == 1:
+                results = [self._batch_get_chunk(chunks[0], options)]
+            else:
+                results = list(self._get_executor().map(
+                    lambda chunk: self._batch_get_chunk(chunk, options), chunks
+                ))
+            
+            unprocessed = sum(count for _, count in results)
+            if unprocessed:
+                error_msg = f"Failed to batch get metadata: {unprocessed} keys left unprocessed after retries"
+                logger.error(error_msg)
+                return False, [], error_msg
             
             # Convert items to ImageMetadata
-            items = response.get('Responses', {}).get(self.table_name, [])
-            metadata_list = [
+            fetched = [
                 ImageMetadata.from_dynamodb(item)
+                for items, _ in results
                 for item in items
             ]
+            if not attributes and self._metadata_cache is not None:
+                for metadata in fetched:
+                    self._metadata_cache.set(metadata.image_id, metadata.copy(), generation)
             
-            logger.info(f"Successfully batch retrieved {len(metadata_list)} metadata items")
+            metadata_list = cached + fetched
+            logger.info("Successfully batch retrieved %s metadata items", len(metadata_list))
             return True, metadata_list, None
             
         except ClientError as e:
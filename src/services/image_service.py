@@ -6,10 +6,12 @@ Note: With presigned URLs, files never go through Lambda, so no image processing
 
 from typing import Optional, List, Dict, Any, Tuple
 
+from boto3.dynamodb.conditions import Attr
+
 from src.config.settings import Settings
 from src.models.image_metadata import ImageMetadata
 from src.services.s3_service import S3Service
-from src.services.dynamodb_service import DynamoDBService
+from src.services.dynamodb_service import DynamoDBService, CONDITIONAL_CHECK_FAILED
 from src.utils.logger import get_logger
 from src.utils.validators import (
     validate_content_type,
@@ -23,6 +25,16 @@ from src.utils.validators import (
 
 logger = get_logger(__name__)
 
+# Attributes returned by listing endpoints; full records (s3 location and the
+# free-form metadata map) are only read when a single image is fetched
+LIST_ATTRIBUTES = [
+    'image_id', 'user_id', 'filename', 'content_type', 'size', 'upload_timestamp',
+    'tags', 'description', 'width', 'height', 'status'
+]
+
+# Attributes needed to authorize and sign a download URL
+PRESIGN_ATTRIBUTES = ['image_id', 'user_id', 'status', 's3_key']
+
 
 class ImageService:
     """
@@ -67,8 +79,8 @@ class ImageService:
             Tuple of (success, metadata, content, error_message)
         """
         try:
-            # Get metadata
-            success, metadata, error = self.dynamodb_service.get_metadata(image_id)
+            # Get metadata; the ownership and deleted checks need the stored item
+            success, metadata, error = self.dynamodb_service.get_metadata(image_id, use_cache=False)
             if not success:
                 return False, None, None, f"Failed to get metadata: {error}"
             
@@ -88,7 +100,7 @@ class ImageService:
             if not success:
                 return False, None, None, f"Failed to get image content: {error}"
             
-            logger.info(f"Successfully retrieved image: {image_id}")
+            logger.info("Successfully retrieved image: %s", image_id)
             return True, metadata, content, None
             
         except Exception as e:
@@ -104,6 +116,9 @@ class ImageService:
         """
         Get image metadata only.
         
+        Repeated lookups within a warm container are served from
+        DynamoDBService's metadata cache.
+        
         Args:
             image_id: Image ID
             user_id: User ID (for authorization)
@@ -124,7 +139,7 @@ class ImageService:
             if metadata.user_id != user_id:
                 return False, None, "Unauthorized access"
             
-            logger.info(f"Successfully retrieved metadata: {image_id}")
+            logger.info("Successfully retrieved metadata: %s", image_id)
             return True, metadata, None
             
         except Exception as e:
@@ -156,13 +171,14 @@ class ImageService:
                 user_id=user_id,
                 status=status,
                 limit=limit,
-                last_evaluated_key=last_evaluated_key
+                last_evaluated_key=last_evaluated_key,
+                attributes=LIST_ATTRIBUTES
             )
             
             if not success:
                 return False, [], None, f"Failed to list images: {error}"
             
-            logger.info(f"Successfully listed {len(metadata_list)} images for user: {user_id}")
+            logger.info("Successfully listed %s images for user: %s", len(metadata_list), user_id)
             return True, metadata_list, next_key, None
             
         except Exception as e:
@@ -215,13 +231,14 @@ class ImageService:
                 user_id=user_id,
                 filters=filters,
                 limit=limit,
-                last_evaluated_key=last_evaluated_key
+                last_evaluated_key=last_evaluated_key,
+                attributes=LIST_ATTRIBUTES
             )
             
             if not success:
                 return False, [], None, f"Failed to search images: {error}"
             
-            logger.info(f"Successfully searched {len(metadata_list)} images for user: {user_id}")
+            logger.info("Successfully searched %s images for user: %s", len(metadata_list), user_id)
             return True, metadata_list, next_key, None
             
         except Exception as e:
@@ -248,7 +265,7 @@ class ImageService:
         """
         try:
             # Get current metadata to check authorization
-            success, metadata, error = self.dynamodb_service.get_metadata(image_id)
+            success, metadata, error = self.dynamodb_service.get_metadata(image_id, use_cache=False)
             if not success:
                 return False, None, f"Failed to get metadata: {error}"
             
@@ -279,13 +296,14 @@ class ImageService:
             # Update metadata
             success, updated_metadata, error = self.dynamodb_service.update_metadata(
                 image_id=image_id,
-                updates=updates
+                updates=updates,
+                return_values='ALL_NEW'
             )
             
             if not success:
                 return False, None, f"Failed to update metadata: {error}"
             
-            logger.info(f"Successfully updated metadata for image: {image_id}")
+            logger.info("Successfully updated metadata for image: %s", image_id)
             return True, updated_metadata, None
             
         except Exception as e:
@@ -311,8 +329,34 @@ class ImageService:
             Tuple of (success, error_message)
         """
         try:
-            # Get metadata to check authorization
-            success, metadata, error = self.dynamodb_service.get_metadata(image_id)
+            if soft_delete:
+                # Soft delete: update status only if the image exists and belongs
+                # to the user, checked by DynamoDB in the same request
+                success, _, error = self.dynamodb_service.update_metadata(
+                    image_id=image_id,
+                    updates={'status': 'deleted'},
+                    condition=Attr('user_id').eq(user_id)
+                )
+                
+                if success:
+                    logger.info("Successfully soft-deleted image: %s", image_id)
+                    return True, None
+                
+                if error != CONDITIONAL_CHECK_FAILED:
+                    return False, f"Failed to mark image as deleted: {error}"
+                
+                # The condition failed: read the item to report why
+                success, metadata, error = self.dynamodb_service.get_metadata(image_id, use_cache=False)
+                if not success:
+                    return False, f"Failed to get metadata: {error}"
+                
+                if not metadata:
+                    return False, "Image not found"
+                
+                return False, "Unauthorized access"
+            
+            # Get metadata to check authorization and find the S3 object
+            success, metadata, error = self.dynamodb_service.get_metadata(image_id, use_cache=False)
             if not success:
                 return False, f"Failed to get metadata: {error}"
             
@@ -323,33 +367,20 @@ class ImageService:
             if metadata.user_id != user_id:
                 return False, "Unauthorized access"
             
-            if soft_delete:
-                # Soft delete: Update status
-                success, error = self.dynamodb_service.update_metadata(
-                    image_id=image_id,
-                    updates={'status': 'deleted'}
-                )
-                
-                if not success:
-                    return False, f"Failed to mark image as deleted: {error}"
-                
-                logger.info(f"Successfully soft-deleted image: {image_id}")
-                return True, None
-            else:
-                # Hard delete: Remove from S3 and DynamoDB
-                # Delete from S3 first
-                success, error = self.s3_service.delete_image(metadata.s3_key)
-                if not success:
-                    logger.warning(f"Failed to delete from S3: {error}")
-                    # Continue with DynamoDB deletion anyway
-                
-                # Delete from DynamoDB
-                success, error = self.dynamodb_service.delete_metadata(image_id)
-                if not success:
-                    return False, f"Failed to delete metadata: {error}"
-                
-                logger.info(f"Successfully hard-deleted image: {image_id}")
-                return True, None
+            # Hard delete: Remove from S3 and DynamoDB
+            # Delete from S3 first
+            success, error = self.s3_service.delete_image(metadata.s3_key)
+            if not success:
+                logger.warning("Failed to delete from S3: %s", error)
+                # Continue with DynamoDB deletion anyway
+            
+            # Delete from DynamoDB
+            success, error = self.dynamodb_service.delete_metadata(image_id)
+            if not success:
+                return False, f"Failed to delete metadata: {error}"
+            
+            logger.info("Successfully hard-deleted image: %s", image_id)
+            return True, None
             
         except Exception as e:
             error_msg = f"Unexpected error deleting image: {str(e)}"
@@ -374,8 +405,13 @@ class ImageService:
             Tuple of (success, presigned_url, error_message)
         """
         try:
-            # Get metadata to check authorization
-            success, metadata, error = self.dynamodb_service.get_metadata(image_id)
+            # One uncached read covers existence, ownership, status and the S3 key,
+            # so an image deleted by another container is not served
+            success, metadata, error = self.dynamodb_service.get_metadata(
+                image_id,
+                attributes=PRESIGN_ATTRIBUTES,
+                use_cache=False
+            )
             if not success:
                 return False, None, f"Failed to get metadata: {error}"
             
@@ -399,7 +435,7 @@ class ImageService:
             if not success:
                 return False, None, f"Failed to generate presigned URL: {error}"
             
-            logger.info(f"Successfully generated presigned URL for image: {image_id}")
+            logger.info("Successfully generated presigned URL for image: %s", image_id)
             return True, presigned_url, None
             
         except Exception as e:
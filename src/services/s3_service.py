@@ -2,17 +2,45 @@
 S3Service for managing image storage operations.
 """
 
+import os
 from typing import Optional, Dict, Any, BinaryIO
+from urllib.parse import quote
 import boto3
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
 from botocore.exceptions import ClientError
 from io import BytesIO
 
 from src.config.settings import Settings
 from src.utils.logger import get_logger
+from src.utils.time_utils import utc_now
 
 
 logger = get_logger(__name__)
 
+# Session shared by every S3Service created without explicit credentials.
+# Creating a boto3 Session loads botocore's data files, which is a noticeable
+# part of a cold start, so it is only done once per container
+_default_session: Optional[boto3.Session] = None
+
+
+def _get_session(credentials: Dict[str, str]) -> boto3.Session:
+    """
+    Get a boto3 Session for the given credentials.
+    
+    Args:
+        credentials: Explicit AWS credentials (may be empty)
+    
+    Returns:
+        A new Session if credentials are given, otherwise the shared one
+    """
+    global _default_session
+    if credentials:
+        return boto3.Session(**credentials)
+    if _default_session is None:
+        _default_session = boto3.Session()
+    return _default_session
+
 
 class S3Service:
     """Service for S3 operations."""
@@ -27,15 +55,26 @@ class S3Service:
         self.settings = settings or Settings()
         
         # Get S3 config
-        s3_config = self.settings.get_s3_config()
+        s3_config = dict(self.settings.get_s3_config())
         self.bucket_name = s3_config.pop('bucket_name', self.settings.S3_BUCKET_NAME)
         self.key_prefix = s3_config.pop('key_prefix', '')
         self.presigned_url_expiry = s3_config.pop('presigned_url_expiry', self.settings.S3_PRESIGNED_URL_EXPIRATION)
         
-        # Create S3 client with remaining config (AWS credentials and endpoint)
-        self.s3_client = boto3.client('s3', **s3_config)
+        # Endpoint and region used when signing download URLs locally
+        self.endpoint_url = s3_config.get('endpoint_url')
+        self.region_name = s3_config.get('region_name') or self.settings.AWS_REGION
         
-        logger.info(f"S3Service initialized with bucket: {self.bucket_name}")
+        # Create S3 client with remaining config (AWS credentials and endpoint).
+        # The session is kept so download URLs can be signed with its credentials
+        credentials = {
+            key: s3_config.pop(key)
+            for key in ('aws_access_key_id', 'aws_secret_access_key')
+            if key in s3_config
+        }
+        self._session = _get_session(credentials)
+        self.s3_client = self._session.client('s3', **s3_config)
+        
+        logger.info("S3Service initialized with bucket: %s", self.bucket_name)
     
     def _generate_s3_key(self, user_id: str, filename: str) -> str:
         """
@@ -48,12 +87,10 @@ class S3Service:
         Returns:
             S3 key path
         """
-        import uuid
-        from datetime import datetime
-        
-        # Add timestamp and UUID to make keys unique
-        timestamp = datetime.utcnow().strftime('%Y%m%d')
-        unique_id = str(uuid.uuid4())[:8]
+        # Add timestamp and random suffix to make keys unique; 4 random bytes
+        # give the same 8 hex characters as a truncated UUID without building one
+        timestamp = utc_now().strftime('%Y%m%d')
+        unique_id = os.urandom(4).hex()
         
         # Format: images/{user_id}/{timestamp}/{unique_id}_{filename}
         return f"{self.key_prefix}{user_id}/{timestamp}/{unique_id}_{filename}"
@@ -96,7 +133,7 @@ class S3Service:
                 Metadata=s3_metadata
             )
             
-            logger.info(f"Successfully uploaded image: {s3_key}")
+            logger.info("Successfully uploaded image: %s", s3_key)
             return True, s3_key, None
             
         except ClientError as e:
@@ -141,7 +178,7 @@ class S3Service:
                 ExpiresIn=expiry_seconds
             )
             
-            logger.info(f"Generated presigned upload URL for: {s3_key}")
+            logger.info("Generated presigned upload URL for: %s", s3_key)
             return True, presigned_url, s3_key, None
             
         except ClientError as e:
@@ -153,6 +190,45 @@ class S3Service:
             logger.error(error_msg)
             return False, None, None, error_msg
     
+    def _sign_download_url(self, s3_key: str, expiry_seconds: int) -> Optional[str]:
+        """
+        Build a SigV4 query-signed GET URL without going through the client.
+        
+        Signing is a local HMAC computation; doing it directly skips botocore's
+        operation model, parameter serialization and event hooks. Returns None
+        when the session's credentials are unavailable so the caller can fall
+        back to the client presigner.
+        
+        Args:
+            s3_key: S3 object key
+            expiry_seconds: URL expiry in seconds
+        
+        Returns:
+            Presigned URL, or None if it cannot be signed locally
+        """
+        credentials = self._session.get_credentials()
+        if credentials is None:
+            return None
+        
+        credentials = credentials.get_frozen_credentials()
+        if not isinstance(credentials.access_key, str) or not isinstance(credentials.secret_key, str):
+            return None
+        
+        quoted_key = quote(s3_key, safe='/~')
+        if self.endpoint_url:
+            # Custom endpoints (LocalStack) use path-style addressing
+            url = f"{self.endpoint_url.rstrip('/')}/{self.bucket_name}/{quoted_key}"
+        elif '.' in self.bucket_name:
+            # A dotted bucket name in the host would not match the
+            # *.s3.amazonaws.com certificate, so it goes in the path
+            url = f"https://s3.{self.region_name}.amazonaws.com/{self.bucket_name}/{quoted_key}"
+        else:
+            url = f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com/{quoted_key}"
+        
+        request = AWSRequest(method='GET', url=url)
+        S3SigV4QueryAuth(credentials, 's3', self.region_name, expires=expiry_seconds).add_auth(request)
+        return request.url
+    
     def generate_presigned_download_url(
         self,
         s3_key: str,
@@ -171,6 +247,11 @@ class S3Service:
         try:
             expiry_seconds = expiry or self.presigned_url_expiry
             
+            presigned_url = self._sign_download_url(s3_key, expiry_seconds)
+            if presigned_url:
+                logger.info("Generated presigned download URL for: %s", s3_key)
+                return True, presigned_url, None
+            
             presigned_url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={
@@ -180,7 +261,7 @@ class S3Service:
                 ExpiresIn=expiry_seconds
             )
             
-            logger.info(f"Generated presigned download URL for: {s3_key}")
+            logger.info("Generated presigned download URL for: %s", s3_key)
             return True, presigned_url, None
             
         except ClientError as e:
@@ -208,7 +289,7 @@ class S3Service:
                 Key=s3_key
             )
             
-            logger.info(f"Successfully deleted image: {s3_key}")
+            logger.info("Successfully deleted image: %s", s3_key)
             return True, None
             
         except ClientError as e:
@@ -301,7 +382,7 @@ class S3Service:
             content = response['Body'].read()
             content_type = response.get('ContentType', 'application/octet-stream')
             
-            logger.info(f"Successfully retrieved image content: {s3_key}")
+            logger.info("Successfully retrieved image content: %s", s3_key)
             return True, content, content_type, None
             
         except ClientError as e:
@@ -342,7 +423,7 @@ class S3Service:
                 'metadata': response.get('Metadata', {})
             }
             
-            logger.info(f"Successfully retrieved metadata for: {s3_key}")
+            logger.info("Successfully retrieved metadata for: %s", s3_key)
             return True, metadata, None
             
         except ClientError as e:
@@ -0,0 +1,74 @@
+"""
+JSON serialization helpers for the image service.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Union
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert values DynamoDB returns that JSON has no type for.
+    
+    Numbers come back as Decimal (integral ones become int, others float)
+    and string/number sets as set.
+    
+    Args:
+        obj: Value the encoder could not serialize
+    
+    Returns:
+        JSON-serializable replacement
+    
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+    
+    Decimal and set values read from DynamoDB are converted (see _default).
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON document as bytes
+    """
+    return dumps(obj).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON document as str
+    """
+    return json.dumps(obj, separators=(',', ':'), default=_default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    return json.loads(data)
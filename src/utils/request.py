@@ -0,0 +1,48 @@
+"""
+Request parsing utilities for Lambda handlers.
+"""
+
+import base64
+from typing import Dict, Any
+
+from src.utils import json_utils
+
+
+def get_headers(event: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get request headers with lower-cased names.
+
+    HTTP header names are case-insensitive, so lower-casing them once lets
+    handlers read e.g. 'user-id' with a single lookup however the client sent it.
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        Dictionary of headers keyed by lower-cased name
+    """
+    headers = event.get('headers') or {}
+    return {name.lower(): value for name, value in headers.items()}
+
+
+def parse_json_body(body: str, is_base64: bool = False) -> Any:
+    """
+    Parse a JSON request body, decoding it from base64 if flagged.
+    
+    API Gateway sometimes flags plain JSON bodies as base64. A base64 string can
+    never start with '{' or '[', so such bodies are parsed as-is, without a
+    failed decode first. Decoded bytes are parsed directly, with no UTF-8 str copy.
+    
+    Args:
+        body: Raw request body
+        is_base64: Value of the event's isBase64Encoded flag
+    
+    Returns:
+        Parsed JSON document
+    
+    Raises:
+        ValueError: If the body is not valid base64 or JSON
+    """
+    if is_base64 and not body.lstrip().startswith(('{', '[')):
+        body = base64.b64decode(body)
+    return json_utils.loads(body)
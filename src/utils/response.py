@@ -4,8 +4,9 @@ Provides consistent response structure across all Lambda handlers.
 """
 
 from typing import Any, Dict, Optional, List, Union
-import json
-from datetime import datetime
+
+from src.utils import json_utils
+from src.utils.time_utils import utc_timestamp
 
 
 def success_response(
@@ -32,11 +33,11 @@ def success_response(
             'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
             'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
         },
-        'body': json.dumps({
+        'body': json_utils.dumps({
             'success': True,
             'message': message,
             'data': data,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': utc_timestamp()
         })
     }
 
@@ -62,7 +63,7 @@ def error_response(
     body = {
         'success': False,
         'message': message,
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': utc_timestamp()
     }
     
     if error_code:
@@ -79,7 +80,7 @@ def error_response(
             'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
             'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
         },
-        'body': json.dumps(body)
+        'body': json_utils.dumps(body)
     }
 
 
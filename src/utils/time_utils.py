@@ -0,0 +1,36 @@
+"""
+Timestamp helpers for the image service.
+All timestamps are UTC and formatted as ISO 8601 with a 'Z' suffix.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+_UTC = timezone.utc
+_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+
+def utc_now() -> datetime:
+    """
+    Get the current time as a timezone-aware UTC datetime.
+
+    Returns:
+        Current UTC datetime
+    """
+    return datetime.now(_UTC)
+
+
+def utc_timestamp(offset_seconds: float = 0) -> str:
+    """
+    Get an ISO 8601 UTC timestamp, e.g. '2024-01-01T12:00:00.000000Z'.
+
+    Args:
+        offset_seconds: Seconds to add to the current time (e.g. for expiry times)
+
+    Returns:
+        Formatted timestamp
+    """
+    now = datetime.now(_UTC)
+    if offset_seconds:
+        now += timedelta(seconds=offset_seconds)
+    return now.strftime(_ISO_FORMAT)
@@ -5,9 +5,21 @@ Note: Since we use presigned URLs, files never go through Lambda, so no PIL/imag
 """
 
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 
+# Patterns are compiled once at import rather than on every validation call
+_USER_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_TAG_RE = re.compile(r'^[a-zA-Z0-9 _-]+$')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+# Warm containers see the same user and image IDs repeatedly; the bound keeps
+# adversarial inputs from growing the cache without limit
+_ID_CACHE_SIZE = 2048
+
+
 def validate_content_type(content_type: str, allowed_types: Optional[List[str]] = None) -> Tuple[bool, Optional[str]]:
     """
     Validate image content type.
@@ -19,14 +31,18 @@ def validate_content_type(content_type: str, allowed_types: Optional[List[str]]
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if not content_type:
+        return False, "Content type is required"
+    
     if allowed_types is None:
+        # Default list: O(1) lookup in the frozenset Settings builds at import
         from src.config.settings import settings
         allowed_types = settings.ALLOWED_CONTENT_TYPES
+        is_allowed = settings.validate_content_type(content_type)
+    else:
+        is_allowed = content_type.lower() in {ct.lower() for ct in allowed_types}
     
-    if not content_type:
-        return False, "Content type is required"
-    
-    if content_type.lower() not in [ct.lower() for ct in allowed_types]:
+    if not is_allowed:
         return False, f"Content type '{content_type}' is not allowed. Allowed types: {', '.join(allowed_types)}"
     
     return True, None
@@ -74,11 +90,25 @@ def validate_user_id(user_id: str) -> Tuple[bool, Optional[str]]:
     if not isinstance(user_id, str):
         return False, "User ID must be a string"
     
+    return _validate_user_id_format(user_id)
+
+
+@lru_cache(maxsize=_ID_CACHE_SIZE)
+def _validate_user_id_format(user_id: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate the length and characters of a non-empty user ID string.
+    
+    Args:
+        user_id: User identifier
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
     if len(user_id) < 3 or len(user_id) > 128:
         return False, "User ID must be between 3 and 128 characters"
     
     # Allow alphanumeric, hyphens, and underscores
-    if not re.match(r'^[a-zA-Z0-9_-]+$', user_id):
+    if not _USER_ID_RE.match(user_id):
         return False, "User ID can only contain letters, numbers, hyphens, and underscores"
     
     return True, None
@@ -113,7 +143,7 @@ def validate_tags(tags: List[str], max_tags: int = 10, max_tag_length: int = 50)
             return False, f"Tag '{tag[:20]}...' exceeds maximum length of {max_tag_length} characters"
         
         # Allow alphanumeric, spaces, hyphens, and underscores
-        if not re.match(r'^[a-zA-Z0-9 _-]+$', tag):
+        if not _TAG_RE.match(tag):
             return False, f"Tag '{tag}' contains invalid characters"
     
     return True, None
@@ -137,7 +167,7 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     filename = filename.split('/')[-1].split('\\')[-1]
     
     # Replace dangerous characters with underscores
-    filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -190,9 +220,30 @@ def validate_image_id(image_id: str) -> Tuple[bool, Optional[str]]:
     if not image_id:
         return False, "Image ID is required"
     
-    # UUID format validation
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    if not re.match(uuid_pattern, image_id.lower()):
+    if not isinstance(image_id, str):
+        return False, "Invalid image ID format"
+    
+    return _validate_image_id_format(image_id)
+
+
+@lru_cache(maxsize=_ID_CACHE_SIZE)
+def _validate_image_id_format(image_id: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate that a non-empty string is a UUID.
+    
+    Args:
+        image_id: Image identifier
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # UUID format validation: fixed length and hyphen positions, then 32 hex digits
+    if (len(image_id) != 36 or image_id[8] != '-' or image_id[13] != '-'
+            or image_id[18] != '-' or image_id[23] != '-'):
+        return False, "Invalid image ID format"
+    
+    hex_digits = image_id.replace('-', '')
+    if len(hex_digits) != 32 or not _HEX_DIGITS.issuperset(hex_digits):
         return False, "Invalid image ID format"
     
     return True, None
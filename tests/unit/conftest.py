@@ -0,0 +1,20 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+
+from src.handlers import common
+from src.services import s3_service
+
+
+@pytest.fixture(autouse=True)
+def reset_handler_services():
+    """Drop services shared by handlers so each test sees its own mocks."""
+    def reset():
+        common.reset_services()
+        s3_service._default_session = None
+    
+    reset()
+    yield
+    reset()
@@ -0,0 +1,90 @@
+"""
+Unit tests for cache module.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock():
+    """Patch the cache's monotonic clock with a controllable one."""
+    with patch('src.utils.cache.time.monotonic') as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        yield mock_monotonic
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+    
+    def test_get_missing(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        assert cache.get('a') is None
+        assert cache.get('a', 'default') == 'default'
+    
+    def test_entry_valid_until_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set('a', 1)
+        
+        clock.return_value = 1009.9
+        assert cache.get('a') == 1
+        
+        clock.return_value = 1010.0
+        assert cache.get('a') is None
+        assert len(cache) == 0
+    
+    def test_set_refreshes_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set('a', 1)
+        clock.return_value = 1005.0
+        cache.set('a', 2)
+        
+        clock.return_value = 1012.0
+        assert cache.get('a') == 2
+    
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+    
+    def test_zero_maxsize_stores_nothing(self, clock):
+        cache = TTLCache(maxsize=0, ttl=10)
+        cache.set('a', 1)
+        assert cache.get('a') is None
+    
+    def test_pop(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.pop('a')
+        cache.pop('missing')
+        
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+    
+    def test_clear(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.clear()
+        
+        assert len(cache) == 0
+    
+    def test_set_skipped_after_invalidation(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        generation = cache.generation()
+        cache.pop('a')
+        cache.set('a', 'stale', generation)
+        
+        assert cache.get('a') is None
+        
+        cache.set('a', 'fresh', cache.generation())
+        assert cache.get('a') == 'fresh'
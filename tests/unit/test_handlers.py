@@ -20,7 +20,7 @@ class TestGetHandler:
         context.function_name = 'get-handler'
         return context
     
-    @patch('src.handlers.get_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_successful_get(self, mock_service_class, mock_context):
         """Test successful retrieval of image metadata."""
         event = {
@@ -33,6 +33,7 @@ class TestGetHandler:
         mock_metadata.image_id = '550e8400-e29b-41d4-a716-446655440000'
         mock_metadata.filename = 'test.jpg'
         mock_metadata.user_id = 'test-user-123'
+        mock_metadata.to_response.return_value = {'image_id': mock_metadata.image_id}
         mock_service.get_image_metadata.return_value = (True, mock_metadata, None)
         mock_service_class.return_value = mock_service
         
@@ -49,7 +50,9 @@ class TestGetHandler:
 
         response = get_lambda_handler(event, mock_context)
 
-        assert response['statusCode'] == 422    def test_invalid_image_id(self, mock_context):
+        assert response['statusCode'] == 422
+    
+    def test_invalid_image_id(self, mock_context):
         """Test error with invalid image_id format."""
         event = {
             'pathParameters': {'image_id': 'not-a-uuid'},
@@ -60,7 +63,7 @@ class TestGetHandler:
 
         assert response['statusCode'] == 422
     
-    @patch('src.handlers.get_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_image_not_found(self, mock_service_class, mock_context):
         """Test 404 when image doesn't exist."""
         event = {
@@ -76,7 +79,7 @@ class TestGetHandler:
         
         assert response['statusCode'] == 404
     
-    @patch('src.handlers.get_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_unauthorized_access(self, mock_service_class, mock_context):
         """Test 403 for unauthorized access."""
         event = {
@@ -103,7 +106,7 @@ class TestDownloadHandler:
         context.function_name = 'download-handler'
         return context
     
-    @patch('src.handlers.download_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_successful_download_url(self, mock_service_class, mock_context):
         """Test successful generation of download URL."""
         event = {
@@ -126,7 +129,7 @@ class TestDownloadHandler:
         body = json.loads(response['body'])
         assert 'presigned_url' in body['data']
     
-    @patch('src.handlers.download_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_redirect_mode(self, mock_service_class, mock_context):
         """Test redirect mode (302 response)."""
         event = {
@@ -148,7 +151,7 @@ class TestDownloadHandler:
         assert response['statusCode'] == 302
         assert 'Location' in response['headers']
     
-    @patch('src.handlers.download_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_custom_expiry(self, mock_service_class, mock_context):
         """Test custom expiry time."""
         event = {
@@ -178,7 +181,24 @@ class TestDownloadHandler:
 
         response = download_lambda_handler(event, mock_context)
 
-        assert response['statusCode'] == 422    @patch('src.handlers.download_handler.ImageService')
+        assert response['statusCode'] == 422
+    
+    @patch('src.services.image_service.ImageService')
+    def test_non_positive_expiry(self, mock_service_class, mock_context):
+        """Test error with a zero or negative expiry."""
+        for value in ('0', '-60'):
+            event = {
+                'pathParameters': {'image_id': '550e8400-e29b-41d4-a716-446655440000'},
+                'headers': {'user-id': 'test-user-123'},
+                'queryStringParameters': {'expiry': value}
+            }
+            
+            response = download_lambda_handler(event, mock_context)
+            
+            assert response['statusCode'] == 422
+        mock_service_class.return_value.generate_presigned_url.assert_not_called()
+    
+    @patch('src.services.image_service.ImageService')
     def test_image_not_found(self, mock_service_class, mock_context):
         """Test 404 when image doesn't exist."""
         event = {
@@ -206,7 +226,7 @@ class TestDeleteHandler:
         context.function_name = 'delete-handler'
         return context
     
-    @patch('src.handlers.delete_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_successful_soft_delete(self, mock_service_class, mock_context):
         """Test successful soft delete."""
         event = {
@@ -226,7 +246,7 @@ class TestDeleteHandler:
         call_kwargs = mock_service.delete_image.call_args[1]
         assert call_kwargs['soft_delete'] is True
     
-    @patch('src.handlers.delete_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_successful_hard_delete(self, mock_service_class, mock_context):
         """Test successful hard delete."""
         event = {
@@ -246,8 +266,6 @@ class TestDeleteHandler:
         call_kwargs = mock_service.delete_image.call_args[1]
         assert call_kwargs['soft_delete'] is False
     
-    def test_missing_image_id(self, mock_context):
-        """Test error when image_id is missing."""
     def test_missing_image_id(self, mock_context):
         """Test error when image_id is missing."""
         event = {
@@ -258,7 +276,11 @@ class TestDeleteHandler:
 
         response = delete_lambda_handler(event, mock_context)
 
-        assert response['statusCode'] == 422        """Test 404 when image doesn't exist."""
+        assert response['statusCode'] == 422
+    
+    @patch('src.services.image_service.ImageService')
+    def test_image_not_found(self, mock_service_class, mock_context):
+        """Test 404 when image doesn't exist."""
         event = {
             'pathParameters': {'image_id': '550e8400-e29b-41d4-a716-446655440000'},
             'headers': {'user-id': 'test-user-123'},
@@ -273,7 +295,7 @@ class TestDeleteHandler:
         
         assert response['statusCode'] == 404
     
-    @patch('src.handlers.delete_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_unauthorized_access(self, mock_service_class, mock_context):
         """Test 403 for unauthorized access."""
         event = {
@@ -0,0 +1,56 @@
+"""
+Unit tests for json_utils module.
+"""
+
+import pytest
+from decimal import Decimal
+from src.utils.json_utils import _default, dumps, dumps_bytes, loads
+
+
+class TestDefault:
+    """Tests for the _default encoder hook."""
+    
+    def test_integral_decimal(self):
+        value = _default(Decimal('1024'))
+        assert value == 1024
+        assert type(value) is int
+    
+    def test_integral_decimal_with_exponent(self):
+        value = _default(Decimal('1.0E+3'))
+        assert value == 1000
+        assert type(value) is int
+    
+    def test_fractional_decimal(self):
+        value = _default(Decimal('1.5'))
+        assert value == 1.5
+        assert type(value) is float
+    
+    def test_set(self):
+        assert sorted(_default({'b', 'a'})) == ['a', 'b']
+    
+    def test_frozenset(self):
+        assert _default(frozenset(['a'])) == ['a']
+    
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            _default(object())
+
+
+class TestDumps:
+    """Tests for dumps, dumps_bytes and loads."""
+    
+    def test_dynamodb_values(self):
+        data = {'size': Decimal('2048'), 'ratio': Decimal('0.5'), 'tags': {'cat'}}
+        assert dumps(data) == '{"size":2048,"ratio":0.5,"tags":["cat"]}'
+    
+    def test_dumps_bytes(self):
+        assert dumps_bytes({'name': 'café'}) == '{"name":"caf\\u00e9"}'.encode('utf-8')
+    
+    def test_round_trip(self):
+        data = {'image_id': 'abc', 'tags': ['a', 'b'], 'size': 1}
+        assert loads(dumps(data)) == data
+        assert loads(dumps_bytes(data)) == data
+    
+    def test_loads_invalid(self):
+        with pytest.raises(ValueError):
+            loads('{not json')
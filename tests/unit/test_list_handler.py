@@ -5,7 +5,8 @@ Unit tests for list_handler.
 import pytest
 import json
 from unittest.mock import Mock, patch
-from src.handlers.list_handler import lambda_handler, parse_query_parameters
+from src.handlers.list_handler import lambda_handler, parse_query_parameters, encode_pagination_token
+from src.models.image_metadata import ImageMetadata
 
 
 class TestParseQueryParameters:
@@ -27,6 +28,17 @@ class TestParseQueryParameters:
         assert params['limit'] == 10
         assert params['status'] == 'active'
     
+    def test_parse_user_id_header_any_case(self):
+        """Test that the user-id header is read regardless of its case."""
+        event = {
+            'headers': {'USER-ID': 'test-user-123'},
+            'queryStringParameters': {}
+        }
+        
+        params = parse_query_parameters(event)
+        
+        assert params['user_id'] == 'test-user-123'
+    
     def test_parse_tags(self):
         """Test parsing comma-separated tags."""
         event = {
@@ -81,6 +93,20 @@ class TestParseQueryParameters:
         
         assert params['limit'] == 100
     
+    def test_limit_floor(self):
+        """Test that zero and negative limits are raised to 1."""
+        for value in ('0', '-5'):
+            event = {
+                'headers': {'user-id': 'test-user'},
+                'queryStringParameters': {
+                    'limit': value
+                }
+            }
+            
+            params = parse_query_parameters(event)
+            
+            assert params['limit'] == 1
+    
     def test_default_values(self):
         """Test default values."""
         event = {
@@ -106,6 +132,33 @@ class TestParseQueryParameters:
         params = parse_query_parameters(event)
         
         assert params['limit'] == 50  # Falls back to default
+    
+    def test_pagination_token_round_trip(self):
+        """Test that an encoded pagination token parses back to the same key."""
+        last_key = {'image_id': 'img1', 'user_id': 'test-user', 'upload_timestamp': '2025-12-28T00:00:00Z'}
+        event = {
+            'headers': {'user-id': 'test-user'},
+            'queryStringParameters': {
+                'next_token': encode_pagination_token(last_key)
+            }
+        }
+        
+        params = parse_query_parameters(event)
+        
+        assert params['last_evaluated_key'] == last_key
+    
+    def test_invalid_pagination_token(self):
+        """Test that a malformed pagination token is ignored."""
+        event = {
+            'headers': {'user-id': 'test-user'},
+            'queryStringParameters': {
+                'next_token': 'not-a-token'
+            }
+        }
+        
+        params = parse_query_parameters(event)
+        
+        assert params['last_evaluated_key'] is None
 
 
 class TestListHandler:
@@ -119,7 +172,7 @@ class TestListHandler:
         context.request_id = 'test-request-id'
         return context
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_successful_list(self, mock_service_class, mock_context):
         """Test successful image listing."""
         event = {
@@ -129,33 +182,39 @@ class TestListHandler:
         
         # Setup mock
         mock_service = Mock()
-        mock_metadata1 = Mock()
-        mock_metadata1.image_id = 'img1'
-        mock_metadata1.user_id = 'test-user-123'
-        mock_metadata1.filename = 'test1.jpg'
-        mock_metadata1.content_type = 'image/jpeg'
-        mock_metadata1.size = 1024
-        mock_metadata1.upload_timestamp = '2025-12-28T00:00:00Z'
-        mock_metadata1.tags = []
-        mock_metadata1.description = None
-        mock_metadata1.width = None
-        mock_metadata1.height = None
-        mock_metadata1.status = 'active'
-        
-        mock_metadata2 = Mock()
-        mock_metadata2.image_id = 'img2'
-        mock_metadata2.user_id = 'test-user-123'
-        mock_metadata2.filename = 'test2.jpg'
-        mock_metadata2.content_type = 'image/jpeg'
-        mock_metadata2.size = 2048
-        mock_metadata2.upload_timestamp = '2025-12-28T00:00:01Z'
-        mock_metadata2.tags = []
-        mock_metadata2.description = None
-        mock_metadata2.width = None
-        mock_metadata2.height = None
-        mock_metadata2.status = 'active'
-        
-        mock_service.list_user_images.return_value = (
+        mock_metadata1 = ImageMetadata(
+            image_id='img1',
+            user_id='test-user-123',
+            filename='test1.jpg',
+            content_type='image/jpeg',
+            size=1024,
+            upload_timestamp='2025-12-28T00:00:00Z',
+            tags=[],
+            description=None,
+            width=None,
+            height=None,
+            status='active',
+            s3_key='images/test-user-123/img1.jpg',
+            s3_bucket='test-bucket'
+        )
+        
+        mock_metadata2 = ImageMetadata(
+            image_id='img2',
+            user_id='test-user-123',
+            filename='test2.jpg',
+            content_type='image/jpeg',
+            size=2048,
+            upload_timestamp='2025-12-28T00:00:01Z',
+            tags=[],
+            description=None,
+            width=None,
+            height=None,
+            status='active',
+            s3_key='images/test-user-123/img2.jpg',
+            s3_bucket='test-bucket'
+        )
+        
+        mock_service.search_images.return_value = (
             True,
             [mock_metadata1, mock_metadata2],
             None,
@@ -170,6 +229,8 @@ class TestListHandler:
         assert 'data' in body
         assert 'items' in body['data']
         assert len(body['data']['items']) == 2
+        assert body['data']['items'][0]['filename'] == 'test1.jpg'
+        assert 's3_key' not in body['data']['items'][0]
     
     def test_missing_user_id(self, mock_context):
         """Test error when user-id is missing."""
@@ -184,7 +245,7 @@ class TestListHandler:
         body = json.loads(response['body'])
         assert body['success'] is False
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_with_pagination(self, mock_service_class, mock_context):
         """Test listing with pagination."""
         event = {
@@ -195,21 +256,24 @@ class TestListHandler:
         }
         
         mock_service = Mock()
-        mock_metadata = Mock()
-        mock_metadata.image_id = 'img1'
-        mock_metadata.user_id = 'test-user-123'
-        mock_metadata.filename = 'test.jpg'
-        mock_metadata.content_type = 'image/jpeg'
-        mock_metadata.size = 1024
-        mock_metadata.upload_timestamp = '2025-12-28T00:00:00Z'
-        mock_metadata.tags = []
-        mock_metadata.description = None
-        mock_metadata.width = None
-        mock_metadata.height = None
-        mock_metadata.status = 'active'
+        mock_metadata = ImageMetadata(
+            image_id='img1',
+            user_id='test-user-123',
+            filename='test.jpg',
+            content_type='image/jpeg',
+            size=1024,
+            upload_timestamp='2025-12-28T00:00:00Z',
+            tags=[],
+            description=None,
+            width=None,
+            height=None,
+            status='active',
+            s3_key='images/test-user-123/img1.jpg',
+            s3_bucket='test-bucket'
+        )
         
         next_key = {'image_id': 'last-id'}
-        mock_service.list_user_images.return_value = (
+        mock_service.search_images.return_value = (
             True,
             [mock_metadata],
             next_key,
@@ -224,7 +288,7 @@ class TestListHandler:
         assert 'data' in body
         assert len(body['data']['items']) <= 2
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_with_tag_filter(self, mock_service_class, mock_context):
         """Test listing with tag filter."""
         event = {
@@ -246,7 +310,7 @@ class TestListHandler:
         call_kwargs = mock_service.search_images.call_args[1]
         assert 'tags' in call_kwargs
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_with_content_type_filter(self, mock_service_class, mock_context):
         """Test listing with content_type filter."""
         event = {
@@ -266,7 +330,7 @@ class TestListHandler:
         call_kwargs = mock_service.search_images.call_args[1]
         assert call_kwargs['content_type'] == 'image/png'
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_with_size_filters(self, mock_service_class, mock_context):
         """Test listing with size filters."""
         event = {
@@ -288,7 +352,7 @@ class TestListHandler:
         assert call_kwargs['min_size'] == 1024
         assert call_kwargs['max_size'] == 5242880
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_empty_result(self, mock_service_class, mock_context):
         """Test listing with no results."""
         event = {
@@ -297,7 +361,7 @@ class TestListHandler:
         }
         
         mock_service = Mock()
-        mock_service.list_user_images.return_value = (True, [], None, None)
+        mock_service.search_images.return_value = (True, [], None, None)
         mock_service_class.return_value = mock_service
         
         response = lambda_handler(event, mock_context)
@@ -306,7 +370,7 @@ class TestListHandler:
         body = json.loads(response['body'])
         assert body['data']['items'] == []
     
-    @patch('src.handlers.list_handler.ImageService')
+    @patch('src.services.image_service.ImageService')
     def test_service_error(self, mock_service_class, mock_context):
         """Test handling of service error."""
         event = {
@@ -315,7 +379,7 @@ class TestListHandler:
         }
         
         mock_service = Mock()
-        mock_service.list_user_images.return_value = (
+        mock_service.search_images.return_value = (
             False,
             [],
             None,
@@ -0,0 +1,51 @@
+"""
+Unit tests for request module.
+"""
+
+import base64
+import pytest
+from src.utils.request import get_headers, parse_json_body
+
+
+class TestGetHeaders:
+    """Tests for get_headers function."""
+    
+    def test_lower_cases_names(self):
+        event = {'headers': {'User-Id': 'user123', 'CONTENT-TYPE': 'application/json'}}
+        assert get_headers(event) == {'user-id': 'user123', 'content-type': 'application/json'}
+    
+    def test_keeps_values(self):
+        event = {'headers': {'X-Token': 'AbC'}}
+        assert get_headers(event)['x-token'] == 'AbC'
+    
+    def test_missing_headers(self):
+        assert get_headers({}) == {}
+        assert get_headers({'headers': None}) == {}
+
+
+class TestParseJsonBody:
+    """Tests for parse_json_body function."""
+    
+    def test_plain_json(self):
+        assert parse_json_body('{"status": "active"}') == {'status': 'active'}
+    
+    def test_base64_json(self):
+        body = base64.b64encode(b'{"status": "active"}').decode('ascii')
+        assert parse_json_body(body, is_base64=True) == {'status': 'active'}
+    
+    def test_plain_json_flagged_as_base64(self):
+        assert parse_json_body('{"status": "active"}', is_base64=True) == {'status': 'active'}
+        assert parse_json_body('  [1, 2]', is_base64=True) == [1, 2]
+    
+    def test_invalid_base64(self):
+        with pytest.raises(ValueError):
+            parse_json_body('abc', is_base64=True)
+    
+    def test_base64_of_invalid_json(self):
+        body = base64.b64encode(b'not json').decode('ascii')
+        with pytest.raises(ValueError):
+            parse_json_body(body, is_base64=True)
+    
+    def test_invalid_json(self):
+        with pytest.raises(ValueError):
+            parse_json_body('{not json')
@@ -6,8 +6,10 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from botocore.exceptions import ClientError
 from src.services.s3_service import S3Service
-from src.services.dynamodb_service import DynamoDBService
-from src.services.image_service import ImageService
+from src.services.dynamodb_service import (
+    DynamoDBService, CONDITIONAL_CHECK_FAILED, Increment, Append, _filter_template
+)
+from src.services.image_service import ImageService, PRESIGN_ATTRIBUTES
 from src.models.image_metadata import ImageMetadata
 
 
@@ -31,17 +33,17 @@ class TestS3Service:
         }
         return settings
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_initialization(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_initialization(self, mock_session_class, mock_settings):
         """Test S3Service initialization."""
         service = S3Service(mock_settings)
         
         assert service.bucket_name == 'test-bucket'
         assert service.key_prefix == 'images/'
-        mock_boto_client.assert_called_once()
+        mock_session_class.assert_called_once()
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_generate_s3_key(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_generate_s3_key(self, mock_session_class, mock_settings):
         """Test S3 key generation."""
         service = S3Service(mock_settings)
         
@@ -50,11 +52,11 @@ class TestS3Service:
         assert key.startswith('images/user123/')
         assert key.endswith('_photo.jpg')
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_upload_image_success(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_upload_image_success(self, mock_session_class, mock_settings):
         """Test successful image upload."""
         mock_s3 = Mock()
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -70,15 +72,15 @@ class TestS3Service:
         assert error is None
         mock_s3.put_object.assert_called_once()
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_upload_image_client_error(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_upload_image_client_error(self, mock_session_class, mock_settings):
         """Test upload with ClientError."""
         mock_s3 = Mock()
         mock_s3.put_object.side_effect = ClientError(
             {'Error': {'Code': 'NoSuchBucket', 'Message': 'Bucket not found'}},
             'PutObject'
         )
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -92,12 +94,12 @@ class TestS3Service:
         assert success is False
         assert error is not None
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_generate_presigned_upload_url(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_generate_presigned_upload_url(self, mock_session_class, mock_settings):
         """Test presigned upload URL generation."""
         mock_s3 = Mock()
         mock_s3.generate_presigned_url.return_value = 'https://s3.amazonaws.com/test-url'
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -112,12 +114,12 @@ class TestS3Service:
         assert s3_key is not None
         assert error is None
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_generate_presigned_download_url(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_generate_presigned_download_url(self, mock_session_class, mock_settings):
         """Test presigned download URL generation."""
         mock_s3 = Mock()
         mock_s3.generate_presigned_url.return_value = 'https://s3.amazonaws.com/download-url'
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -129,11 +131,74 @@ class TestS3Service:
         assert url == 'https://s3.amazonaws.com/download-url'
         assert error is None
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_delete_image_success(self, mock_boto_client, mock_settings):
+    def test_generate_presigned_download_url_signed_locally(self):
+        """Test download URLs are SigV4-signed without calling the client presigner."""
+        settings = Mock()
+        settings.get_s3_config.return_value = {
+            'bucket_name': 'test-bucket',
+            'key_prefix': '',
+            'presigned_url_expiry': 900,
+            'endpoint_url': 'http://localhost:4566',
+            'region_name': 'us-east-1',
+            'aws_access_key_id': 'test',
+            'aws_secret_access_key': 'test'
+        }
+        
+        service = S3Service(settings)
+        
+        with patch.object(service.s3_client, 'generate_presigned_url') as mock_presign:
+            success, url, error = service.generate_presigned_download_url(
+                s3_key='user123/20240101/abc_my photo.jpg'
+            )
+        
+        assert success is True
+        assert error is None
+        assert url.startswith('http://localhost:4566/test-bucket/user123/20240101/abc_my%20photo.jpg?')
+        assert 'X-Amz-Algorithm=AWS4-HMAC-SHA256' in url
+        assert 'X-Amz-Expires=900' in url
+        assert 'X-Amz-Credential=test%2F' in url
+        assert 'X-Amz-Signature=' in url
+        mock_presign.assert_not_called()
+    
+    def test_signed_download_url_dotted_bucket_path_style(self):
+        """Test that buckets with dots in their name are signed with path-style URLs."""
+        settings = Mock()
+        settings.get_s3_config.return_value = {
+            'bucket_name': 'images.example.com',
+            'key_prefix': '',
+            'presigned_url_expiry': 900,
+            'region_name': 'eu-west-1',
+            'aws_access_key_id': 'test',
+            'aws_secret_access_key': 'test'
+        }
+        
+        service = S3Service(settings)
+        success, url, error = service.generate_presigned_download_url(s3_key='user123/a.jpg')
+        
+        assert success is True
+        assert url.startswith('https://s3.eu-west-1.amazonaws.com/images.example.com/user123/a.jpg?')
+    
+    @patch('src.services.s3_service.boto3.Session')
+    def test_session_shared_without_credentials(self, mock_session_class):
+        """Test that services without explicit credentials share one session."""
+        settings = Mock()
+        settings.get_s3_config.return_value = {
+            'bucket_name': 'test-bucket',
+            'key_prefix': '',
+            'presigned_url_expiry': 900,
+            'region_name': 'us-east-1'
+        }
+        
+        S3Service(settings)
+        S3Service(settings)
+        
+        mock_session_class.assert_called_once_with()
+    
+    @patch('src.services.s3_service.boto3.Session')
+    def test_delete_image_success(self, mock_session_class, mock_settings):
         """Test successful image deletion."""
         mock_s3 = Mock()
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -143,8 +208,8 @@ class TestS3Service:
         assert error is None
         mock_s3.delete_object.assert_called_once()
     
-    @patch('src.services.s3_service.boto3.client')
-    def test_get_image_content_success(self, mock_boto_client, mock_settings):
+    @patch('src.services.s3_service.boto3.Session')
+    def test_get_image_content_success(self, mock_session_class, mock_settings):
         """Test successful image content retrieval."""
         mock_s3 = Mock()
         mock_response = {
@@ -152,7 +217,7 @@ class TestS3Service:
             'ContentType': 'image/jpeg'
         }
         mock_s3.get_object.return_value = mock_response
-        mock_boto_client.return_value = mock_s3
+        mock_session_class.return_value.client.return_value = mock_s3
         
         service = S3Service(mock_settings)
         
@@ -182,6 +247,7 @@ class TestDynamoDBService:
             'access_key': 'test',
             'secret_key': 'test'
         }
+        settings.METADATA_CACHE_ENABLED = False
         return settings
     
     @pytest.fixture
@@ -210,6 +276,30 @@ class TestDynamoDBService:
         assert service.user_index == 'UserIndex'
         mock_boto_resource.assert_called_once()
     
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_initialization_with_dax(self, mock_boto_resource, mock_settings):
+        """Test that a configured DAX endpoint replaces the DynamoDB resource."""
+        mock_settings.get_dynamodb_config.return_value = {
+            'table_name': 'test-images',
+            'dax_endpoint': 'daxs://cluster.example.com',
+            'region_name': 'us-east-1'
+        }
+        mock_dax = Mock()
+        
+        with patch.dict('sys.modules', {'amazondax': mock_dax}):
+            service = DynamoDBService(mock_settings)
+        
+        mock_dax.AmazonDaxClient.resource.assert_called_once_with(
+            endpoint_url='daxs://cluster.example.com', region_name='us-east-1'
+        )
+        assert service.dynamodb is mock_dax.AmazonDaxClient.resource.return_value
+        mock_boto_resource.assert_not_called()
+        
+        with patch.dict('sys.modules', {'amazondax': None}):
+            service = DynamoDBService(mock_settings)
+        
+        mock_boto_resource.assert_called_once_with('dynamodb', region_name='us-east-1')
+    
     @patch('src.services.dynamodb_service.boto3.resource')
     def test_save_metadata_success(self, mock_boto_resource, mock_settings, sample_metadata):
         """Test successful metadata save."""
@@ -226,6 +316,24 @@ class TestDynamoDBService:
         assert error is None
         mock_table.put_item.assert_called_once()
     
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_save_metadata_retry_skips_revalidation(self, mock_boto_resource, mock_settings, sample_metadata):
+        """Test that an unchanged instance is validated once across repeated saves."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.Table.return_value = Mock()
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        with patch('src.utils.validators.validate_user_id', return_value=(True, None)) as mock_validate:
+            service.save_metadata(sample_metadata)
+            service.save_metadata(sample_metadata)
+            assert mock_validate.call_count == 1
+            
+            sample_metadata.tags.append('edited')
+            service.save_metadata(sample_metadata)
+            assert mock_validate.call_count == 2
+    
     @patch('src.services.dynamodb_service.boto3.resource')
     def test_save_metadata_client_error(self, mock_boto_resource, mock_settings, sample_metadata):
         """Test save metadata with ClientError."""
@@ -276,6 +384,26 @@ class TestDynamoDBService:
         assert metadata.image_id == 'test-id'
         assert error is None
     
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_get_metadata_projection_includes_keys(self, mock_boto_resource, mock_settings):
+        """Test that a projected read always returns the attributes ImageMetadata needs."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.get_item.return_value = {
+            'Item': {'image_id': 'test-id', 'user_id': 'user123', 'status': 'active'}
+        }
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, metadata, error = service.get_metadata('test-id', attributes=['status'])
+        
+        assert success is True
+        assert metadata.status == 'active'
+        params = mock_table.get_item.call_args[1]
+        assert set(params['ExpressionAttributeNames'].values()) == {'status', 'image_id', 'user_id'}
+    
     @patch('src.services.dynamodb_service.boto3.resource')
     def test_get_metadata_not_found(self, mock_boto_resource, mock_settings):
         """Test metadata not found."""
@@ -293,6 +421,111 @@ class TestDynamoDBService:
         assert metadata is None
         assert error is None
     
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_read_during_write_not_cached_after_it(self, mock_boto_resource, mock_settings):
+        """Test that a read racing with a write does not leave the old item cached."""
+        mock_settings.METADATA_CACHE_ENABLED = True
+        mock_settings.METADATA_CACHE_SIZE = 16
+        mock_settings.METADATA_CACHE_TTL = 30
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.get_item.return_value = {'Item': {'image_id': 'img1', 'user_id': 'user123'}}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        mock_table.update_item.side_effect = lambda **kwargs: service.get_metadata('img1') and {}
+        
+        service.update_metadata('img1', {'status': 'deleted'})
+        service.get_metadata('img1')
+        
+        assert mock_table.get_item.call_count == 2
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_write_during_read_not_cached(self, mock_boto_resource, mock_settings):
+        """Test that an item fetched before an overlapping write is not cached."""
+        mock_settings.METADATA_CACHE_ENABLED = True
+        mock_settings.METADATA_CACHE_SIZE = 16
+        mock_settings.METADATA_CACHE_TTL = 30
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        item = {'image_id': 'img1', 'user_id': 'user123', 'status': 'active'}
+        
+        def get_item_then_write(**kwargs):
+            # The read has its item when the write lands, before it caches it
+            response = {'Item': dict(item)}
+            item['status'] = 'deleted'
+            service.update_metadata('img1', {'status': 'deleted'})
+            return response
+        
+        mock_table.get_item.side_effect = get_item_then_write
+        _, stale, _ = service.get_metadata('img1')
+        mock_table.get_item.side_effect = None
+        mock_table.get_item.return_value = {'Item': dict(item)}
+        _, fresh, _ = service.get_metadata('img1')
+        
+        assert stale.status == 'active'
+        assert fresh.status == 'deleted'
+        assert mock_table.get_item.call_count == 2
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_cached_metadata_not_shared(self, mock_boto_resource, mock_settings):
+        """Test that modifying returned metadata does not change the cached item."""
+        mock_settings.METADATA_CACHE_ENABLED = True
+        mock_settings.METADATA_CACHE_SIZE = 16
+        mock_settings.METADATA_CACHE_TTL = 30
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.get_item.return_value = {'Item': {'image_id': 'img1', 'user_id': 'user123', 'tags': ['a']}}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        _, first, _ = service.get_metadata('img1')
+        first.tags.append('b')
+        _, second, _ = service.get_metadata('img1')
+        second.tags.append('c')
+        _, third, _ = service.get_metadata('img1')
+        
+        assert third.tags == ['a']
+        assert mock_table.get_item.call_count == 1
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_get_metadata_cached_until_write(self, mock_boto_resource, mock_settings):
+        """Test repeated reads are served from the cache until the item is written."""
+        mock_settings.METADATA_CACHE_ENABLED = True
+        mock_settings.METADATA_CACHE_SIZE = 16
+        mock_settings.METADATA_CACHE_TTL = 60
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.get_item.return_value = {'Item': {'image_id': 'img1', 'user_id': 'user123'}}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        _, first, _ = service.get_metadata('img1')
+        _, second, _ = service.get_metadata('img1', attributes=['image_id', 'user_id'])
+        _, batch, _ = service.batch_get_metadata(['img1'])
+        
+        assert second == first
+        assert batch == [first]
+        assert mock_table.get_item.call_count == 1
+        mock_dynamodb.meta.client.batch_get_item.assert_not_called()
+        
+        service.get_metadata('img1', use_cache=False)
+        assert mock_table.get_item.call_count == 2
+        
+        service.update_metadata('img1', {'status': 'deleted'})
+        service.get_metadata('img1')
+        
+        assert mock_table.get_item.call_count == 3
+    
     @patch('src.services.dynamodb_service.boto3.resource')
     def test_delete_metadata_success(self, mock_boto_resource, mock_settings):
         """Test successful metadata deletion."""
@@ -309,6 +542,365 @@ class TestDynamoDBService:
         assert error is None
         mock_table.delete_item.assert_called_once()
     
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_save_metadata_uses_batch_writer(self, mock_boto_resource, mock_settings, sample_metadata):
+        """Test that batch saves go through a single batch writer."""
+        mock_dynamodb = Mock()
+        mock_table = MagicMock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        writer = mock_table.batch_writer.return_value.__enter__.return_value
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, error = service.batch_save_metadata([sample_metadata, sample_metadata])
+        
+        assert success is True
+        assert error is None
+        mock_table.batch_writer.assert_called_once_with(overwrite_by_pkeys=['image_id'])
+        assert writer.put_item.call_count == 2
+        mock_table.put_item.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_save_metadata_invalid_item(self, mock_boto_resource, mock_settings, sample_metadata):
+        """Test that nothing is written when an item fails validation."""
+        mock_dynamodb = Mock()
+        mock_table = MagicMock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        sample_metadata.user_id = ''
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, error = service.batch_save_metadata([sample_metadata])
+        
+        assert success is False
+        assert sample_metadata.image_id in error
+        mock_table.batch_writer.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_transact_save(self, mock_boto_resource, mock_settings, sample_metadata):
+        """Test that puts and updates are sent in one transaction."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, error = service.transact_save([sample_metadata], {'other-id': {'status': 'deleted'}})
+        
+        assert success is True
+        assert error is None
+        actions = mock_table.meta.client.transact_write_items.call_args[1]['TransactItems']
+        assert actions[0]['Put']['Item']['image_id'] == sample_metadata.image_id
+        assert actions[1]['Update']['Key'] == {'image_id': 'other-id'}
+        assert actions[1]['Update']['UpdateExpression'] == 'SET #attr0 = :val0'
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_transact_save_condition_failed(self, mock_boto_resource, mock_settings, sample_metadata):
+        """Test that a cancelled transaction reports the failed condition."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        mock_table.meta.client.transact_write_items.side_effect = ClientError(
+            {
+                'Error': {'Code': 'TransactionCanceledException', 'Message': 'Cancelled'},
+                'CancellationReasons': [{'Code': 'ConditionalCheckFailed'}]
+            },
+            'TransactWriteItems'
+        )
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, error = service.transact_save([sample_metadata])
+        
+        assert success is False
+        assert error == CONDITIONAL_CHECK_FAILED
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_delete_metadata(self, mock_boto_resource, mock_settings):
+        """Test batch deletion."""
+        mock_dynamodb = Mock()
+        mock_table = MagicMock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        writer = mock_table.batch_writer.return_value.__enter__.return_value
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, error = service.batch_delete_metadata(['id-1', 'id-2'])
+        
+        assert success is True
+        assert error is None
+        writer.delete_item.assert_any_call(Key={'image_id': 'id-2'})
+        assert writer.delete_item.call_count == 2
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_update_metadata_removes_none_fields(self, mock_boto_resource, mock_settings):
+        """Test that None values become a REMOVE clause and the item must exist."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, _, error = service.update_metadata('test-id', {'description': 'new', 'width': None})
+        
+        assert success is True
+        params = mock_table.update_item.call_args[1]
+        assert params['UpdateExpression'] == 'SET #attr0 = :val0 REMOVE #attr1'
+        assert params['ExpressionAttributeValues'] == {':val0': 'new'}
+        assert params['ConditionExpression'] is not None
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_update_metadata_increment_and_append(self, mock_boto_resource, mock_settings):
+        """Test that Increment and Append are written as atomic expressions."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, _, error = service.update_metadata(
+            'test-id', {'view_count': Increment(2), 'tags': Append(['new'])}
+        )
+        
+        assert success is True
+        params = mock_table.update_item.call_args[1]
+        assert params['UpdateExpression'] == (
+            'SET #attr0 = if_not_exists(#attr0, :val0_0) + :val0, '
+            '#attr1 = list_append(if_not_exists(#attr1, :val1_0), :val1)'
+        )
+        assert params['ExpressionAttributeValues'] == {
+            ':val0': 2, ':val0_0': 0, ':val1': ['new'], ':val1_0': []
+        }
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_update_metadata_nested_path(self, mock_boto_resource, mock_settings):
+        """Test that dotted keys update a field inside a map attribute."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, _, error = service.update_metadata(
+            'test-id', {'status': 'active', 'metadata.status_updated_at': '2024-01-01T00:00:00Z'}
+        )
+        
+        assert success is True
+        params = mock_table.update_item.call_args[1]
+        assert params['UpdateExpression'] == 'SET #attr0 = :val0, #attr1.#attr1_1 = :val1'
+        assert params['ExpressionAttributeNames'] == {
+            '#attr0': 'status', '#attr1': 'metadata', '#attr1_1': 'status_updated_at'
+        }
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_update_metadata_returns_previous_item(self, mock_boto_resource, mock_settings):
+        """Test that return_values hands back the item from the write."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.update_item.return_value = {
+            'Attributes': {'image_id': 'test-id', 'user_id': 'user123', 'status': 'processing'}
+        }
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, previous, error = service.update_metadata(
+            'test-id', {'status': 'active'}, return_values='ALL_OLD'
+        )
+        
+        assert success is True
+        assert error is None
+        assert previous.status == 'processing'
+        assert mock_table.update_item.call_args[1]['ReturnValues'] == 'ALL_OLD'
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_parallel_scan_reads_every_segment(self, mock_boto_resource, mock_settings):
+        """Test that each segment is scanned to exhaustion and all items are yielded."""
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        
+        def scan(**params):
+            segment = params['Segment']
+            if 'ExclusiveStartKey' not in params:
+                return {
+                    'Items': [{'image_id': f'img{segment}a', 'user_id': 'user123'}],
+                    'LastEvaluatedKey': {'image_id': f'img{segment}a'}
+                }
+            return {'Items': [{'image_id': f'img{segment}b', 'user_id': 'user123'}]}
+        
+        mock_client.scan.side_effect = scan
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        results = list(service.parallel_scan_with_filters({'status': 'active'}, total_segments=3))
+        
+        assert sorted(item.image_id for item in results) == [
+            'img0a', 'img0b', 'img1a', 'img1b', 'img2a', 'img2b'
+        ]
+        assert mock_client.scan.call_count == 6
+        assert {call[1]['TotalSegments'] for call in mock_client.scan.call_args_list} == {3}
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_parallel_scan_raises_segment_error(self, mock_boto_resource, mock_settings):
+        """Test that a failing segment surfaces its error to the caller."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.meta.client.scan.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Throttled'}}, 'Scan'
+        )
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        with pytest.raises(ClientError):
+            list(service.parallel_scan_with_filters(total_segments=2))
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_get_metadata_uses_resource(self, mock_boto_resource, mock_settings):
+        """Test that batch reads go through the service's existing resource."""
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        mock_client.batch_get_item.return_value = {
+            'Responses': {'test-images': [{'image_id': 'img1', 'user_id': 'user123'}]}
+        }
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, metadata_list, error = service.batch_get_metadata(['img1', 'img1'])
+        
+        assert success is True
+        assert [m.image_id for m in metadata_list] == ['img1']
+        mock_client.batch_get_item.assert_called_once_with(
+            RequestItems={'test-images': {'Keys': [{'image_id': 'img1'}]}}
+        )
+        mock_boto_resource.assert_called_once()
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_get_metadata_with_projection(self, mock_boto_resource, mock_settings):
+        """Test that requested attributes are projected, plus those needed to build items."""
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        mock_client.batch_get_item.return_value = {
+            'Responses': {'test-images': [{'image_id': 'img1', 'user_id': 'user123', 'size': 10}]}
+        }
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, metadata_list, error = service.batch_get_metadata(['img1'], attributes=['size'])
+        
+        assert success is True
+        assert metadata_list[0].size == 10
+        request = mock_client.batch_get_item.call_args[1]['RequestItems']['test-images']
+        assert request['ProjectionExpression'] == '#p0, #p1, #p2'
+        assert request['ExpressionAttributeNames'] == {'#p0': 'size', '#p1': 'image_id', '#p2': 'user_id'}
+    
+    @patch('src.services.dynamodb_service.time.sleep')
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_batch_get_metadata_chunks_and_retries(self, mock_boto_resource, mock_sleep, mock_settings):
+        """Test that large fetches are split and unprocessed keys retried."""
+        def batch_get_item(RequestItems):
+            keys = RequestItems['test-images']['Keys']
+            if len(keys) > 1:
+                # Leave the last key unprocessed on the first attempt
+                processed, unprocessed = keys[:-1], keys[-1:]
+                return {
+                    'Responses': {'test-images': [dict(k, user_id='user123') for k in processed]},
+                    'UnprocessedKeys': {'test-images': {'Keys': unprocessed}}
+                }
+            return {'Responses': {'test-images': [dict(keys[0], user_id='user123')]}}
+        
+        mock_dynamodb = Mock()
+        mock_dynamodb.meta.client.batch_get_item.side_effect = batch_get_item
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        image_ids = [f'img{i}' for i in range(250)]
+        
+        success, metadata_list, error = service.batch_get_metadata(image_ids)
+        
+        assert success is True
+        assert error is None
+        assert sorted(m.image_id for m in metadata_list) == sorted(image_ids)
+        # Three chunks, each needing one retry
+        assert mock_dynamodb.meta.client.batch_get_item.call_count == 6
+        assert mock_sleep.call_count == 3
+        
+        # The thread pool is kept for later batches
+        executor = service._executor
+        service.batch_get_metadata(image_ids)
+        assert service._executor is executor
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_scan_with_user_filter_queries_user_index(self, mock_boto_resource, mock_settings):
+        """Test that a user_id scan filter becomes a UserIndex query."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.return_value = {'Items': []}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, items, next_key, error = service.scan_with_filters(
+            {'user_id': 'user123', 'tags': ['beach']}, limit=10
+        )
+        
+        assert success is True
+        mock_table.scan.assert_not_called()
+        assert mock_table.query.call_args[1]['IndexName'] == service.user_index
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_scan_with_status_filter_queries_status_index(self, mock_boto_resource, mock_settings):
+        """Test that a status scan filter becomes a StatusIndex key condition."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.return_value = {'Items': []}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, items, next_key, error = service.scan_with_filters(
+            {'status': 'processing', 'content_type': 'image/png'}, limit=10
+        )
+        
+        assert success is True
+        mock_table.scan.assert_not_called()
+        params = mock_table.query.call_args[1]
+        assert params['IndexName'] == service.status_index
+        assert params['FilterExpression'] == '#content_type = :content_type'
+        assert ':status' not in params['ExpressionAttributeValues']
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_consistent_scan_reads_table(self, mock_boto_resource, mock_settings):
+        """Test that a consistent scan is not pushed down to an index, which cannot serve it."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.scan.return_value = {'Items': []}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, items, next_key, error = service.scan_with_filters(
+            {'user_id': 'user123', 'status': 'active'}, limit=10, consistent=True
+        )
+        
+        assert success is True
+        mock_table.query.assert_not_called()
+        assert mock_table.scan.call_args[1]['ConsistentRead'] is True
+    
     @patch('src.services.dynamodb_service.boto3.resource')
     def test_query_by_user(self, mock_boto_resource, mock_settings):
         """Test query by user_id."""
@@ -341,7 +933,181 @@ class TestDynamoDBService:
         assert len(items) == 1
         assert items[0].image_id == 'img1'
         assert error is None
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_count_by_user_sums_pages(self, mock_boto_resource, mock_settings):
+        """Test that counts are summed across pages without reading items."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.side_effect = [
+            {'Count': 3, 'LastEvaluatedKey': {'image_id': 'img3'}},
+            {'Count': 2}
+        ]
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        assert service.count_by_user('user123', status='active') == (True, 5, None)
+        params = mock_table.query.call_args[1]
+        assert params['Select'] == 'COUNT'
+        assert params['ExclusiveStartKey'] == {'image_id': 'img3'}
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_iter_query_with_filters(self, mock_boto_resource, mock_settings):
+        """Test that the filtered iterator follows pages with the filter applied."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.side_effect = [
+            {'Items': [{'image_id': 'img1', 'user_id': 'user123'}], 'LastEvaluatedKey': {'image_id': 'img1'}},
+            {'Items': []},
+        ]
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        results = list(service.iter_query_with_filters('user123', {'content_type': 'image/png'}))
+        
+        assert [item.image_id for item in results] == ['img1']
+        assert mock_table.query.call_count == 2
+        assert mock_table.query.call_args[1]['FilterExpression'] == '#content_type = :content_type'
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_query_by_user_non_positive_limit(self, mock_boto_resource, mock_settings):
+        """Test that a zero limit returns no items without querying."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, items, next_key, error = service.query_by_user('user123', limit=0)
+        
+        assert success is True
+        assert items == []
+        assert next_key is None
+        mock_table.query.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_query_by_user_follows_short_pages(self, mock_boto_resource, mock_settings):
+        """Test that filtered pages are followed until the limit is filled."""
+        def make_item(image_id):
+            return {
+                'image_id': image_id,
+                'user_id': 'user123',
+                'filename': 'test.jpg',
+                'content_type': 'image/jpeg',
+                'size': 1024,
+                's3_key': 'key',
+                's3_bucket': 'bucket',
+                'upload_timestamp': '2024-01-01T00:00:00Z',
+                'tags': [],
+                'status': 'active'
+            }
+        
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.side_effect = [
+            {'Items': [make_item('img1')], 'LastEvaluatedKey': {'image_id': 'img1'}},
+            {'Items': [make_item('img2')], 'LastEvaluatedKey': {'image_id': 'img2'}}
+        ]
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, items, next_key, error = service.query_by_user('user123', status='active', limit=2)
+        
+        assert success is True
+        assert [item.image_id for item in items] == ['img1', 'img2']
+        assert next_key == {'image_id': 'img2'}
+        assert mock_table.query.call_count == 2
+        second_call = mock_table.query.call_args_list[1][1]
+        assert second_call['Limit'] == 100
+        assert second_call['ExclusiveStartKey'] == {'image_id': 'img1'}
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_query_by_user_resumes_after_truncated_page(self, mock_boto_resource, mock_settings):
+        """Test that a page cut at the limit yields a key resuming after the last item."""
+        items = [
+            {'image_id': f'img{i}', 'user_id': 'user123', 'upload_timestamp': f'2024-01-0{i}T00:00:00Z'}
+            for i in range(1, 4)
+        ]
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.return_value = {'Items': items, 'LastEvaluatedKey': {'image_id': 'img3'}}
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        success, results, next_key, error = service.query_by_user(
+            'user123', status='active', limit=2, attributes=['image_id', 'filename']
+        )
+        
+        assert success is True
+        assert [item.image_id for item in results] == ['img1', 'img2']
+        assert next_key == {'image_id': 'img2', 'user_id': 'user123', 'upload_timestamp': '2024-01-02T00:00:00Z'}
+        params = mock_table.query.call_args[1]
+        assert params['Limit'] == 100
+        names = params['ExpressionAttributeNames']
+        assert {names[alias] for alias in params['ProjectionExpression'].split(', ')} == {
+            'image_id', 'filename', 'user_id', 'upload_timestamp'
+        }
+        assert params['FilterExpression'] == '#status = :status'
+        assert names['#status'] == 'status'
+        assert params['ExpressionAttributeValues'] == {':status': 'active'}
 
+    
+    def test_filter_params_builds_expression_string(self):
+        """Test that filters compile to one expression with attribute-named placeholders."""
+        params = DynamoDBService._filter_params({
+            'status': 'active',
+            'tags': ['beach', 'sunset'],
+            'min_size': 10,
+            'max_size': 20
+        })
+        
+        assert params['FilterExpression'] == (
+            '#status = :status AND (contains(#tags, :tag0) OR contains(#tags, :tag1))'
+            ' AND #size BETWEEN :min_size AND :max_size'
+        )
+        assert params['ExpressionAttributeNames'] == {'#status': 'status', '#tags': 'tags', '#size': 'size'}
+        assert params['ExpressionAttributeValues'] == {
+            ':status': 'active', ':tag0': 'beach', ':tag1': 'sunset', ':min_size': 10, ':max_size': 20
+        }
+        assert DynamoDBService._filter_params({'tags': []}) == {}
+        
+        # Same shape, new values: the expression is reused and only values change
+        hits = _filter_template.cache_info().hits
+        again = DynamoDBService._filter_params({'status': 'deleted', 'tags': ['a', 'b'], 'min_size': 1, 'max_size': 2})
+        assert _filter_template.cache_info().hits == hits + 1
+        assert again['FilterExpression'] == params['FilterExpression']
+        assert again['ExpressionAttributeValues'][':status'] == 'deleted'
+    
+    @patch('src.services.dynamodb_service.boto3.resource')
+    def test_iter_query_by_user_reads_pages_lazily(self, mock_boto_resource, mock_settings):
+        """Test that the iterator requests the next page only when it is needed."""
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_table.query.side_effect = [
+            {'Items': [{'image_id': 'img1', 'user_id': 'user123'}], 'LastEvaluatedKey': {'image_id': 'img1'}},
+            {'Items': [{'image_id': 'img2', 'user_id': 'user123'}]}
+        ]
+        mock_dynamodb.Table.return_value = mock_table
+        mock_boto_resource.return_value = mock_dynamodb
+        
+        service = DynamoDBService(mock_settings)
+        
+        results = service.iter_query_by_user('user123', page_size=1)
+        
+        assert next(results).image_id == 'img1'
+        assert mock_table.query.call_count == 1
+        assert [item.image_id for item in results] == ['img2']
+        assert mock_table.query.call_args[1]['ExclusiveStartKey'] == {'image_id': 'img1'}
+        assert mock_table.query.call_args[1]['Limit'] == 1
 
 class TestImageService:
     """Tests for ImageService."""
@@ -412,6 +1178,27 @@ class TestImageService:
         assert success is False
         assert 'Unauthorized' in error
     
+    @patch('src.services.image_service.DynamoDBService')
+    @patch('src.services.image_service.S3Service')
+    def test_update_image_metadata(self, mock_s3_class, mock_dynamodb_class, mock_settings):
+        """Test metadata update returns the updated item."""
+        mock_dynamodb = Mock()
+        mock_metadata = Mock()
+        mock_metadata.user_id = 'user123'
+        updated = Mock()
+        mock_dynamodb.get_metadata.return_value = (True, mock_metadata, None)
+        mock_dynamodb.update_metadata.return_value = (True, updated, None)
+        mock_dynamodb_class.return_value = mock_dynamodb
+        
+        service = ImageService(mock_settings)
+        
+        success, metadata, error = service.update_image_metadata('img-id', 'user123', {'description': 'new'})
+        
+        assert success is True
+        assert metadata is updated
+        assert error is None
+        assert mock_dynamodb.update_metadata.call_args[1]['return_values'] == 'ALL_NEW'
+    
     @patch('src.services.image_service.DynamoDBService')
     @patch('src.services.image_service.S3Service')
     def test_delete_image_soft(self, mock_s3_class, mock_dynamodb_class, mock_settings):
@@ -420,7 +1207,7 @@ class TestImageService:
         mock_metadata = Mock()
         mock_metadata.user_id = 'user123'
         mock_dynamodb.get_metadata.return_value = (True, mock_metadata, None)
-        mock_dynamodb.update_metadata.return_value = (True, None)  # Fixed: returns 2 values
+        mock_dynamodb.update_metadata.return_value = (True, None, None)
         mock_dynamodb_class.return_value = mock_dynamodb
         
         service = ImageService(mock_settings)
@@ -431,6 +1218,25 @@ class TestImageService:
         assert error is None
         mock_dynamodb.update_metadata.assert_called_once()
     
+    @patch('src.services.image_service.DynamoDBService')
+    @patch('src.services.image_service.S3Service')
+    def test_delete_image_soft_unauthorized(self, mock_s3_class, mock_dynamodb_class, mock_settings):
+        """Test soft delete reports unauthorized access when the ownership condition fails."""
+        mock_dynamodb = Mock()
+        mock_metadata = Mock()
+        mock_metadata.user_id = 'user123'
+        mock_dynamodb.update_metadata.return_value = (False, None, CONDITIONAL_CHECK_FAILED)
+        mock_dynamodb.get_metadata.return_value = (True, mock_metadata, None)
+        mock_dynamodb_class.return_value = mock_dynamodb
+        
+        service = ImageService(mock_settings)
+        
+        success, error = service.delete_image('img-id', 'different-user', soft_delete=True)
+        
+        assert success is False
+        assert error == 'Unauthorized access'
+        assert 'condition' in mock_dynamodb.update_metadata.call_args[1]
+    
     @patch('src.services.image_service.DynamoDBService')
     @patch('src.services.image_service.S3Service')
     def test_delete_image_hard(self, mock_s3_class, mock_dynamodb_class, mock_settings):
@@ -479,6 +1285,7 @@ class TestImageService:
         assert success is True
         assert url == 'https://s3.url'
         assert error is None
+        mock_dynamodb.get_metadata.assert_called_once_with('img-id', attributes=PRESIGN_ATTRIBUTES, use_cache=False)
     
     @patch('src.services.image_service.DynamoDBService')
     @patch('src.services.image_service.S3Service')
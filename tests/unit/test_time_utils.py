@@ -0,0 +1,42 @@
+"""
+Unit tests for time_utils module.
+"""
+
+from datetime import datetime, timezone
+from src.utils.time_utils import utc_now, utc_timestamp
+
+
+def parse(timestamp):
+    """Parse a timestamp produced by utc_timestamp."""
+    return datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
+
+
+class TestUtcNow:
+    """Tests for utc_now function."""
+    
+    def test_timezone_aware_utc(self):
+        now = utc_now()
+        assert now.tzinfo is timezone.utc
+        assert abs((datetime.now(timezone.utc) - now).total_seconds()) < 5
+
+
+class TestUtcTimestamp:
+    """Tests for utc_timestamp function."""
+    
+    def test_format(self):
+        timestamp = utc_timestamp()
+        assert timestamp.endswith('Z')
+        assert len(timestamp) == len('2024-01-01T12:00:00.000000Z')
+        assert abs((utc_now() - parse(timestamp)).total_seconds()) < 5
+    
+    def test_offset(self):
+        before = utc_now()
+        timestamp = parse(utc_timestamp(900))
+        after = utc_now()
+        
+        assert 900 <= (timestamp - before).total_seconds()
+        assert (timestamp - after).total_seconds() <= 900
+    
+    def test_negative_offset(self):
+        timestamp = parse(utc_timestamp(-60))
+        assert (utc_now() - timestamp).total_seconds() >= 60
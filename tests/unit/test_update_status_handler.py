@@ -0,0 +1,185 @@
+"""
+Unit tests for update_status_handler.
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, patch
+from src.handlers import common, update_status_handler
+from src.handlers.update_status_handler import lambda_handler
+from src.services.dynamodb_service import CONDITIONAL_CHECK_FAILED
+
+
+IMAGE_ID = '550e8400-e29b-41d4-a716-446655440000'
+
+
+def make_event(body, user_id='test-user-123'):
+    """Create a PATCH /images/{image_id} event."""
+    return {
+        'pathParameters': {'image_id': IMAGE_ID},
+        'headers': {'user-id': user_id},
+        'body': json.dumps(body)
+    }
+
+
+def make_metadata(user_id='test-user-123', status='processing'):
+    """Create stored metadata as returned by get_metadata."""
+    metadata = Mock()
+    metadata.user_id = user_id
+    metadata.status = status
+    metadata.s3_bucket = 'test-bucket'
+    metadata.s3_key = 'images/test-user-123/test.jpg'
+    return metadata
+
+
+class TestUpdateStatusHandler:
+    """Tests for update_status_handler lambda function."""
+    
+    @pytest.fixture
+    def mock_context(self):
+        """Create a mock Lambda context."""
+        context = Mock()
+        context.function_name = 'update-status-handler'
+        return context
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    def test_conditional_write(self, mock_dynamodb_class, mock_context):
+        """Test that a status change is one conditional write with no read."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.update_metadata.return_value = (True, None, None)
+        
+        response = lambda_handler(make_event({'status': 'error'}), mock_context)
+        
+        assert response['statusCode'] == 200
+        call_kwargs = mock_dynamodb.update_metadata.call_args[1]
+        assert call_kwargs['condition'] is not None
+        assert mock_dynamodb.update_metadata.call_args[0][1]['status'] == 'error'
+        mock_dynamodb.get_metadata.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    def test_rejected_write_other_owner(self, mock_dynamodb_class, mock_context):
+        """Test 404 when the write is rejected because another user owns the image."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.update_metadata.return_value = (False, None, CONDITIONAL_CHECK_FAILED)
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(user_id='someone-else'), None)
+        
+        response = lambda_handler(make_event({'status': 'error'}), mock_context)
+        
+        assert response['statusCode'] == 404
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    def test_rejected_write_deleted_image(self, mock_dynamodb_class, mock_context):
+        """Test 409 when the write is rejected because the image is deleted."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.update_metadata.return_value = (False, None, CONDITIONAL_CHECK_FAILED)
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(status='deleted'), None)
+        
+        response = lambda_handler(make_event({'status': 'error'}), mock_context)
+        
+        assert response['statusCode'] == 409
+        assert 'deleted' in json.loads(response['body'])['message']
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    def test_rejected_write_missing_image(self, mock_dynamodb_class, mock_context):
+        """Test 404 when the write is rejected because the image does not exist."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.update_metadata.return_value = (False, None, CONDITIONAL_CHECK_FAILED)
+        mock_dynamodb.get_metadata.return_value = (True, None, None)
+        
+        response = lambda_handler(make_event({'status': 'error'}), mock_context)
+        
+        assert response['statusCode'] == 404
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    @patch('src.services.s3_service.S3Service')
+    def test_activate_checks_s3_before_writing(self, mock_s3_class, mock_dynamodb_class, mock_context):
+        """Test that activation with a size writes after the S3 object is found."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(), None)
+        mock_dynamodb.update_metadata.return_value = (True, None, None)
+        mock_s3 = mock_s3_class.return_value
+        mock_s3.check_object_exists.return_value = (True, 1024, None)
+        
+        response = lambda_handler(make_event({'status': 'active', 'size': 1024}), mock_context)
+        
+        assert response['statusCode'] == 200
+        mock_s3.check_object_exists.assert_called_once_with('test-bucket', 'images/test-user-123/test.jpg')
+        assert mock_dynamodb.update_metadata.call_args[0][1]['size'] == 1024
+        assert mock_dynamodb.get_metadata.call_args[1]['attributes'] == update_status_handler.UPLOAD_CHECK_ATTRIBUTES
+        assert 'use_cache' not in mock_dynamodb.get_metadata.call_args[1]
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    @patch('src.services.s3_service.S3Service')
+    def test_activate_missing_object_writes_nothing(self, mock_s3_class, mock_dynamodb_class, mock_context):
+        """Test that an image is never marked active when its S3 object is missing."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(), None)
+        mock_s3_class.return_value.check_object_exists.return_value = (False, None, None)
+        
+        response = lambda_handler(make_event({'status': 'active', 'size': 1024}), mock_context)
+        
+        assert response['statusCode'] == 400
+        mock_dynamodb.update_metadata.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    @patch('src.services.s3_service.S3Service')
+    def test_activate_s3_error_is_server_error(self, mock_s3_class, mock_dynamodb_class, mock_context):
+        """Test that a failed S3 check (e.g. 403 or throttling) is a 500, not a missing file."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(), None)
+        mock_s3_class.return_value.check_object_exists.return_value = (False, None, 'AccessDenied')
+        
+        response = lambda_handler(make_event({'status': 'active', 'size': 1024}), mock_context)
+        
+        assert response['statusCode'] == 500
+        mock_dynamodb.update_metadata.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    @patch('src.services.s3_service.S3Service')
+    def test_activate_deleted_image(self, mock_s3_class, mock_dynamodb_class, mock_context):
+        """Test that activating a deleted image is rejected by the conditional write."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.get_metadata.side_effect = [
+            (True, make_metadata(), None),
+            (True, make_metadata(status='deleted'), None)
+        ]
+        mock_dynamodb.update_metadata.return_value = (False, None, CONDITIONAL_CHECK_FAILED)
+        mock_s3_class.return_value.check_object_exists.return_value = (True, 1024, None)
+        
+        response = lambda_handler(make_event({'status': 'active', 'size': 1024}), mock_context)
+        
+        assert response['statusCode'] == 409
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    @patch('src.services.s3_service.S3Service')
+    def test_activate_other_owner(self, mock_s3_class, mock_dynamodb_class, mock_context):
+        """Test that another user's image is neither checked in S3 nor written."""
+        mock_dynamodb = mock_dynamodb_class.return_value
+        mock_dynamodb.get_metadata.return_value = (True, make_metadata(user_id='someone-else'), None)
+        
+        response = lambda_handler(make_event({'status': 'active', 'size': 1024}), mock_context)
+        
+        assert response['statusCode'] == 404
+        mock_s3_class.return_value.check_object_exists.assert_not_called()
+        mock_dynamodb.update_metadata.assert_not_called()
+    
+    @patch('src.services.dynamodb_service.DynamoDBService')
+    def test_services_reused_across_invocations(self, mock_dynamodb_class, mock_context):
+        """Test that warm invocations reuse the service created by the first one."""
+        mock_dynamodb_class.return_value.update_metadata.return_value = (True, None, None)
+        
+        for _ in range(2):
+            response = lambda_handler(make_event({'status': 'error'}), mock_context)
+            assert response['statusCode'] == 200
+        
+        mock_dynamodb_class.assert_called_once()
+        assert common.get_dynamodb_service() is mock_dynamodb_class.return_value
+    
+    @patch('src.services.s3_service.S3Service')
+    def test_get_s3_service_creates_once(self, mock_s3_class):
+        """Test that the S3 service getter constructs the service only once."""
+        first = common.get_s3_service()
+        second = common.get_s3_service()
+        
+        assert first is second is mock_s3_class.return_value
+        mock_s3_class.assert_called_once()
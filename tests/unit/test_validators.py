@@ -365,6 +365,25 @@ class TestValidateImageId:
         assert is_valid is False
         assert 'invalid' in error.lower()
     
+    def test_non_hex_characters(self):
+        is_valid, error = validate_image_id('550e8400-e29b-41d4-a716-44665544000g')
+        assert is_valid is False
+        assert 'invalid' in error.lower()
+    
+    def test_extra_hyphen(self):
+        is_valid, error = validate_image_id('550e8400-e29b-41d4-a716-4466-5440000')
+        assert is_valid is False
+        assert 'invalid' in error.lower()
+    
+    def test_repeated_validation_uses_cache(self):
+        from src.utils.validators import _validate_image_id_format
+        
+        _validate_image_id_format.cache_clear()
+        validate_image_id('550e8400-e29b-41d4-a716-446655440000')
+        validate_image_id('550e8400-e29b-41d4-a716-446655440000')
+        
+        assert _validate_image_id_format.cache_info().hits == 1
+    
     def test_missing_hyphens(self):
         is_valid, error = validate_image_id('550e8400e29b41d4a716446655440000')
         assert is_valid is False